@@ -2,16 +2,45 @@ import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import numpy as np
 import os
+import queue
+import threading
 from views.main_view import MainView
 from views.config_view import ConfigView
 from views.test_view import TestView
 from views.visualization_view import VisualizationView
 from views.weights_view import WeightsView
 from models.adaline_model import AdalineModel
+from models.binary_dataset import PackedBinaryInputs, compact_inputs
+from models.case_registry import CaseRegistry
+from models.batch_test import load_test_file, batch_metrics
+from models.model_store import save_model, load_model, export_weights_text
+from models.model_cache import ModelCache, model_cache_key, clone_model
+from models.background_writer import BackgroundWriter
+from models.checkpoint import CheckpointWriter, load_checkpoint, DEFAULT_CHECKPOINT_INTERVAL
+from models.session_snapshot import save_session, load_session
+from utils.figure_pool import FigurePool
 
 COLOR_LIGHT_BG = "#f0f0f0"
 COLOR_TEXT_SECONDARY = "#555555"
 
+# Maximum number of pending messages between a live training run and the error graph
+LIVE_QUEUE_SIZE = 64
+
+# How often the UI checks whether a background training run has finished
+TRAINING_POLL_MS = 100
+
+# Folder under the results directory holding the trained-model cache
+MODEL_CACHE_DIR = "cache_modelos"
+
+# Folder under the results directory holding the checkpoints of unfinished training runs
+CHECKPOINT_DIR = "checkpoints"
+
+# Folder under the results directory holding the snapshot of the last session
+SESSION_DIR = "sesion"
+
+# How often the UI checks for failed background writes
+WRITE_ERROR_POLL_MS = 500
+
 class AdalineController:
     def __init__(self, root):
         # Create the main view
@@ -20,34 +49,19 @@ class AdalineController:
         # Create the config view
         self.config_view = ConfigView(self.main_view.config_frame)
         
-        # Create the visualization view
-        self.visualization_view = VisualizationView(
-            self.main_view.error_frame,
-            None,  # Pasamos None en lugar de desired_frame
-            self.main_view.obtained_frame
-        )
-        
-        # Create the test view
-        self.test_view = TestView(self.main_view.test_frame)
+        # Single owner of the matplotlib figures of every view
+        self.figure_pool = FigurePool()
         
-        # Create the weights view
-        self.weights_view = WeightsView(self.main_view.weights_frame)
-        
-        # Create models dictionary for multiple cases
-        self.models = {
-            "Caso 1 (entrada 2)": None,
-            "Caso 2 (entrada 3)": None,
-            "Caso 3 (entrada 4)": None,
-            "Caso 4 (entrada 5)": None
-        }
-        
-        # Dictionary to track which cases have data loaded
-        self.data_loaded = {
-            "Caso 1 (entrada 2)": False,
-            "Caso 2 (entrada 3)": False,
-            "Caso 3 (entrada 4)": False,
-            "Caso 4 (entrada 5)": False
-        }
+        # The views of the other tabs are built on their first visit, or earlier
+        # when training needs them (see ensure_*_view)
+        self.visualization_view = None
+        self.test_view = None
+        self.weights_view = None
+        notebook = self.main_view.notebook
+        notebook.defer(self.main_view.error_frame, lambda frame: self.ensure_visualization_view())
+        notebook.defer(self.main_view.obtained_frame, lambda frame: self.ensure_visualization_view())
+        notebook.defer(self.main_view.test_frame, lambda frame: self.ensure_test_view())
+        notebook.defer(self.main_view.weights_frame, lambda frame: self.ensure_weights_view())
         
         # Current active model
         self.current_model = None
@@ -62,20 +76,48 @@ class AdalineController:
         if not os.path.exists(self.results_dir):
             os.makedirs(self.results_dir)
         
+        # Guardar los archivos de ejemplo
+        self.save_provided_files()
+        
+        # Model files are written off the UI thread; failures are reported from report_write_errors
+        self.writer = BackgroundWriter()
+        self.main_view.root.after(WRITE_ERROR_POLL_MS, self.report_write_errors)
+        
+        # Trained models by dataset and hyperparameters, so unchanged runs are not repeated;
+        # the disk copies are written by the background writer
+        self.model_cache = ModelCache(os.path.join(self.results_dir, MODEL_CACHE_DIR), writer=self.writer)
+        
+        # Discover the available cases in the data directory
+        self.case_registry = CaseRegistry(self.data_dir, self.results_dir)
+        self.config_view.set_case_names(self.case_registry.names())
+        
+        # Create models dictionary for multiple cases
+        self.models = {case_name: None for case_name in self.case_registry.names()}
+        
+        # Dictionary to track which cases have data loaded
+        self.data_loaded = {case_name: False for case_name in self.case_registry.names()}
+        
         # Bind events
         self.bind_events()
         
         # Initialize case data
         self.initialize_case_data()
         
+        # Restore the data and models of the previous session, if any
+        self.session_case = None
+        restored_view = self.restore_session()
+        
         # Set initial case
         self.update_case()
         
-        # Deshabilitar el botón de entrenamiento hasta que se carguen datos
-        self.config_view.train_button.config(state=tk.DISABLED)
+        if restored_view is None:
+            # Deshabilitar el botón de entrenamiento hasta que se carguen datos
+            self.config_view.train_button.config(state=tk.DISABLED)
+        else:
+            self.show_restored_session(restored_view)
         
-        # Guardar los archivos de ejemplo
-        self.save_provided_files()
+        # Save the session when the window is closed
+        self.main_view.root.protocol("WM_DELETE_WINDOW", self.on_close)
         
     def bind_events(self):
         """Bind UI events to controller methods"""
@@ -85,27 +127,194 @@ class AdalineController:
         # Bind case selection
         self.config_view.case_combo.bind("<<ComboboxSelected>>", self.update_case)
         
+        # Bind load data button
+        self.config_view.load_data_button.config(command=self.load_training_data)
+        
+    def bind_test_events(self):
+        """Bind the events of the test tab once it has been built"""
         # Bind test button
         self.test_view.test_button.config(command=self.test_custom_input)
         
         # Bind test case selection
         self.test_view.test_case_combo.bind("<<ComboboxSelected>>", self.update_test_case)
         
-        # Bind load data button
-        self.config_view.load_data_button.config(command=self.load_training_data)
-        
         # Bind load test data button
         self.test_view.load_test_button.config(command=self.load_test_data)
         
+        # Bind batch test button
+        self.test_view.load_batch_button.config(command=self.test_batch_file)
+        
+        # Re-score the training set when the weights are edited in what-if mode
+        self.test_view.weights_changed_command = self.preview_edited_weights
+        
+    def ensure_visualization_view(self):
+        """Build the error and obtained outputs tabs if they have not been built yet"""
+        if self.visualization_view is None:
+            self.visualization_view = VisualizationView(
+                self.main_view.error_frame,
+                None,  # Pasamos None en lugar de desired_frame
+                self.main_view.obtained_frame,
+                self.figure_pool
+            )
+            
+            # Show the results of the restored session the first time the tab is built
+            if self.session_case is not None:
+                self.update_visualizations(self.session_case)
+        return self.visualization_view
+    
+    def ensure_test_view(self):
+        """Build the test tab if it has not been built yet"""
+        if self.test_view is None:
+            self.test_view = TestView(self.main_view.test_frame, self.figure_pool)
+            self.bind_test_events()
+            
+            # Offer the models trained before the tab was built (e.g. restored ones)
+            trained_cases = [k for k, v in self.models.items() if v is not None]
+            self.test_view.test_case_combo['values'] = trained_cases
+            if self.session_case in trained_cases:
+                self.test_view.test_case_combo.current(trained_cases.index(self.session_case))
+                self.update_test_case()
+        return self.test_view
+    
+    def ensure_weights_view(self):
+        """Build the weights tab if it has not been built yet"""
+        if self.weights_view is None:
+            self.weights_view = WeightsView(self.main_view.weights_frame, self.figure_pool)
+            
+            if self.session_case is not None:
+                self.weights_view.update_weights_visualization(self.models[self.session_case], self.session_case)
+        return self.weights_view
+    
+    def restore_session(self):
+        """Restore the data and models of the last session; returns its view state or None
+        
+        The arrays stay mapped from the snapshot file and are only read when used.
+        """
+        try:
+            snapshot = load_session(os.path.join(self.results_dir, SESSION_DIR))
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Error restoring the previous session: {str(e)}")
+            return None
+        if snapshot is None:
+            return None
+        
+        manifest, arrays = snapshot
+        for key, entry in enumerate(manifest["cases"]):
+            case_name = entry["name"]
+            if case_name not in self.case_registry:
+                continue
+            
+            # Data and models of a dataset that changed since the session was saved are dropped
+            if entry.get("fingerprint") != self.case_registry.get(case_name).fingerprint:
+                print(f"{case_name} changed since the last session, its data and model are not restored")
+                continue
+            
+            data = entry["data"]
+            if data is not None:
+                inputs = arrays[f"{key}/inputs"]
+                if data["packed"]:
+                    inputs = PackedBinaryInputs(inputs, data["n_features"])
+                self.case_data[case_name] = (inputs, arrays[f"{key}/outputs"])
+                self.data_loaded[case_name] = True
+            
+            saved_model = entry["model"]
+            if saved_model is not None:
+                model = AdalineModel(learning_rate=saved_model["learning_rate"],
+                                     target_error=saved_model["target_error"],
+                                     max_epochs=saved_model["max_epochs"])
+                model.weights = np.array(arrays[f"{key}/weights"])
+                model.bias = saved_model["bias"]
+                model.epochs_trained = saved_model["epochs"]
+                model.error_history = arrays[f"{key}/error_history"].tolist()
+                model.inputs, model.desired_outputs = self.case_data[case_name]
+                self.models[case_name] = model
+        
+        # Selected case and training parameters
+        view = manifest["view"]
+        if view["case"] in self.config_view.case_combo['values']:
+            self.config_view.case_var.set(view["case"])
+        self.config_view.lr_var.set(view["learning_rate"])
+        self.config_view.error_var.set(view["target_error"])
+        return view
+    
+    def show_restored_session(self, view):
+        """Show the results of the restored selected case; the tabs draw them when first built"""
+        case_name = self.config_view.case_var.get()
+        model = self.models.get(case_name)
+        if model is not None and self.case_data[case_name][0] is not None:
+            self.session_case = case_name
+            self.current_model = model
+            final_error = model.error_history[-1] if model.error_history else 1.0
+            self.config_view.update_results(model.epochs_trained, final_error, model.weights, model.bias,
+                                            final_error <= model.target_error, case_name)
+        
+        # Selecting a deferred tab builds it
+        tabs = self.main_view.notebook.tabs()
+        if 0 <= view["tab"] < len(tabs):
+            self.main_view.notebook.select(tabs[view["tab"]])
+    
+    def save_session(self):
+        """Snapshot the loaded data, trained models and view state for the next start"""
+        manifest = {
+            "view": {
+                "case": self.config_view.case_var.get(),
+                "learning_rate": self.config_view.lr_var.get(),
+                "target_error": self.config_view.error_var.get(),
+                "tab": self.main_view.notebook.index('current')
+            },
+            "cases": []
+        }
+        arrays = {}
+        
+        for case_name in self.case_registry.names():
+            inputs, outputs = self.case_data.get(case_name, (None, None))
+            model = self.models.get(case_name)
+            if inputs is None and model is None:
+                continue
+            
+            key = len(manifest["cases"])
+            entry = {"name": case_name, "fingerprint": self.case_registry.get(case_name).fingerprint,
+                     "data": None, "model": None}
+            
+            if inputs is not None:
+                if isinstance(inputs, PackedBinaryInputs):
+                    arrays[f"{key}/inputs"] = inputs.packed
+                    entry["data"] = {"packed": True, "n_features": inputs.n_features}
+                else:
+                    arrays[f"{key}/inputs"] = inputs
+                    entry["data"] = {"packed": False}
+                arrays[f"{key}/outputs"] = outputs
+            
+            # Models are only restored together with their training data
+            if model is not None and inputs is not None:
+                arrays[f"{key}/weights"] = np.asarray(model.weights, dtype=float)
+                arrays[f"{key}/error_history"] = np.asarray(model.error_history, dtype=float)
+                entry["model"] = {
+                    "bias": float(model.bias),
+                    "learning_rate": model.learning_rate,
+                    "target_error": model.target_error,
+                    "max_epochs": model.max_epochs,
+                    "epochs": model.epochs_trained
+                }
+            manifest["cases"].append(entry)
+        
+        save_session(os.path.join(self.results_dir, SESSION_DIR), manifest, arrays)
+    
+    def on_close(self):
+        """Finish the pending writes, save the session and close the window"""
+        self.writer.close()
+        self.show_write_errors(self.writer.take_errors())
+        
+        try:
+            self.save_session()
+        except Exception as e:
+            print(f"Error saving the session: {str(e)}")
+        self.main_view.root.destroy()
+    
     def initialize_case_data(self):
         """Initialize the data for each case"""
         # Initialize empty data structures
-        self.case_data = {
-            "Caso 1 (entrada 2)": (None, None),
-            "Caso 2 (entrada 3)": (None, None),
-            "Caso 3 (entrada 4)": (None, None),
-            "Caso 4 (entrada 5)": (None, None)
-        }
+        self.case_data = {case_name: (None, None) for case_name in self.case_registry.names()}
     
     def load_data_from_file(self, file_path):
         """Load training data from a text file"""
@@ -129,8 +338,8 @@ class AdalineController:
             # The last column is the desired output
             outputs = data[:, -1]
         
-            # All other columns are inputs
-            inputs = data[:, :-1]
+            # All other columns are inputs (0/1 inputs are kept bit-packed)
+            inputs = compact_inputs(data[:, :-1])
         
             return inputs, outputs
     
@@ -147,17 +356,13 @@ class AdalineController:
             return
         
         # Determine the file path based on the selected case
-        file_name = ""
-        if selected_case == "Caso 1 (entrada 2)":
-            file_name = "Caso1.txt"
-        elif selected_case == "Caso 2 (entrada 3)":
-            file_name = "Caso2.txt"
-        elif selected_case == "Caso 3 (entrada 4)":
-            file_name = "Caso3.txt"
-        elif selected_case == "Caso 4 (entrada 5)":
-            file_name = "Caso4.txt"
-        
-        file_path = os.path.join(self.data_dir, file_name)
+        case_info = self.case_registry.get(selected_case)
+        if case_info is None:
+            messagebox.showerror("Error", f"No se encontró el caso {selected_case}")
+            return
+        
+        file_name = case_info.file_name
+        file_path = case_info.data_path
         
         # Check if the file exists
         if not os.path.exists(file_path):
@@ -165,20 +370,17 @@ class AdalineController:
             return
         
         try:
+            # The case was registered (and named) with this number of inputs
+            expected_inputs = case_info.n_features
+            
+            # Re-read the case metadata in case the file was edited during the session,
+            # so the fingerprint saved with the model describes the data trained on
+            self.case_registry.refresh(selected_case)
+            
             # Load data from the file
             inputs, outputs = self.load_data_from_file(file_path)
             
             # Verify the number of inputs matches the case
-            expected_inputs = 0
-            if selected_case == "Caso 1 (entrada 2)":
-                expected_inputs = 2
-            elif selected_case == "Caso 2 (entrada 3)":
-                expected_inputs = 3
-            elif selected_case == "Caso 3 (entrada 4)":
-                expected_inputs = 4
-            elif selected_case == "Caso 4 (entrada 5)":
-                expected_inputs = 5
-            
             if inputs.shape[1] != expected_inputs:
                 messagebox.showerror("Error", 
                                 f"El archivo contiene {inputs.shape[1]} entradas, pero {selected_case} requiere {expected_inputs} entradas")
@@ -215,16 +417,17 @@ class AdalineController:
             return
         
         # Determine the file path based on the selected case
-        file_name = ""
-        if selected_case == "Caso 1 (entrada 2)":
-            file_name = "Pesos_Caso1.txt"
-        elif selected_case == "Caso 2 (entrada 3)":
-            file_name = "Pesos_Caso2.txt"
-        elif selected_case == "Caso 3 (entrada 4)":
-            file_name = "Pesos_Caso3.txt"
-        elif selected_case == "Caso 4 (entrada 5)":
-            file_name = "Pesos_Caso4.txt"
+        case_info = self.case_registry.get(selected_case)
+        if case_info is None:
+            messagebox.showerror("Error", f"No se encontró el caso {selected_case}")
+            return
         
+        # Wait for a pending save of the model files
+        self.writer.flush()
+        
+        # Prefer the binary model file; the text export is used when there is none
+        has_model_file = os.path.exists(os.path.join(self.results_dir, case_info.model_file))
+        file_name = case_info.model_file if has_model_file else case_info.weights_file
         file_path = os.path.join(self.results_dir, file_name)
         
         # Check if the file exists
@@ -233,23 +436,24 @@ class AdalineController:
             return
         
         try:
-            # Load data from the file
-            data = np.loadtxt(file_path)
-            
-            # The last value is bias, all others are weights
-            weights = data[:-1]
-            bias = data[-1]
+            if has_model_file:
+                # Load the model with its metadata
+                loaded_model, metadata = load_model(file_path)
+                weights = loaded_model.weights
+                bias = loaded_model.bias
+                
+                if metadata["fingerprint"] and metadata["fingerprint"] != case_info.fingerprint:
+                    print(f"Warning: {file_name} was trained on a different version of {case_info.file_name}")
+            else:
+                # Load data from the file
+                data = np.loadtxt(file_path)
+                
+                # The last value is bias, all others are weights
+                weights = data[:-1]
+                bias = data[-1]
             
             # Verify the number of weights matches the case
-            expected_weights = 0
-            if selected_case == "Caso 1 (entrada 2)":
-                expected_weights = 2
-            elif selected_case == "Caso 2 (entrada 3)":
-                expected_weights = 3
-            elif selected_case == "Caso 3 (entrada 4)":
-                expected_weights = 4
-            elif selected_case == "Caso 4 (entrada 5)":
-                expected_weights = 5
+            expected_weights = case_info.n_features
             
             if len(weights) != expected_weights:
                 messagebox.showerror("Error", 
@@ -312,16 +516,8 @@ class AdalineController:
             return
         
         # Update input fields based on the case
-        if selected_case == "Caso 1 (entrada 2)":
-            input_size = 2
-        elif selected_case == "Caso 2 (entrada 3)":
-            input_size = 3
-        elif selected_case == "Caso 3 (entrada 4)":
-            input_size = 4
-        elif selected_case == "Caso 4 (entrada 5)":
-            input_size = 5
-        else:
-            input_size = 2  # Default
+        case_info = self.case_registry.get(selected_case)
+        input_size = case_info.n_features if case_info else 2  # Default
             
         # Update input fields
         self.test_view.create_input_fields(input_size)
@@ -343,18 +539,15 @@ class AdalineController:
         # Clear previous test results
         self.test_view.test_result_label.config(text="Los resultados se mostrarán aquí")
         
-        # Clear previous visualization
-        for widget in self.test_view.process_visualization_frame.winfo_children():
-            widget.destroy()
-            
-        # Create a placeholder message for the visualization
-        placeholder = tk.Label(self.test_view.process_visualization_frame, 
-                            text=f"Modelo {selected_case} seleccionado. Ingrese valores y presione 'Probar' para ver resultados.", 
-                            bg=COLOR_LIGHT_BG, fg=COLOR_TEXT_SECONDARY, font=("Arial", 9))
-        placeholder.pack(expand=True, pady=15)
+        # Hide the previous visualization behind a placeholder message; the diagram is kept for reuse
+        self.test_view.show_visualization_placeholder(
+            f"Modelo {selected_case} seleccionado. Ingrese valores y presione 'Probar' para ver resultados.")
         
     def train_model(self):
         """Train the Adaline model with the current configuration"""
+        # New results replace the restored ones in the tabs not built yet
+        self.session_case = None
+        
         try:
             # Get learning rate and target error from the UI
             learning_rate = float(self.config_view.lr_var.get())
@@ -394,10 +587,156 @@ class AdalineController:
         
         # Configure the model
         model = AdalineModel(learning_rate=learning_rate, target_error=target_error)
+        if self.config_view.warm_start_var.get():
+            self.warm_start(model, case_name, inputs.shape[1])
+        
+        # Reuse the result of an identical earlier run
+        cache_key = model_cache_key(inputs, outputs, model)
+        cached_model = self.cached_model(cache_key, inputs, outputs)
+        if cached_model is not None:
+            self.finish_single_case_training(case_name, cached_model, cached_model.epochs_trained,
+                                             cached_model.error_history, target_error)
+            return
+        
+        # Train in the background and watch the error curve while it converges
+        if self.config_view.live_var.get():
+            self.train_single_case_live(case_name, model, inputs, outputs, target_error, cache_key)
+            return
         
         # Train the model
-        epochs, error_history = model.train(inputs, outputs)
+        epochs, error_history = self.train_with_checkpoints(case_name, model, inputs, outputs, cache_key)
+        
+        self.finish_single_case_training(case_name, model, epochs, error_history, target_error)
+    
+    def latest_weights(self, case_name, n_features):
+        """Latest weights and bias of a case, from memory or its saved files, or None"""
+        # The model in memory is the most recent one (trained, cached or loaded)
+        model = self.models.get(case_name)
+        if model is not None and model.weights is not None:
+            weights, bias = model.weights, model.bias
+        else:
+            case_info = self.case_registry.get(case_name)
+            if case_info is None:
+                return None
+            model_path = os.path.join(self.results_dir, case_info.model_file)
+            weights_path = os.path.join(self.results_dir, case_info.weights_file)
+            try:
+                if os.path.exists(model_path):
+                    saved_model, _ = load_model(model_path)
+                    weights, bias = saved_model.weights, saved_model.bias
+                elif os.path.exists(weights_path):
+                    data = np.loadtxt(weights_path, ndmin=1)
+                    weights, bias = data[:-1], data[-1]
+                else:
+                    return None
+            except (OSError, ValueError, KeyError) as e:
+                print(f"Error loading saved weights for {case_name}: {str(e)}")
+                return None
+        
+        if len(weights) != n_features:
+            return None
+        return weights, bias
+    
+    def warm_start(self, model, case_name, n_features):
+        """Seed a model with the latest weights of the case; training then continues from them"""
+        latest = self.latest_weights(case_name, n_features)
+        if latest is None:
+            print(f"No saved weights for {case_name}, training starts from random weights")
+            return False
+        
+        # Copies, since training updates the weights in place
+        weights, bias = latest
+        model.weights = np.array(weights, dtype=float)
+        model.bias = float(bias)
+        return True
+    
+    def train_with_checkpoints(self, case_name, model, inputs, outputs, cache_key, progress_queue=None):
+        """Train a model with periodic checkpoints, resuming an interrupted run with the same key
+        
+        Also called from the background thread of a live run, so it must not touch the UI.
+        """
+        checkpoint_path = os.path.join(self.results_dir, CHECKPOINT_DIR,
+                                       f"Checkpoint_Caso{self.case_registry.get(case_name).number}.npz")
+        os.makedirs(os.path.dirname(checkpoint_path), exist_ok=True)
+        
+        # Continue from the checkpoint of the same dataset, hyperparameters and initial weights
+        resume = False
+        if os.path.exists(checkpoint_path):
+            try:
+                state = load_checkpoint(checkpoint_path)
+                if state["run_key"] == cache_key:
+                    model.restore_checkpoint_state(state)
+                    resume = True
+                    print(f"Resuming {case_name} from epoch {state['epochs_trained']}")
+            except (OSError, ValueError, KeyError) as e:
+                print(f"Error reading checkpoint {checkpoint_path}: {str(e)}")
+        
+        writer = CheckpointWriter(checkpoint_path, DEFAULT_CHECKPOINT_INTERVAL, cache_key)
+        try:
+            result = model.train(inputs, outputs, progress_queue=progress_queue,
+                                 checkpoint=writer, resume=resume)
+        finally:
+            writer.close()
+        
+        # The finished run is kept by the model cache; its checkpoint is no longer needed
+        self.model_cache.put(cache_key, model)
+        if os.path.exists(checkpoint_path):
+            os.remove(checkpoint_path)
+        return result
+    
+    def cached_model(self, cache_key, inputs, outputs):
+        """Model cached under cache_key, attached to its training data, or None"""
+        model = self.model_cache.get(cache_key)
+        if model is not None:
+            # The weights view computes the updates from the training data
+            model.inputs = inputs
+            model.desired_outputs = outputs
+        return model
+    
+    def train_single_case_live(self, case_name, model, inputs, outputs, target_error, cache_key):
+        """Train a single case in a background thread while the error graph updates live"""
+        progress_queue = queue.Queue(maxsize=LIVE_QUEUE_SIZE)
+        result = {}
+        
+        def run_training():
+            try:
+                result['value'] = self.train_with_checkpoints(case_name, model, inputs, outputs,
+                                                              cache_key, progress_queue)
+            except Exception as e:
+                result['error'] = e
+        
+        thread = threading.Thread(target=run_training, daemon=True)
         
+        # Avoid starting a second run while this one is going
+        self.config_view.train_button.config(state=tk.DISABLED)
+        
+        # Show the error tab with the live curve
+        self.ensure_visualization_view()
+        self.main_view.notebook.select(self.main_view.error_frame)
+        self.visualization_view.start_live_error_graph(progress_queue, case_name)
+        
+        thread.start()
+        self.wait_for_training(thread, result, case_name, model, target_error)
+    
+    def wait_for_training(self, thread, result, case_name, model, target_error):
+        """Poll a background training run and finish it on the UI thread"""
+        if thread.is_alive():
+            self.main_view.root.after(TRAINING_POLL_MS, self.wait_for_training,
+                                      thread, result, case_name, model, target_error)
+            return
+        
+        self.visualization_view.stop_live_error_graph()
+        self.config_view.train_button.config(state=tk.NORMAL)
+        
+        if 'error' in result:
+            messagebox.showerror("Error", f"Error durante el entrenamiento: {str(result['error'])}")
+            return
+        
+        epochs, error_history = result['value']
+        self.finish_single_case_training(case_name, model, epochs, error_history, target_error)
+    
+    def finish_single_case_training(self, case_name, model, epochs, error_history, target_error):
+        """Store a trained model and update the views with its results"""
         # Get the final weights and bias
         weights = model.weights
         bias = model.bias
@@ -417,17 +756,19 @@ class AdalineController:
         self.update_visualizations(case_name)
         
         # Update the weights view
+        self.ensure_weights_view()
         self.weights_view.update_weights_visualization(model, case_name)
         
         # Update test view dropdown to include this case
         trained_cases = [k for k, v in self.models.items() if v is not None]
+        self.ensure_test_view()
         self.test_view.test_case_combo['values'] = trained_cases
         if case_name in trained_cases:
             self.test_view.test_case_combo.current(trained_cases.index(case_name))
             self.update_test_case()
         
-        # Save weights and bias to file
-        self.save_weights_to_file(case_name, weights, bias)
+        # Save the model and its weights export
+        self.save_model_files(case_name, model)
         
         # Show success message
         if success:
@@ -457,9 +798,17 @@ class AdalineController:
             
             # Configure the model
             model = AdalineModel(learning_rate=learning_rate, target_error=target_error)
+            if self.config_view.warm_start_var.get():
+                self.warm_start(model, case_name, inputs.shape[1])
             
-            # Train the model
-            epochs, error_history = model.train(inputs, outputs)
+            # Reuse the result of an identical earlier run, or train the model
+            cache_key = model_cache_key(inputs, outputs, model)
+            cached_model = self.cached_model(cache_key, inputs, outputs)
+            if cached_model is not None:
+                model = cached_model
+                epochs, error_history = model.epochs_trained, model.error_history
+            else:
+                epochs, error_history = self.train_with_checkpoints(case_name, model, inputs, outputs, cache_key)
             
             # Get the final error
             final_error = error_history[-1] if error_history else 1.0
@@ -478,8 +827,8 @@ class AdalineController:
             predictions = model.predict(inputs)
             cases_data_obtained[case_name] = (inputs, outputs, predictions)
             
-            # Save weights and bias to file
-            self.save_weights_to_file(case_name, model.weights, model.bias)
+            # Save the model and its weights export
+            self.save_model_files(case_name, model)
             
             # Update statistics
             total_epochs += epochs
@@ -500,15 +849,18 @@ class AdalineController:
         self.config_view.update_results(total_epochs, avg_error, weights_dict, None, all_success, "Todos los casos")
         
         # Update the visualization view for all cases
+        self.ensure_visualization_view()
         if error_histories:
             self.visualization_view.update_error_graphs_multiple(error_histories)
         if cases_data_obtained:
             self.visualization_view.update_obtained_visualizations_multiple(cases_data_obtained)
         
         # Update the weights view for all cases
+        self.ensure_weights_view()
         self.weights_view.update_weights_visualizations_multiple(self.models)
         
         # Update test view dropdown to include trained cases
+        self.ensure_test_view()
         self.test_view.test_case_combo['values'] = trained_cases
         if trained_cases:
             self.test_view.test_case_combo.current(0)
@@ -522,31 +874,35 @@ class AdalineController:
             messagebox.showwarning("Entrenamiento Incompleto", 
                                   f"El entrenamiento de algunos modelos no alcanzó el error objetivo de {target_error}. Error promedio: {avg_error:.8f}")
     
-    def save_weights_to_file(self, case_name, weights, bias):
-        """Save weights and bias to a file"""
-        # Determine file name based on case
-        file_name = ""
-        if case_name == "Caso 1 (entrada 2)":
-            file_name = "Pesos_Caso1.txt"
-        elif case_name == "Caso 2 (entrada 3)":
-            file_name = "Pesos_Caso2.txt"
-        elif case_name == "Caso 3 (entrada 4)":
-            file_name = "Pesos_Caso3.txt"
-        elif case_name == "Caso 4 (entrada 5)":
-            file_name = "Pesos_Caso4.txt"
+    def save_model_files(self, case_name, model):
+        """Queue the model (.npz) and its text weights export to be written in the background"""
+        case_info = self.case_registry.get(case_name)
         
-        file_path = os.path.join(self.results_dir, file_name)
+        model_path = os.path.join(self.results_dir, case_info.model_file)
+        weights_path = os.path.join(self.results_dir, case_info.weights_file)
         
-        try:
-            # Combine weights and bias into a single array
-            data = np.append(weights, bias)
-            
-            # Save to file
-            np.savetxt(file_path, data)
-            
-            print(f"Weights and bias saved to {file_path}")
-        except Exception as e:
-            print(f"Error saving weights to file: {str(e)}")
+        # A copy, so later changes to the model do not reach the pending write
+        saved_model = clone_model(model)
+        fingerprint = case_info.fingerprint
+        
+        def write():
+            # Both files are written to a temporary file and renamed into place
+            save_model(model_path, saved_model, fingerprint)
+            export_weights_text(weights_path, saved_model.weights, saved_model.bias)
+            print(f"Model saved to {model_path} and {weights_path}")
+        
+        # A newer save of the same case replaces one that has not been written yet
+        self.writer.submit(case_name, write)
+    
+    def report_write_errors(self):
+        """Show the background writes that failed since the last check, and check again later"""
+        self.show_write_errors(self.writer.take_errors())
+        self.main_view.root.after(WRITE_ERROR_POLL_MS, self.report_write_errors)
+    
+    def show_write_errors(self, errors):
+        if errors:
+            details = "\n".join(f"{case_name}: {str(e)}" for case_name, e in errors)
+            messagebox.showerror("Error", f"No se pudieron guardar los archivos del modelo:\n{details}")
             
     def update_visualizations(self, case_name):
         """Update all visualizations after training for a specific case"""
@@ -560,6 +916,7 @@ class AdalineController:
         predictions = model.predict(inputs)
         
         # Update error graph
+        self.ensure_visualization_view()
         self.visualization_view.update_error_graph(model.error_history, case_name)
         
         # Update obtained outputs visualization
@@ -615,6 +972,63 @@ class AdalineController:
         except Exception as e:
             messagebox.showerror("Error", f"Error durante la prueba: {str(e)}")
 
+    def preview_edited_weights(self):
+        """Score the training set of the test case with the weights typed in the test tab"""
+        selected_case = self.test_view.test_case_var.get()
+        inputs, outputs = self.case_data.get(selected_case, (None, None))
+        
+        if inputs is None:
+            self.test_view.show_whatif_result("Cargue los datos de entrenamiento del caso para ver la predicción en vivo")
+            return
+        
+        try:
+            weights, bias = self.test_view.get_weights_and_bias()
+        except ValueError:
+            # A value still being typed, e.g. "-" or "0."
+            return
+        
+        if len(weights) != inputs.shape[1]:
+            return
+        
+        # Vectorized prediction of the whole training set with the edited weights
+        model = AdalineModel()
+        model.weights = weights
+        model.bias = bias
+        predictions = model.predict(inputs)
+        mse = float(np.mean((outputs - predictions) ** 2))
+        
+        self.test_view.show_whatif_result(f"ECM con los pesos editados: {mse:.6f} ({len(outputs)} patrones)")
+        self.ensure_visualization_view()
+        self.visualization_view.update_obtained_visualization(inputs, outputs, predictions,
+                                                              f"{selected_case} (pesos editados)")
+    
+    def test_batch_file(self):
+        """Score every pattern of a test file with the model of the selected case"""
+        selected_case = self.test_view.test_case_var.get()
+        model = self.models.get(selected_case)
+        
+        if not selected_case or model is None or model.weights is None:
+            messagebox.showerror("Error", "Por favor seleccione un caso entrenado para la prueba por lotes")
+            return
+        
+        file_path = filedialog.askopenfilename(
+            title=f"Archivo de prueba para {selected_case}",
+            initialdir=self.data_dir,
+            filetypes=[("Datos de prueba", "*.txt *.csv *.npy"), ("Todos los archivos", "*.*")])
+        if not file_path:
+            return
+        
+        try:
+            inputs, desired_outputs = load_test_file(file_path, len(model.weights))
+            
+            # Single vectorized prediction for the whole file
+            predictions = model.predict(inputs)
+            
+            self.test_view.show_batch_results(inputs, desired_outputs, predictions,
+                                              batch_metrics(predictions, desired_outputs))
+        except Exception as e:
+            messagebox.showerror("Error", f"Error durante la prueba por lotes: {str(e)}")
+    
     def save_provided_files(self):
         """Save the provided files to the data directory"""
         try:
@@ -1,20 +1,44 @@
+import os
+import sys
+import time
+
+# Taken before the heavy imports so the startup report covers them
+STARTUP_START = time.perf_counter()
+
 import tkinter as tk
 from controller.adaline_controller import AdalineController
 from utils.ui_components import setup_styles
+from utils.startup_timer import StartupTimer
+
+def startup_report_requested():
+    """The startup report is printed with --startup-report or ADALINE_STARTUP_REPORT=1"""
+    return "--startup-report" in sys.argv or os.environ.get("ADALINE_STARTUP_REPORT") == "1"
 
 def main():
+    timer = StartupTimer(STARTUP_START)
+    timer.mark("imports")
+    
     # Create the root window
     root = tk.Tk()
     
     # Set up styles
     style = setup_styles()
+    timer.mark("window")
     
     # Create the controller
     controller = AdalineController(root)
+    timer.mark("controller")
+    
+    # The window is interactive once the first pending events have been drawn
+    if startup_report_requested():
+        def report_startup():
+            timer.mark("interactive")
+            print("Startup times:")
+            print(timer.report())
+        root.after_idle(report_startup)
     
     # Start the main loop
     root.mainloop()
 
 if __name__ == "__main__":
     main()
-
@@ -1,4 +1,13 @@
+import queue
 import numpy as np
+from models.binary_dataset import PackedBinaryInputs, is_binary, iter_input_blocks
+from models.adaline_snapshot import AdalineSnapshot
+
+# Largest number of binary inputs for which a lookup table is compiled (2**24 outputs)
+MAX_LOOKUP_INPUTS = 24
+
+# Epochs grouped into each message sent through a progress queue
+PROGRESS_BATCH_EPOCHS = 10
 
 class AdalineModel:
     def __init__(self, learning_rate=0.01, target_error=0.01, max_epochs=100000):
@@ -11,6 +20,9 @@ class AdalineModel:
         self.error_history = []
         self.inputs = None
         self.desired_outputs = None
+        self.lookup_table = None
+        self.lookup_weights = None
+        self.lookup_bias = None
         
     def initialize_weights(self, input_size):
         """Initialize weights and bias with small random values"""
@@ -21,63 +33,210 @@ class AdalineModel:
         """Linear activation function"""
         return x
     
-    def train(self, inputs, desired_outputs):
-        """Train the Adaline model"""
+    def train(self, inputs, desired_outputs, progress_queue=None, checkpoint=None, resume=False):
+        """Train the Adaline model, optionally streaming new errors through progress_queue
+
+        checkpoint is an object with an interval in epochs and a save(state) method,
+        such as models.checkpoint.CheckpointWriter. With resume=True the run
+        continues from the epoch and error history restored from a checkpoint.
+        """
         self.inputs = inputs
         self.desired_outputs = desired_outputs
         
-        # Initialize weights if not already done
-        if self.weights is None:
+        # Initialize weights if not already done; preset weights warm-start the run
+        if self.weights is None or len(self.weights) != inputs.shape[1]:
             self.initialize_weights(inputs.shape[1])
         
-        # Reset error history
-        self.error_history = []
-        self.epochs_trained = 0
+        # Reset error history, unless continuing a checkpointed run
+        if not resume:
+            self.error_history = []
+            self.epochs_trained = 0
+        
+        # Error values not yet sent through the progress queue; they are sent as lists
+        # of consecutive epochs and kept for the next batch while the queue is full
+        pending_errors = []
         
         # Training loop
-        current_error = float('inf')
+        current_error = self.error_history[-1] if self.error_history else float('inf')
         while current_error > self.target_error and self.epochs_trained < self.max_epochs:
             total_error = 0
             
-            # Process each training sample
-            for i in range(len(inputs)):
-                # Calculate net input
-                net_input = np.dot(inputs[i], self.weights) + self.bias
-                
-                # Apply activation function
-                output = self.activation(net_input)
-                
-                # Calculate error
-                error = desired_outputs[i] - output
-                
-                # Update weights and bias
-                self.weights += self.learning_rate * error * inputs[i]
-                self.bias += self.learning_rate * error
-                
-                # Add squared error to total error
-                total_error += error ** 2
+            # Process each training sample (bit-packed inputs are unpacked block by block)
+            for block_start, block in iter_input_blocks(inputs):
+                for i in range(len(block)):
+                    # Calculate net input
+                    net_input = np.dot(block[i], self.weights) + self.bias
+                    
+                    # Apply activation function
+                    output = self.activation(net_input)
+                    
+                    # Calculate error
+                    error = desired_outputs[block_start + i] - output
+                    
+                    # Update weights and bias
+                    self.weights += self.learning_rate * error * block[i]
+                    self.bias += self.learning_rate * error
+                    
+                    # Add squared error to total error
+                    total_error += error ** 2
                 
             # Calculate MSE for this epoch
             current_error = total_error / len(inputs)
             self.error_history.append(current_error)
             self.epochs_trained += 1
             
+            # Stream the new points to a live view without slowing training down
+            if progress_queue is not None:
+                pending_errors.append(current_error)
+                if len(pending_errors) >= PROGRESS_BATCH_EPOCHS:
+                    pending_errors = self.send_progress(progress_queue, pending_errors)
+            
+            # Save the state periodically so a long run can be resumed
+            if checkpoint is not None and self.epochs_trained % checkpoint.interval == 0:
+                checkpoint.save(self.checkpoint_state())
+            
             # Optional: Add a callback for UI updates if needed
             if self.epochs_trained % 1000 == 0:
                 print(f"Epoch {self.epochs_trained}, Error: {current_error}")
         
+        # Send the last points of the run
+        if progress_queue is not None and pending_errors:
+            self.send_progress(progress_queue, pending_errors)
+        
         return self.epochs_trained, self.error_history
     
+    def checkpoint_state(self):
+        """Copy of everything needed to continue training from the current epoch"""
+        return {
+            "weights": np.array(self.weights, dtype=float),
+            "bias": float(self.bias),
+            "epochs_trained": self.epochs_trained,
+            "error_history": list(self.error_history),
+            # Plain LMS keeps no optimizer state besides its hyperparameters
+            "learning_rate": self.learning_rate,
+            "target_error": self.target_error,
+            "max_epochs": self.max_epochs,
+            "rng_state": np.random.get_state()
+        }
+    
+    def restore_checkpoint_state(self, state):
+        """Restore a state returned by checkpoint_state, before train(..., resume=True)"""
+        self.weights = np.array(state["weights"], dtype=float)
+        self.bias = float(state["bias"])
+        self.epochs_trained = state["epochs_trained"]
+        self.error_history = list(state["error_history"])
+        np.random.set_state(state["rng_state"])
+    
+    def send_progress(self, progress_queue, pending_errors):
+        """Try to send pending error values; return the ones that could not be sent"""
+        try:
+            progress_queue.put_nowait(pending_errors)
+            return []
+        except queue.Full:
+            return pending_errors
+    
     def predict(self, inputs):
         """Make predictions with the trained model"""
         if self.weights is None:
             raise ValueError("Model has not been trained yet")
         
-        predictions = []
-        for input_vector in inputs:
-            net_input = np.dot(input_vector, self.weights) + self.bias
-            output = self.activation(net_input)
-            predictions.append(output)
-            
-        return np.array(predictions)
+        # Bit-packed inputs are scored one cache-sized block at a time
+        if isinstance(inputs, PackedBinaryInputs):
+            predictions = [self.predict(block) for _, block in inputs.iter_blocks()]
+            return np.concatenate(predictions) if predictions else np.empty(0)
+        
+        inputs = np.asarray(inputs)
+        
+        # Use the precomputed table when it is up to date and every row is a binary pattern
+        # of the right width; anything else goes through np.dot so shape errors are raised
+        if (self.has_valid_lookup_table() and inputs.ndim == 2
+                and inputs.shape[1] == len(self.lookup_weights) and is_binary(inputs)):
+            return self.predict_lookup(inputs)
+        
+        # Score every row with a single matrix-vector product
+        inputs = inputs.astype(float, copy=False)
+        net_input = np.dot(inputs, self.weights) + self.bias
+        return self.activation(net_input)
+    
+    def snapshot(self):
+        """Immutable inference-only copy of the current weights and bias"""
+        return AdalineSnapshot.from_model(self)
+    
+    def weight_updates(self, inputs=None, desired_outputs=None):
+        """Per-pattern weight and bias updates eta * e_p * x_p and eta * e_p, evaluated at the current weights
+
+        This approximates the last epoch: every error is taken from the final
+        weights in a single pass, whereas training applies the updates one
+        pattern at a time, each from the weights left by the previous one.
+        Returns the (patterns x weights) matrix and the bias update vector.
+        Defaults to the training data.
+        """
+        blocks = list(self.iter_weight_updates(inputs, desired_outputs))
+        n_weights = len(self.weights)
+        updates = np.concatenate(blocks) if blocks else np.empty((0, n_weights + 1))
+        return updates[:, :n_weights], updates[:, n_weights]
+
+    def iter_weight_updates(self, inputs=None, desired_outputs=None):
+        """Yield the updates of weight_updates() one input block at a time
+
+        Each block has the weight updates in its first columns and the bias
+        update in the last one. Bit-packed inputs are unpacked a block at a
+        time, so large datasets are never expanded to a dense matrix.
+        """
+        if self.weights is None:
+            raise ValueError("Model has not been trained yet")
+
+        inputs = self.inputs if inputs is None else inputs
+        desired_outputs = self.desired_outputs if desired_outputs is None else desired_outputs
+        if inputs is None or desired_outputs is None:
+            raise ValueError("No training data available for the weight updates")
+
+        desired_outputs = np.asarray(desired_outputs, dtype=float)
+        n_weights = len(self.weights)
+        for block_start, block in iter_input_blocks(inputs):
+            block = np.asarray(block)
+            errors = desired_outputs[block_start:block_start + len(block)] - self.predict(block)
+
+            # Row-wise outer product of the scaled errors with the inputs, written in place
+            updates = np.empty((len(block), n_weights + 1))
+            np.multiply(self.learning_rate, errors, out=updates[:, n_weights])
+            np.multiply(block, updates[:, n_weights:], out=updates[:, :n_weights])
+            yield updates
+
+    def compile_lookup_table(self):
+        """Precompute the output for every possible binary input pattern"""
+        if self.weights is None:
+            raise ValueError("Model has not been trained yet")
+        
+        n_inputs = len(self.weights)
+        if n_inputs > MAX_LOOKUP_INPUTS:
+            raise ValueError(f"Lookup tables are limited to {MAX_LOOKUP_INPUTS} inputs, the model has {n_inputs}")
+        
+        # Build the table one input at a time; the first input is the most significant bit,
+        # so the index of a pattern matches its row in the CasoN.txt files
+        table = np.array([self.bias], dtype=float)
+        for weight in self.weights:
+            table = (table[:, np.newaxis] + np.array([0.0, weight])).ravel()
+        
+        self.lookup_table = self.activation(table)
+        self.lookup_weights = np.array(self.weights, dtype=float)
+        self.lookup_bias = self.bias
+        return self.lookup_table
+    
+    def has_valid_lookup_table(self):
+        """Check that the compiled table matches the current weights and bias"""
+        return (self.lookup_table is not None
+                and self.weights is not None
+                and self.lookup_bias == self.bias
+                and np.array_equal(self.lookup_weights, self.weights))
+    
+    def predict_lookup(self, inputs):
+        """Predict binary input rows by packing each row into a table index"""
+        inputs = np.asarray(inputs)
+        n_inputs = len(self.lookup_weights)
+        if inputs.ndim != 2 or inputs.shape[1] != n_inputs:
+            raise ValueError(f"Lookup table expects rows of {n_inputs} inputs, got shape {inputs.shape}")
+        place_values = np.left_shift(1, np.arange(n_inputs - 1, -1, -1, dtype=np.int64))
+        indices = np.dot(inputs.astype(np.int64, copy=False), place_values)
+        return self.lookup_table[indices]
 
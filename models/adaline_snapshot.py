@@ -0,0 +1,115 @@
+import operator
+import numpy as np
+
+
+class AdalineSnapshot:
+    """Immutable inference-only copy of a trained Adaline: a weight vector and a bias
+
+    Unlike AdalineModel it keeps no training data, history or lookup table,
+    and uses __slots__, so thousands of snapshots stay small. The weights are
+    a contiguous read-only float64 array.
+    """
+
+    __slots__ = ('weights', 'bias')
+
+    def __init__(self, weights, bias):
+        weights = np.array(weights, dtype=np.float64, order='C')
+        if weights.ndim != 1:
+            raise ValueError("Weights must be a one-dimensional vector")
+        weights.setflags(write=False)
+        object.__setattr__(self, 'weights', weights)
+        object.__setattr__(self, 'bias', float(bias))
+
+    @classmethod
+    def from_model(cls, model):
+        if model.weights is None:
+            raise ValueError("Model has not been trained yet")
+        return cls(model.weights, model.bias)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("AdalineSnapshot is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("AdalineSnapshot is immutable")
+
+    def __reduce__(self):
+        return (AdalineSnapshot, (self.weights, self.bias))
+
+    def __repr__(self):
+        return f"AdalineSnapshot(n_features={len(self.weights)}, bias={self.bias!r})"
+
+    @property
+    def n_features(self):
+        return len(self.weights)
+
+    def predict(self, inputs):
+        """Outputs for one input vector or a (patterns x features) matrix"""
+        inputs = np.asarray(inputs, dtype=np.float64)
+        return np.dot(inputs, self.weights) + self.bias
+
+
+class SnapshotMatrix:
+    """Many snapshots with the same number of inputs packed into one weight matrix
+
+    Row i of weights (models x features) and bias[i] belong to snapshot i, so
+    scoring inputs against every model is a single matrix product.
+    """
+
+    __slots__ = ('weights', 'bias')
+
+    def __init__(self, snapshots):
+        snapshots = list(snapshots)
+        if not snapshots:
+            raise ValueError("At least one snapshot is required")
+
+        n_features = snapshots[0].n_features
+        if any(snapshot.n_features != n_features for snapshot in snapshots):
+            raise ValueError("All snapshots must have the same number of inputs")
+
+        weights = np.empty((len(snapshots), n_features), dtype=np.float64)
+        bias = np.empty(len(snapshots), dtype=np.float64)
+        for i, snapshot in enumerate(snapshots):
+            weights[i] = snapshot.weights
+            bias[i] = snapshot.bias
+        weights.setflags(write=False)
+        bias.setflags(write=False)
+        object.__setattr__(self, 'weights', weights)
+        object.__setattr__(self, 'bias', bias)
+
+    @classmethod
+    def from_arrays(cls, weights, bias):
+        """Matrix built from a (models x features) weight array and a bias vector"""
+        weights = np.array(weights, dtype=np.float64, order='C')
+        bias = np.array(bias, dtype=np.float64)
+        if weights.ndim != 2 or bias.shape != (len(weights),):
+            raise ValueError("Weights must be a (models x features) matrix with one bias per row")
+        if len(weights) == 0:
+            raise ValueError("At least one snapshot is required")
+
+        weights.setflags(write=False)
+        bias.setflags(write=False)
+        matrix = cls.__new__(cls)
+        object.__setattr__(matrix, 'weights', weights)
+        object.__setattr__(matrix, 'bias', bias)
+        return matrix
+
+    def __setattr__(self, name, value):
+        raise AttributeError("SnapshotMatrix is immutable")
+
+    def __len__(self):
+        return len(self.bias)
+
+    def __getitem__(self, index):
+        """Snapshot i for an integer index, a SnapshotMatrix of the selected models for a slice"""
+        if isinstance(index, slice):
+            return SnapshotMatrix.from_arrays(self.weights[index], self.bias[index])
+        try:
+            index = operator.index(index)
+        except TypeError:
+            raise TypeError(f"SnapshotMatrix indices must be integers or slices, not {type(index).__name__}") from None
+        return AdalineSnapshot(self.weights[index], self.bias[index])
+
+    def predict(self, inputs):
+        """Outputs of every model: shape (models,) for one input vector, (patterns x models) for a matrix"""
+        inputs = np.asarray(inputs, dtype=np.float64)
+        return np.dot(inputs, self.weights.T) + self.bias
@@ -0,0 +1,74 @@
+import queue
+import threading
+from collections import OrderedDict
+
+
+class BackgroundWriter:
+    """Run file writes on a background thread, keeping only the latest write per key
+
+    submit(key, write) queues a callable; if a write for the same key is still
+    waiting, it is replaced, so repeated saves of one case are coalesced. The
+    thread takes every pending write at once and runs them in submission
+    order. Failures are put on self.errors as (key, exception) pairs for the
+    UI to report.
+    """
+
+    def __init__(self):
+        self.pending = OrderedDict()
+        self.running = 0
+        self.closed = False
+        self.errors = queue.Queue()
+        self.condition = threading.Condition()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def submit(self, key, write):
+        """Queue write() to run in the background, replacing a pending write with the same key"""
+        with self.condition:
+            if self.closed:
+                raise ValueError("Writer is closed")
+            self.pending.pop(key, None)
+            self.pending[key] = write
+            self.condition.notify_all()
+
+    def run(self):
+        while True:
+            with self.condition:
+                while not self.pending and not self.closed:
+                    self.condition.wait()
+                if not self.pending:
+                    return
+                batch = list(self.pending.items())
+                self.pending.clear()
+                self.running = len(batch)
+
+            for key, write in batch:
+                try:
+                    write()
+                except Exception as e:
+                    self.errors.put((key, e))
+
+            with self.condition:
+                self.running = 0
+                self.condition.notify_all()
+
+    def flush(self, timeout=None):
+        """Wait until every queued write has run; returns False on timeout"""
+        with self.condition:
+            return self.condition.wait_for(lambda: not self.pending and not self.running, timeout)
+
+    def close(self, timeout=None):
+        """Run the queued writes and stop the thread"""
+        with self.condition:
+            self.closed = True
+            self.condition.notify_all()
+        self.thread.join(timeout)
+
+    def take_errors(self):
+        """Failures reported since the last call, as (key, exception) pairs"""
+        errors = []
+        while True:
+            try:
+                errors.append(self.errors.get_nowait())
+            except queue.Empty:
+                return errors
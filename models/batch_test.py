@@ -0,0 +1,46 @@
+import numpy as np
+from models.stream_predictor import read_input_chunks
+
+
+def load_test_file(file_path, n_features):
+    """Load a test file (.npy or CSV/whitespace text) as inputs and optional desired outputs
+
+    Rows with one column more than the model inputs carry the desired output
+    in the last column, as in the CasoN.txt files.
+    """
+    if file_path.endswith(".npy"):
+        data = np.load(file_path, mmap_mode='r')
+    else:
+        with open(file_path, 'r') as f:
+            chunks = list(read_input_chunks(f))
+        data = np.vstack(chunks) if chunks else np.empty((0, n_features))
+
+    if data.ndim != 2:
+        raise ValueError("Test file must contain a two-dimensional array")
+
+    if data.shape[1] == n_features + 1:
+        return data[:, :-1], np.asarray(data[:, -1], dtype=np.float64)
+    if data.shape[1] == n_features:
+        return data, None
+    raise ValueError(f"Test file has {data.shape[1]} columns, but the model requires {n_features} inputs")
+
+
+def batch_metrics(predictions, desired_outputs=None):
+    """Aggregate metrics of a batch of predictions, compared with the desired outputs if given"""
+    metrics = {
+        "patterns": len(predictions),
+        "mean_output": float(np.mean(predictions)) if len(predictions) else 0.0
+    }
+    if desired_outputs is None or len(predictions) == 0:
+        return metrics
+
+    errors = desired_outputs - predictions
+    abs_errors = np.abs(errors)
+    metrics.update({
+        "mse": float(np.mean(errors ** 2)),
+        "mae": float(np.mean(abs_errors)),
+        "max_error": float(np.max(abs_errors)),
+        # Fraction of patterns whose rounded output equals the desired one
+        "hits": float(np.mean(np.rint(predictions) == desired_outputs))
+    })
+    return metrics
@@ -0,0 +1,105 @@
+import numpy as np
+
+# Target size of an unpacked float64 block (fits comfortably in L2 cache)
+BLOCK_BYTES = 256 * 1024
+
+
+class PackedBinaryInputs:
+    """Binary input matrix stored with np.packbits (one bit per cell)
+
+    Rows are unpacked to float64 on demand, either one at a time, as slices,
+    or in cache-sized blocks through iter_blocks.
+    """
+
+    ndim = 2
+    dtype = np.dtype(np.float64)
+
+    def __init__(self, packed, n_features):
+        self.packed = packed
+        self.n_features = n_features
+
+    @property
+    def shape(self):
+        return (self.packed.shape[0], self.n_features)
+
+    @property
+    def nbytes(self):
+        return self.packed.nbytes
+
+    def __len__(self):
+        return self.packed.shape[0]
+
+    def unpack(self, packed_rows):
+        """Unpack a 2D block of packed rows into a float64 matrix"""
+        bits = np.unpackbits(packed_rows, axis=1, count=self.n_features)
+        return bits.astype(np.float64)
+
+    def __getitem__(self, key):
+        # Split row and column selectors, e.g. inputs[:4] or inputs[:, 0]
+        if isinstance(key, tuple):
+            rows, columns = key[0], key[1:]
+        else:
+            rows, columns = key, ()
+
+        if isinstance(rows, (int, np.integer)):
+            block = self.unpack(self.packed[rows][np.newaxis])[0]
+        else:
+            block = self.unpack(self.packed[rows])
+
+        if columns:
+            # Row dimension is gone for integer rows
+            index = columns if isinstance(rows, (int, np.integer)) else (slice(None),) + columns
+            return block[index]
+        return block
+
+    def __iter__(self):
+        for _, block in self.iter_blocks():
+            yield from block
+
+    def __array__(self, dtype=None, copy=None):
+        data = self.unpack(self.packed)
+        return data if dtype is None else data.astype(dtype)
+
+    def block_rows(self):
+        """Number of rows per unpacked block"""
+        return max(1, BLOCK_BYTES // (8 * max(1, self.n_features)))
+
+    def iter_blocks(self, block_rows=None):
+        """Yield (start_row, float64 block) pairs covering every row"""
+        block_rows = block_rows or self.block_rows()
+        for start in range(0, len(self), block_rows):
+            yield start, self.unpack(self.packed[start:start + block_rows])
+
+
+def is_binary(inputs):
+    """Check whether every value of an input matrix is 0 or 1"""
+    return bool(np.all((inputs == 0) | (inputs == 1)))
+
+
+def pack_binary_inputs(inputs):
+    """Pack a 0/1 input matrix into a PackedBinaryInputs object"""
+    inputs = np.asarray(inputs)
+    if inputs.ndim != 2:
+        raise ValueError("Inputs must be a two-dimensional array")
+    if not is_binary(inputs):
+        raise ValueError("Inputs must contain only 0 and 1 values")
+
+    packed = np.packbits(inputs.astype(np.uint8), axis=1)
+    return PackedBinaryInputs(packed, inputs.shape[1])
+
+
+def compact_inputs(inputs):
+    """Return a bit-packed copy of binary inputs, or the inputs unchanged otherwise"""
+    if isinstance(inputs, PackedBinaryInputs):
+        return inputs
+    if np.ndim(inputs) == 2 and is_binary(inputs):
+        return pack_binary_inputs(inputs)
+    return inputs
+
+
+def iter_input_blocks(inputs, block_rows=None):
+    """Yield (start_row, block) pairs for packed or plain input matrices"""
+    if isinstance(inputs, PackedBinaryInputs):
+        yield from inputs.iter_blocks(block_rows)
+    else:
+        yield 0, inputs
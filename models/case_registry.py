@@ -0,0 +1,184 @@
+import hashlib
+import json
+import os
+import re
+
+# Training files are named CasoN.txt
+CASE_FILE_PATTERN = re.compile(r'^Caso(\d+)\.txt$')
+
+# Metadata index kept next to the results so files are only sniffed when they change
+INDEX_FILE_NAME = "indice_casos.json"
+
+# Bytes read per step when fingerprinting a file
+READ_BLOCK_SIZE = 1024 * 1024
+
+
+class CaseInfo:
+    """Metadata of a training case discovered in the data directory"""
+
+    def __init__(self, number, file_name, data_path, weights_file, n_features, n_rows, fingerprint, mtime, size):
+        self.number = number
+        self.file_name = file_name
+        self.data_path = data_path
+        self.weights_file = weights_file
+        self.model_file = f"Modelo_Caso{number}.npz"
+        self.n_features = n_features
+        self.n_rows = n_rows
+        self.fingerprint = fingerprint
+        self.mtime = mtime
+        self.size = size
+
+        # Display name used in the UI, e.g. 'Caso 1 (entrada 2)'
+        self.name = f"Caso {number} (entrada {n_features})"
+
+    def to_dict(self):
+        return {
+            "number": self.number,
+            "file_name": self.file_name,
+            "n_features": self.n_features,
+            "n_rows": self.n_rows,
+            "fingerprint": self.fingerprint,
+            "mtime": self.mtime,
+            "size": self.size
+        }
+
+
+def sniff_case_file(file_path):
+    """Read a case file once to get its feature count, row count and SHA-1 fingerprint"""
+    digest = hashlib.sha1()
+    n_lines = 0
+    last_byte = b''
+
+    with open(file_path, 'rb') as f:
+        block = f.read(READ_BLOCK_SIZE)
+
+        # Keep the beginning of the file to inspect the header and first row
+        head = block
+        while block:
+            digest.update(block)
+            n_lines += block.count(b'\n')
+            last_byte = block[-1:]
+            block = f.read(READ_BLOCK_SIZE)
+
+    # Count a last line without trailing newline
+    if last_byte and last_byte != b'\n':
+        n_lines += 1
+
+    lines = [line.strip() for line in head.decode('utf-8', errors='replace').splitlines()[:3]]
+    lines = [line for line in lines if line]
+    if not lines:
+        return 0, 0, digest.hexdigest()
+
+    # A header (first line containing text) is not a data row
+    has_header = any(c.isalpha() for c in lines[0])
+    n_rows = n_lines - 1 if has_header else n_lines
+    sample = lines[1] if has_header and len(lines) > 1 else lines[0]
+
+    # The last column is the desired output
+    columns = sample.split(',') if ',' in sample else sample.split()
+    n_features = len(columns) - 1
+
+    return n_features, n_rows, digest.hexdigest()
+
+
+class CaseRegistry:
+    """Index of the training cases available in the data directory
+
+    Each file is sniffed once; the metadata is cached in memory and in an index
+    file under the results directory, keyed by modification time and size.
+    """
+
+    def __init__(self, data_dir, results_dir):
+        self.data_dir = data_dir
+        self.results_dir = results_dir
+        self.index_path = os.path.join(results_dir, INDEX_FILE_NAME)
+        self.cases = {}
+        self.saved_index = None
+        self.discover()
+
+    def load_index(self):
+        """Load the persisted metadata index, keyed by file name"""
+        try:
+            with open(self.index_path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def save_index(self):
+        """Persist the metadata index"""
+        index = {case.file_name: case.to_dict() for case in self.cases.values()}
+        if index == self.saved_index:
+            return
+        try:
+            temp_path = self.index_path + ".tmp"
+            with open(temp_path, 'w') as f:
+                json.dump(index, f, indent=1)
+            os.replace(temp_path, self.index_path)
+            self.saved_index = index
+        except OSError as e:
+            print(f"Error saving case index: {str(e)}")
+
+    def build_case(self, number, file_name, cached=None):
+        """Create the CaseInfo for a file, reusing cached metadata if the file is unchanged"""
+        data_path = os.path.join(self.data_dir, file_name)
+        stat = os.stat(data_path)
+
+        if cached and cached.get("mtime") == stat.st_mtime and cached.get("size") == stat.st_size:
+            n_features, n_rows, fingerprint = cached["n_features"], cached["n_rows"], cached["fingerprint"]
+        else:
+            n_features, n_rows, fingerprint = sniff_case_file(data_path)
+
+        return CaseInfo(number, file_name, data_path, f"Pesos_{file_name}",
+                        n_features, n_rows, fingerprint, stat.st_mtime, stat.st_size)
+
+    def discover(self):
+        """Scan the data directory and index every CasoN.txt file"""
+        index = self.load_index()
+        self.saved_index = index
+        cases = []
+
+        for file_name in os.listdir(self.data_dir) if os.path.isdir(self.data_dir) else []:
+            match = CASE_FILE_PATTERN.match(file_name)
+            if not match:
+                continue
+            try:
+                cases.append(self.build_case(int(match.group(1)), file_name, index.get(file_name)))
+            except OSError as e:
+                print(f"Error indexing case file {file_name}: {str(e)}")
+
+        # Order the cases by their number, not alphabetically
+        cases.sort(key=lambda case: case.number)
+        self.cases = {case.name: case for case in cases}
+
+        self.save_index()
+        return self.names()
+
+    def refresh(self, case_name):
+        """Re-read the metadata of one case if its file changed on disk"""
+        case = self.cases.get(case_name)
+        if case is None:
+            return None
+
+        updated = self.build_case(case.number, case.file_name, case.to_dict())
+        if updated.mtime != case.mtime or updated.size != case.size:
+            # Keep the registered name so the controller dictionaries stay valid
+            updated.name = case.name
+            self.cases[case_name] = updated
+            self.save_index()
+        return self.cases[case_name]
+
+    def names(self):
+        """Case names in display order"""
+        return list(self.cases.keys())
+
+    def get(self, case_name):
+        return self.cases.get(case_name)
+
+    def __contains__(self, case_name):
+        return case_name in self.cases
+
+    def __iter__(self):
+        return iter(self.cases.values())
+
+    def __len__(self):
+        return len(self.cases)
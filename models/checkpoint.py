@@ -0,0 +1,141 @@
+import io
+import threading
+import numpy as np
+from models.adaline_model import AdalineModel
+from models.model_store import atomic_write
+
+# Version of the checkpoint .npz layout
+CHECKPOINT_FORMAT_VERSION = 1
+
+# Epochs between two checkpoints of a training run
+DEFAULT_CHECKPOINT_INTERVAL = 1000
+
+
+def save_checkpoint(file_path, state):
+    """Write a training state (see AdalineModel.checkpoint_state) atomically as .npz"""
+    algorithm, keys, position, has_gauss, cached_gaussian = state["rng_state"]
+    arrays = {
+        "format_version": np.int64(CHECKPOINT_FORMAT_VERSION),
+        "weights": np.asarray(state["weights"], dtype=np.float64),
+        "bias": np.float64(state["bias"]),
+        "epochs_trained": np.int64(state["epochs_trained"]),
+        "error_history": np.asarray(state["error_history"], dtype=np.float64),
+        "learning_rate": np.float64(state["learning_rate"]),
+        "target_error": np.float64(state["target_error"]),
+        "max_epochs": np.int64(state["max_epochs"]),
+        "rng_algorithm": np.str_(algorithm),
+        "rng_keys": np.asarray(keys, dtype=np.uint32),
+        "rng_position": np.int64(position),
+        "rng_has_gauss": np.int64(has_gauss),
+        "rng_cached_gaussian": np.float64(cached_gaussian),
+        "run_key": np.str_(state.get("run_key", ""))
+    }
+    atomic_write(file_path, lambda f: np.savez(f, **arrays))
+
+
+def load_checkpoint(file_path):
+    """Read a checkpoint written by save_checkpoint as a training state"""
+    with open(file_path, 'rb') as f:
+        data = f.read()
+
+    with np.load(io.BytesIO(data)) as archive:
+        version = int(archive["format_version"])
+        if version > CHECKPOINT_FORMAT_VERSION:
+            raise ValueError(f"Checkpoint format {version} is newer than the supported format {CHECKPOINT_FORMAT_VERSION}")
+
+        return {
+            "weights": archive["weights"],
+            "bias": float(archive["bias"]),
+            "epochs_trained": int(archive["epochs_trained"]),
+            "error_history": archive["error_history"].tolist(),
+            "learning_rate": float(archive["learning_rate"]),
+            "target_error": float(archive["target_error"]),
+            "max_epochs": int(archive["max_epochs"]),
+            "rng_state": (str(archive["rng_algorithm"]), archive["rng_keys"], int(archive["rng_position"]),
+                          int(archive["rng_has_gauss"]), float(archive["rng_cached_gaussian"])),
+            "run_key": str(archive["run_key"])
+        }
+
+
+class CheckpointWriter:
+    """Write the checkpoints of a training run from a background thread
+
+    save() only hands the state over; if the previous checkpoint is still
+    being written, the pending one is replaced by the newest state. Errors
+    are kept in self.error and do not stop training.
+    """
+
+    def __init__(self, file_path, interval=DEFAULT_CHECKPOINT_INTERVAL, run_key=""):
+        self.file_path = file_path
+        self.interval = interval
+        self.run_key = run_key
+        self.pending = None
+        self.writing = False
+        self.closed = False
+        self.error = None
+        self.condition = threading.Condition()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def save(self, state):
+        """Queue a training state to be written, replacing any state not written yet"""
+        state["run_key"] = self.run_key
+        with self.condition:
+            self.pending = state
+            self.condition.notify_all()
+
+    def run(self):
+        while True:
+            with self.condition:
+                while self.pending is None and not self.closed:
+                    self.condition.wait()
+                if self.pending is None:
+                    return
+                state, self.pending = self.pending, None
+                self.writing = True
+
+            try:
+                save_checkpoint(self.file_path, state)
+            except Exception as e:
+                self.error = e
+                print(f"Error writing checkpoint {self.file_path}: {str(e)}")
+
+            with self.condition:
+                self.writing = False
+                self.condition.notify_all()
+
+    def flush(self):
+        """Wait until every queued state has been written"""
+        with self.condition:
+            while self.pending is not None or self.writing:
+                self.condition.wait()
+
+    def close(self):
+        """Write the last queued state and stop the thread"""
+        with self.condition:
+            self.closed = True
+            self.condition.notify_all()
+        self.thread.join()
+
+
+def resume(checkpoint_path, inputs, desired_outputs, progress_queue=None,
+           checkpoint_interval=DEFAULT_CHECKPOINT_INTERVAL):
+    """Continue a training run from its latest checkpoint
+
+    The run is continued with the same hyperparameters, weights, history and
+    RNG state, so it ends exactly as the uninterrupted run would have, and it
+    keeps checkpointing to the same file. Returns the model with the result
+    of train().
+    """
+    state = load_checkpoint(checkpoint_path)
+    model = AdalineModel(learning_rate=state["learning_rate"], target_error=state["target_error"],
+                         max_epochs=state["max_epochs"])
+    model.restore_checkpoint_state(state)
+
+    writer = CheckpointWriter(checkpoint_path, checkpoint_interval, state["run_key"])
+    try:
+        result = model.train(inputs, desired_outputs, progress_queue=progress_queue,
+                             checkpoint=writer, resume=True)
+    finally:
+        writer.close()
+    return model, result
@@ -0,0 +1,290 @@
+import asyncio
+import json
+import time
+from collections import deque
+import numpy as np
+from models.model_handle import ModelWatcher, DEFAULT_POLL_INTERVAL
+
+# Patterns scored together at most, and how long the first request of a batch waits for others
+DEFAULT_MAX_BATCH_SIZE = 256
+DEFAULT_MAX_WAIT_MS = 2.0
+
+# Latencies kept per model for the percentiles
+LATENCY_WINDOW = 10000
+
+# Largest request body accepted
+MAX_BODY_BYTES = 16 * 1024 * 1024
+
+HTTP_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+                413: "Payload Too Large", 500: "Internal Server Error"}
+
+
+class LatencyStats:
+    """Request counters and a window of recent latencies of one model"""
+
+    def __init__(self, window=LATENCY_WINDOW):
+        self.latencies = deque(maxlen=window)
+        self.requests = 0
+        self.patterns = 0
+        self.batches = 0
+        self.started = time.perf_counter()
+
+    def record_request(self, latency, n_patterns):
+        self.latencies.append(latency)
+        self.requests += 1
+        self.patterns += n_patterns
+
+    def snapshot(self):
+        elapsed = max(time.perf_counter() - self.started, 1e-9)
+        if self.latencies:
+            p50, p99 = np.percentile(np.fromiter(self.latencies, dtype=float), [50, 99]) * 1000
+        else:
+            p50 = p99 = 0.0
+        return {
+            "requests": self.requests,
+            "patterns": self.patterns,
+            "batches": self.batches,
+            "mean_batch_patterns": self.patterns / self.batches if self.batches else 0.0,
+            "p50_ms": float(p50),
+            "p99_ms": float(p99),
+            "requests_per_s": self.requests / elapsed,
+            "patterns_per_s": self.patterns / elapsed
+        }
+
+
+class MicroBatcher:
+    """Coalesce concurrent predict calls on one model into vectorized micro-batches
+
+    The first waiting request opens a batch; requests arriving within
+    max_wait_ms join it until max_batch_size patterns are collected. The batch
+    is scored with a single matrix-vector product and each caller gets its rows.
+    """
+
+    def __init__(self, model, max_batch_size=DEFAULT_MAX_BATCH_SIZE, max_wait_ms=DEFAULT_MAX_WAIT_MS):
+        self.model = model
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.stats = LatencyStats()
+        self.queue = asyncio.Queue()
+        self.task = None
+
+    def start(self):
+        if self.task is None:
+            self.task = asyncio.ensure_future(self.run())
+
+    async def stop(self):
+        if self.task is not None:
+            self.task.cancel()
+            try:
+                await self.task
+            except asyncio.CancelledError:
+                pass
+            self.task = None
+
+    async def predict(self, rows):
+        """Predictions for a (patterns x features) array, scored in a shared batch"""
+        started = time.perf_counter()
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((rows, future))
+        predictions = await future
+        self.stats.record_request(time.perf_counter() - started, len(rows))
+        return predictions
+
+    async def collect_batch(self):
+        """Wait for a first request, then gather more until the batch is full or the wait is over"""
+        batch = [await self.queue.get()]
+        size = len(batch[0][0])
+        deadline = asyncio.get_running_loop().time() + self.max_wait
+
+        while size < self.max_batch_size:
+            timeout = deadline - asyncio.get_running_loop().time()
+            if timeout <= 0:
+                break
+            try:
+                item = await asyncio.wait_for(self.queue.get(), timeout)
+            except asyncio.TimeoutError:
+                break
+            batch.append(item)
+            size += len(item[0])
+        return batch
+
+    async def run(self):
+        while True:
+            batch = await self.collect_batch()
+            self.stats.batches += 1
+            try:
+                predictions = self.model.predict(np.vstack([rows for rows, _ in batch]))
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            start = 0
+            for rows, future in batch:
+                stop = start + len(rows)
+                if not future.done():
+                    future.set_result(predictions[start:stop])
+                start = stop
+
+
+class RequestError(Exception):
+    """Error answered to the client with an HTTP status"""
+
+    def __init__(self, status, message):
+        Exception.__init__(self, message)
+        self.status = status
+
+
+class InferenceServer:
+    """HTTP/JSON prediction service for the models saved in the results directory
+
+    Model files are watched in the background: a retrained case is reloaded
+    and swapped in without interrupting requests, and new cases are added.
+
+    Endpoints:
+        GET  /models               cases served, their number of inputs and reload count
+        POST /predict/<case>       {"inputs": [[...], ...]} or {"input": [...]}
+        GET  /metrics              per-model counters and p50/p99 latency
+    """
+
+    def __init__(self, results_dir, host="127.0.0.1", port=8765,
+                 max_batch_size=DEFAULT_MAX_BATCH_SIZE, max_wait_ms=DEFAULT_MAX_WAIT_MS,
+                 poll_interval=DEFAULT_POLL_INTERVAL):
+        self.results_dir = results_dir
+        self.watcher = ModelWatcher(results_dir, poll_interval)
+        self.host = host
+        self.port = port
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        self.batchers = {}
+        self.server = None
+
+    def load_models(self):
+        """Load every model file of the results directory"""
+        self.watcher.poll()
+        return list(self.watcher.handles)
+
+    def batcher_for(self, case_name):
+        """Batcher of a case, created on first use for cases found by the watcher"""
+        batcher = self.batchers.get(case_name)
+        if batcher is None:
+            handle = self.watcher.get(case_name)
+            if handle is None:
+                return None
+
+            # The batcher scores through the handle, so reloads reach it
+            batcher = MicroBatcher(handle, self.max_batch_size, self.max_wait_ms)
+            batcher.start()
+            self.batchers[case_name] = batcher
+        return batcher
+
+    async def start(self):
+        if not self.watcher.handles:
+            self.load_models()
+        self.watcher.start()
+        self.server = await asyncio.start_server(self.handle_connection, self.host, self.port)
+
+        # Port 0 picks a free port; report the real one
+        self.port = self.server.sockets[0].getsockname()[1]
+        return self.port
+
+    async def serve_forever(self):
+        if self.server is None:
+            await self.start()
+        async with self.server:
+            await self.server.serve_forever()
+
+    async def close(self):
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+            self.server = None
+        self.watcher.stop()
+        for batcher in self.batchers.values():
+            await batcher.stop()
+
+    async def handle_connection(self, reader, writer):
+        """Answer the requests of one connection (HTTP/1.1 keep-alive is supported)"""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, path, version = request_line.decode('latin-1').split(maxsplit=2)
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+
+                length = int(headers.get('content-length', 0))
+                if length > MAX_BODY_BYTES:
+                    await self.send_response(writer, 413, {"error": "Request body too large"}, keep_alive=False)
+                    break
+                body = await reader.readexactly(length) if length else b''
+
+                status, payload = await self.dispatch(method, path, body)
+                keep_alive = (headers.get('connection', '').lower() != 'close'
+                              and version.strip().upper() == 'HTTP/1.1')
+                await self.send_response(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (ValueError, asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def dispatch(self, method, path, body):
+        """Status and JSON payload of a request"""
+        try:
+            if path == "/models" and method == "GET":
+                return 200, {case_name: {"n_features": len(handle.weights), "version": handle.version}
+                             for case_name, handle in self.watcher.handles.items()}
+            if path == "/metrics" and method == "GET":
+                return 200, self.metrics()
+            if path.startswith("/predict/"):
+                if method != "POST":
+                    raise RequestError(405, "Use POST to request predictions")
+                return 200, await self.predict(path[len("/predict/"):], body)
+            raise RequestError(404, f"Unknown path {path}")
+        except RequestError as e:
+            return e.status, {"error": str(e)}
+        except Exception as e:
+            return 500, {"error": str(e)}
+
+    async def predict(self, case_name, body):
+        batcher = self.batcher_for(case_name)
+        if batcher is None:
+            raise RequestError(404, f"Unknown model {case_name}")
+
+        try:
+            request = json.loads(body)
+            single = "input" in request
+            rows = np.asarray([request["input"]] if single else request["inputs"], dtype=float)
+        except (ValueError, KeyError, TypeError) as e:
+            raise RequestError(400, f"Invalid request body: {str(e)}")
+
+        n_features = len(batcher.model.weights)
+        if rows.ndim != 2 or rows.shape[1] != n_features:
+            raise RequestError(400, f"{case_name} requires rows of {n_features} inputs")
+
+        predictions = await batcher.predict(rows)
+        if single:
+            return {"model": case_name, "output": float(predictions[0])}
+        return {"model": case_name, "outputs": predictions.tolist()}
+
+    def metrics(self):
+        return {case_name: batcher.stats.snapshot() for case_name, batcher in self.batchers.items()}
+
+    async def send_response(self, writer, status, payload, keep_alive=True):
+        body = json.dumps(payload).encode('utf-8')
+        head = (f"HTTP/1.1 {status} {HTTP_REASONS.get(status, '')}\r\n"
+                f"Content-Type: application/json\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+        writer.write(head.encode('latin-1') + body)
+        await writer.drain()
@@ -0,0 +1,190 @@
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+import numpy as np
+from models.adaline_model import AdalineModel
+from models.binary_dataset import PackedBinaryInputs
+from models.model_store import MODEL_FILE_EXTENSION, save_model, load_model
+
+# Training algorithm recorded in the cache key (sample-by-sample LMS updates)
+DEFAULT_SOLVER = "lms"
+
+# Trained models kept in memory
+DEFAULT_MEMORY_ENTRIES = 16
+
+# Total size of the model files kept on disk before the least recently used are removed
+DEFAULT_MAX_DISK_BYTES = 64 * 1024 * 1024
+
+
+def dataset_digest(inputs, desired_outputs):
+    """SHA-1 of the training inputs and desired outputs"""
+    digest = hashlib.sha1()
+
+    # Bit-packed inputs are hashed in their packed form
+    if isinstance(inputs, PackedBinaryInputs):
+        digest.update(f"packed:{inputs.n_features}:".encode())
+        digest.update(np.ascontiguousarray(inputs.packed).data)
+    else:
+        inputs = np.ascontiguousarray(inputs, dtype=np.float64)
+        digest.update(f"dense:{inputs.shape}:".encode())
+        digest.update(inputs.data)
+
+    digest.update(np.ascontiguousarray(desired_outputs, dtype=np.float64).data)
+    return digest.hexdigest()
+
+
+def model_cache_key(inputs, desired_outputs, model, solver=DEFAULT_SOLVER, seed=None):
+    """Content address of a training run: dataset, hyperparameters, solver and seed
+
+    A model with preset (warm-start) weights is keyed by those weights as well.
+    """
+    initial = None
+    if model.weights is not None:
+        initial = hashlib.sha1(np.append(np.asarray(model.weights, dtype=np.float64), model.bias).data).hexdigest()
+
+    params = {
+        "dataset": dataset_digest(inputs, desired_outputs),
+        "initial": initial,
+        "learning_rate": model.learning_rate,
+        "target_error": model.target_error,
+        "max_epochs": model.max_epochs,
+        "solver": solver,
+        "seed": seed
+    }
+    return hashlib.sha1(json.dumps(params, sort_keys=True).encode()).hexdigest()
+
+
+def clone_model(model):
+    """Copy of the trained state of a model, so cached entries are never mutated"""
+    copy = AdalineModel(learning_rate=model.learning_rate, target_error=model.target_error,
+                        max_epochs=model.max_epochs)
+    copy.weights = np.array(model.weights, dtype=float)
+    copy.bias = float(model.bias)
+    copy.epochs_trained = model.epochs_trained
+    copy.error_history = list(model.error_history)
+    return copy
+
+
+class ModelCache:
+    """Trained models by cache key, in a memory LRU backed by .npz files on disk
+
+    The disk tier lives in cache_dir; when it grows over max_disk_bytes the
+    least recently used files are removed. Models are copied in and out so
+    callers may keep training the returned model. With a writer (such as
+    models.background_writer.BackgroundWriter) put() only fills the memory
+    tier and the disk copy is written in the background.
+    """
+
+    def __init__(self, cache_dir, memory_entries=DEFAULT_MEMORY_ENTRIES, max_disk_bytes=DEFAULT_MAX_DISK_BYTES,
+                 writer=None):
+        self.cache_dir = cache_dir
+        self.memory_entries = memory_entries
+        self.max_disk_bytes = max_disk_bytes
+        self.writer = writer
+        self.memory = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+        # Background training runs store their models from another thread
+        self.lock = threading.Lock()
+
+    def path_for(self, key):
+        return os.path.join(self.cache_dir, key + MODEL_FILE_EXTENSION)
+
+    def get(self, key):
+        """Cached model for key, or None"""
+        with self.lock:
+            model = self.memory.get(key)
+            if model is not None:
+                self.memory.move_to_end(key)
+            else:
+                model = self.load_from_disk(key)
+                if model is not None:
+                    self.remember(key, model)
+
+            if model is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return clone_model(model)
+
+    def put(self, key, model):
+        """Store a trained model under key in both tiers"""
+        model = clone_model(model)
+        with self.lock:
+            self.remember(key, model)
+
+        if self.writer is not None:
+            try:
+                self.writer.submit(("cache", key), lambda: self.persist(key, model))
+                return
+            except ValueError:
+                # The writer is closed; write the file here
+                pass
+        self.persist(key, model)
+
+    def persist(self, key, model):
+        """Write the disk copy of a cached model and trim the disk tier"""
+        try:
+            # The file is replaced atomically, so only eviction needs the lock
+            os.makedirs(self.cache_dir, exist_ok=True)
+            save_model(self.path_for(key), model)
+            with self.lock:
+                self.evict_disk()
+        except OSError as e:
+            print(f"Error saving model to cache: {str(e)}")
+
+    def remember(self, key, model):
+        """Insert into the memory tier, dropping the least recently used entries"""
+        self.memory[key] = model
+        self.memory.move_to_end(key)
+        while len(self.memory) > self.memory_entries:
+            self.memory.popitem(last=False)
+
+    def load_from_disk(self, key):
+        path = self.path_for(key)
+        if not os.path.exists(path):
+            return None
+        try:
+            model, _ = load_model(path)
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Error reading cached model {path}: {str(e)}")
+            return None
+
+        # The modification time orders the files for eviction
+        os.utime(path)
+        return model
+
+    def disk_entries(self):
+        """(mtime, size, path) of every cached model file"""
+        if not os.path.isdir(self.cache_dir):
+            return []
+        entries = []
+        for file_name in os.listdir(self.cache_dir):
+            if file_name.endswith(MODEL_FILE_EXTENSION):
+                path = os.path.join(self.cache_dir, file_name)
+                stat = os.stat(path)
+                entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def evict_disk(self):
+        """Remove the least recently used files until the disk tier fits in max_disk_bytes"""
+        entries = sorted(self.disk_entries())
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_disk_bytes:
+                break
+            os.remove(path)
+            total -= size
+
+    def stats(self):
+        entries = self.disk_entries()
+        return {
+            "memory_entries": len(self.memory),
+            "disk_entries": len(entries),
+            "disk_bytes": sum(size for _, size, _ in entries),
+            "hits": self.hits,
+            "misses": self.misses
+        }
@@ -0,0 +1,136 @@
+import os
+import re
+import threading
+from models.stream_predictor import load_model_from_file
+
+# Model files in the results directory, by case: Modelo_CasoN.npz is preferred over Pesos_CasoN.txt
+MODEL_FILE_PATTERN = re.compile(r'^(?:Modelo|Pesos)_(Caso\d+)\.(npz|txt)$')
+
+# Seconds between two checks of the results directory
+DEFAULT_POLL_INTERVAL = 1.0
+
+
+def discover_models(results_dir):
+    """Model file of every case in the results directory, by case name"""
+    found = {}
+    for file_name in sorted(os.listdir(results_dir)) if os.path.isdir(results_dir) else []:
+        match = MODEL_FILE_PATTERN.match(file_name)
+        if match is None:
+            continue
+        case_name, extension = match.groups()
+        if extension == "npz" or case_name not in found:
+            found[case_name] = os.path.join(results_dir, file_name)
+    return found
+
+
+def file_signature(file_path):
+    """Modification time and size of a file; a change means it has been rewritten"""
+    stat = os.stat(file_path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+class ModelHandle:
+    """Reference to the latest weights of a model file
+
+    The file is held as an immutable AdalineSnapshot: a reload builds a new
+    snapshot and swaps the reference in a single assignment, so predict()
+    always runs on one complete model and never waits for a reload.
+    """
+
+    def __init__(self, file_path):
+        self.file_path = file_path
+        self.signature = file_signature(file_path)
+        self.model = load_model_from_file(file_path).snapshot()
+        self.version = 1
+        self.error = None
+
+    @property
+    def weights(self):
+        return self.model.weights
+
+    @property
+    def bias(self):
+        return self.model.bias
+
+    def predict(self, inputs):
+        # Read the reference once; a concurrent swap does not affect this call
+        model = self.model
+        return model.predict(inputs)
+
+    def reload_if_changed(self):
+        """Load the file again if it was rewritten; returns True when the model was swapped"""
+        try:
+            signature = file_signature(self.file_path)
+            if signature == self.signature:
+                return False
+            model = load_model_from_file(self.file_path).snapshot()
+        except (OSError, ValueError, KeyError) as e:
+            # Keep serving the previous weights
+            self.error = e
+            return False
+
+        self.model = model
+        self.signature = signature
+        self.version += 1
+        self.error = None
+        return True
+
+
+class ModelWatcher:
+    """Handles for the models of a results directory, kept up to date by a background thread
+
+    Rewritten model files are reloaded and new cases are added on every poll.
+    """
+
+    def __init__(self, results_dir, poll_interval=DEFAULT_POLL_INTERVAL):
+        self.results_dir = results_dir
+        self.poll_interval = poll_interval
+        self.handles = {}
+        self.stop_event = threading.Event()
+        self.thread = None
+
+    def poll(self):
+        """Reload changed models and add new ones; returns the cases whose model changed"""
+        changed = []
+        handles = dict(self.handles)
+        for case_name, file_path in discover_models(self.results_dir).items():
+            handle = handles.get(case_name)
+
+            if handle is None:
+                try:
+                    handles[case_name] = ModelHandle(file_path)
+                except (OSError, ValueError, KeyError) as e:
+                    print(f"Error loading model {file_path}: {str(e)}")
+                    continue
+                changed.append(case_name)
+                continue
+
+            # A case whose .npz appears after its text file switches to the .npz
+            if handle.file_path != file_path:
+                handle.file_path = file_path
+                handle.signature = None
+            if handle.reload_if_changed():
+                changed.append(case_name)
+
+        # Publish the new dictionary in one assignment
+        self.handles = handles
+        return changed
+
+    def get(self, case_name):
+        return self.handles.get(case_name)
+
+    def start(self):
+        if self.thread is None:
+            self.stop_event.clear()
+            self.thread = threading.Thread(target=self.run, daemon=True)
+            self.thread.start()
+
+    def run(self):
+        while not self.stop_event.wait(self.poll_interval):
+            self.poll()
+
+    def stop(self):
+        if self.thread is not None:
+            self.stop_event.set()
+            self.thread.join()
+            self.thread = None
@@ -0,0 +1,109 @@
+import io
+import os
+import numpy as np
+from models.adaline_model import AdalineModel
+
+# Version of the .npz layout, stored in every file
+MODEL_FORMAT_VERSION = 1
+
+# Extension of the binary model files
+MODEL_FILE_EXTENSION = ".npz"
+
+
+def atomic_write(file_path, write):
+    """Call write(f) on a temporary file next to file_path, then rename it over file_path
+
+    A crash while writing leaves the previous file untouched.
+    """
+    temp_path = file_path + ".tmp"
+    try:
+        with open(temp_path, 'wb') as f:
+            write(f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, file_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def model_metadata(model, fingerprint=""):
+    """Metadata stored with a trained model"""
+    return {
+        "n_features": len(model.weights),
+        "learning_rate": model.learning_rate,
+        "target_error": model.target_error,
+        "max_epochs": model.max_epochs,
+        "epochs": model.epochs_trained,
+        "final_error": float(model.error_history[-1]) if model.error_history else float('nan'),
+        "fingerprint": fingerprint or ""
+    }
+
+
+def save_model(file_path, model, fingerprint=""):
+    """Write a trained model and its metadata as an uncompressed .npz file"""
+    if model.weights is None:
+        raise ValueError("Model has not been trained yet")
+
+    metadata = model_metadata(model, fingerprint)
+    arrays = {
+        "format_version": np.int64(MODEL_FORMAT_VERSION),
+        "weights": np.asarray(model.weights, dtype=np.float64),
+        "bias": np.float64(model.bias),
+        "error_history": np.asarray(model.error_history, dtype=np.float64),
+        "n_features": np.int64(metadata["n_features"]),
+        "learning_rate": np.float64(metadata["learning_rate"]),
+        "target_error": np.float64(metadata["target_error"]),
+        "max_epochs": np.int64(metadata["max_epochs"]),
+        "epochs": np.int64(metadata["epochs"]),
+        "final_error": np.float64(metadata["final_error"]),
+        "fingerprint": np.str_(metadata["fingerprint"])
+    }
+    atomic_write(file_path, lambda f: np.savez(f, **arrays))
+    return metadata
+
+
+def load_model(file_path):
+    """Load a model saved by save_model; returns the model and its metadata
+
+    The file is read with a single read call and parsed from memory.
+    """
+    with open(file_path, 'rb') as f:
+        data = f.read()
+
+    with np.load(io.BytesIO(data)) as archive:
+        version = int(archive["format_version"])
+        if version > MODEL_FORMAT_VERSION:
+            raise ValueError(f"Model file format {version} is newer than the supported format {MODEL_FORMAT_VERSION}")
+
+        metadata = {
+            "n_features": int(archive["n_features"]),
+            "learning_rate": float(archive["learning_rate"]),
+            "target_error": float(archive["target_error"]),
+            "epochs": int(archive["epochs"]),
+            "final_error": float(archive["final_error"]),
+            "fingerprint": str(archive["fingerprint"])
+        }
+
+        model = AdalineModel(learning_rate=metadata["learning_rate"], target_error=metadata["target_error"])
+
+        # Files written before max_epochs was stored keep the model default
+        if "max_epochs" in archive.files:
+            model.max_epochs = int(archive["max_epochs"])
+        metadata["max_epochs"] = model.max_epochs
+
+        model.weights = archive["weights"]
+        model.bias = float(archive["bias"])
+        model.error_history = archive["error_history"].tolist()
+        model.epochs_trained = metadata["epochs"]
+
+    if len(model.weights) != metadata["n_features"]:
+        raise ValueError(f"Model file has {len(model.weights)} weights, but its header records {metadata['n_features']}")
+    return model, metadata
+
+
+def export_weights_text(file_path, weights, bias):
+    """Export weights followed by the bias as text, one value per line"""
+    data = np.append(weights, bias)
+    atomic_write(file_path, lambda f: np.savetxt(f, data))
@@ -0,0 +1,81 @@
+import os
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+
+# Rows scored per vectorized product inside a worker (keeps worker memory bounded)
+BLOCK_ROWS = 1 << 20
+
+# State broadcast once to every worker process by the pool initializer
+_worker_state = {}
+
+
+def _init_worker(input_path, output_path, weights, bias):
+    """Open the memory-mapped arrays and keep the model parameters in the worker"""
+    _worker_state['inputs'] = np.load(input_path, mmap_mode='r')
+    _worker_state['outputs'] = np.load(output_path, mmap_mode='r+')
+    _worker_state['weights'] = weights
+    _worker_state['bias'] = bias
+
+
+def _score_range(row_range):
+    """Score the rows [start, stop) of the input file into the output file"""
+    start, stop = row_range
+    inputs = _worker_state['inputs']
+    outputs = _worker_state['outputs']
+    weights = _worker_state['weights']
+    bias = _worker_state['bias']
+    n_features = len(weights)
+
+    for block_start in range(start, stop, BLOCK_ROWS):
+        block_stop = min(block_start + BLOCK_ROWS, stop)
+
+        # Extra trailing column (desired output) is ignored
+        block = inputs[block_start:block_stop, :n_features]
+        np.dot(block, weights, out=outputs[block_start:block_stop])
+        outputs[block_start:block_stop] += bias
+
+    outputs.flush()
+    return stop - start
+
+
+def split_rows(n_rows, n_parts):
+    """Split n_rows into at most n_parts contiguous (start, stop) ranges"""
+    n_parts = max(1, min(n_parts, n_rows))
+    bounds = np.linspace(0, n_rows, n_parts + 1).astype(np.int64)
+    return [(int(bounds[i]), int(bounds[i + 1])) for i in range(n_parts) if bounds[i] < bounds[i + 1]]
+
+
+def parallel_predict(model, input_path, output_path, n_workers=None, tasks_per_worker=4):
+    """Score a memory-mapped .npy input file into a .npy output file using a process pool"""
+    if model.weights is None:
+        raise ValueError("Model has not been trained yet")
+
+    inputs = np.load(input_path, mmap_mode='r')
+    if inputs.ndim != 2:
+        raise ValueError("Input file must contain a two-dimensional array")
+
+    n_rows, n_columns = inputs.shape
+    n_features = len(model.weights)
+    if n_columns not in (n_features, n_features + 1):
+        raise ValueError(f"Input file has {n_columns} columns, but the model requires {n_features} inputs")
+
+    # Create the shared output file before the workers open it
+    outputs = np.lib.format.open_memmap(output_path, mode='w+', dtype=np.float64, shape=(n_rows,))
+    del outputs
+
+    if n_rows == 0:
+        return 0
+
+    n_workers = n_workers or os.cpu_count() or 1
+
+    # A few ranges per worker balances the load without much scheduling overhead
+    row_ranges = split_rows(n_rows, n_workers * tasks_per_worker)
+
+    weights = np.ascontiguousarray(model.weights, dtype=np.float64)
+    bias = float(model.bias)
+
+    with ProcessPoolExecutor(max_workers=n_workers, initializer=_init_worker,
+                             initargs=(input_path, output_path, weights, bias)) as pool:
+        scored_rows = sum(pool.map(_score_range, row_ranges))
+
+    return scored_rows
@@ -0,0 +1,120 @@
+import json
+import mmap
+import os
+import struct
+import time
+import numpy as np
+from models.model_store import atomic_write
+
+# First bytes of a session snapshot file
+SNAPSHOT_MAGIC = b"ADALSES1"
+
+# Arrays start at multiples of this many bytes, so every mapped view is aligned
+ARRAY_ALIGNMENT = 64
+
+# Magic plus the little-endian length of the JSON header
+PREFIX_SIZE = len(SNAPSHOT_MAGIC) + 8
+
+# Snapshot files of a session directory, and the small file naming the current one
+SNAPSHOT_PREFIX = "sesion_"
+SNAPSHOT_EXTENSION = ".bin"
+POINTER_FILE_NAME = "sesion.json"
+
+
+def aligned(offset):
+    return -(-offset // ARRAY_ALIGNMENT) * ARRAY_ALIGNMENT
+
+
+def write_snapshot(file_path, manifest, arrays):
+    """Write a manifest and named arrays to a single file, atomically
+
+    Layout: magic, header length, JSON header (the manifest and the dtype,
+    shape and offset of every array), then the raw arrays, each aligned so it
+    can be mapped in place by read_snapshot.
+    """
+    layout = []
+    entries = {}
+    offset = 0
+    for name, array in arrays.items():
+        array = np.ascontiguousarray(array)
+        offset = aligned(offset)
+        entries[name] = {"dtype": array.dtype.str, "shape": list(array.shape), "offset": offset}
+        layout.append((offset, array))
+        offset += array.nbytes
+
+    header = json.dumps({"manifest": manifest, "arrays": entries}).encode('utf-8')
+    data_start = aligned(PREFIX_SIZE + len(header))
+
+    def write(f):
+        f.write(SNAPSHOT_MAGIC)
+        f.write(struct.pack('<Q', len(header)))
+        f.write(header)
+        for array_offset, array in layout:
+            f.seek(data_start + array_offset)
+            f.write(array.data)
+        # Extend the file to its full length when the last arrays are empty
+        f.truncate(data_start + offset)
+
+    atomic_write(file_path, write)
+
+
+def read_snapshot(file_path):
+    """Read the manifest of a snapshot and map its arrays without loading them
+
+    Returns the manifest and a dict of read-only arrays backed by the file;
+    their pages are only read from disk when the data is first used.
+    """
+    with open(file_path, 'rb') as f:
+        if f.read(len(SNAPSHOT_MAGIC)) != SNAPSHOT_MAGIC:
+            raise ValueError(f"{file_path} is not a session snapshot")
+        header_size, = struct.unpack('<Q', f.read(8))
+        header = json.loads(f.read(header_size).decode('utf-8'))
+
+        data_start = aligned(PREFIX_SIZE + header_size)
+        length = f.seek(0, 2)
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if length > data_start else b""
+
+    arrays = {}
+    for name, entry in header["arrays"].items():
+        dtype = np.dtype(entry["dtype"])
+        shape = tuple(entry["shape"])
+        count = int(np.prod(shape))
+        if count == 0:
+            arrays[name] = np.empty(shape, dtype=dtype)
+        else:
+            arrays[name] = np.frombuffer(buffer, dtype=dtype, count=count,
+                                         offset=data_start + entry["offset"]).reshape(shape)
+    return header["manifest"], arrays
+
+
+def save_session(directory, manifest, arrays):
+    """Write a new snapshot file in directory and make it the current session
+
+    Each save goes to a new file, so a snapshot still mapped by the running
+    session is never overwritten; older snapshots are removed when possible.
+    """
+    os.makedirs(directory, exist_ok=True)
+    file_name = f"{SNAPSHOT_PREFIX}{time.time_ns()}{SNAPSHOT_EXTENSION}"
+    write_snapshot(os.path.join(directory, file_name), manifest, arrays)
+
+    pointer = json.dumps({"snapshot": file_name}).encode('utf-8')
+    atomic_write(os.path.join(directory, POINTER_FILE_NAME), lambda f: f.write(pointer))
+
+    for old_name in os.listdir(directory):
+        if old_name.startswith(SNAPSHOT_PREFIX) and old_name.endswith(SNAPSHOT_EXTENSION) and old_name != file_name:
+            try:
+                os.remove(os.path.join(directory, old_name))
+            except OSError:
+                # Still mapped on systems that lock mapped files; removed by a later save
+                pass
+    return file_name
+
+
+def load_session(directory):
+    """Manifest and mapped arrays of the current snapshot in directory, or None if there is none"""
+    try:
+        with open(os.path.join(directory, POINTER_FILE_NAME), 'r') as f:
+            file_name = json.load(f)["snapshot"]
+    except (OSError, ValueError, KeyError):
+        return None
+    return read_snapshot(os.path.join(directory, file_name))
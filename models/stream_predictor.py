@@ -0,0 +1,84 @@
+import numpy as np
+from models.adaline_model import AdalineModel
+from models.model_store import MODEL_FILE_EXTENSION, load_model
+
+# Bytes of text requested from the input stream per chunk (~ hundreds of thousands of rows)
+DEFAULT_CHUNK_BYTES = 8 * 1024 * 1024
+
+# Size of the output buffer used when writing predictions
+OUTPUT_BUFFER_SIZE = 1024 * 1024
+
+
+def load_model_from_file(file_path):
+    """Load an Adaline model from a .npz model file or a text weights file (weights followed by the bias)"""
+    if file_path.endswith(MODEL_FILE_EXTENSION):
+        model, _ = load_model(file_path)
+        return model
+
+    data = np.loadtxt(file_path, ndmin=1)
+
+    # The last value is bias, all others are weights
+    model = AdalineModel()
+    model.weights = data[:-1]
+    model.bias = data[-1]
+    return model
+
+
+def read_input_chunks(stream, chunk_bytes=DEFAULT_CHUNK_BYTES):
+    """Yield 2D arrays parsed from a text stream, one block of lines at a time"""
+    delimiter = None
+    header_checked = False
+
+    while True:
+        # readlines with a size hint keeps memory bounded for unbounded streams
+        lines = stream.readlines(chunk_bytes)
+        if not lines:
+            break
+
+        if not header_checked:
+            # Find the first non-empty row of the stream
+            first_index = next((i for i, line in enumerate(lines) if line.strip()), None)
+            if first_index is None:
+                continue
+            header_checked = True
+            first_line = lines[first_index].strip()
+
+            # Drop the header row (e.g. "x1,x2,Y") if present
+            if any(c.isalpha() for c in first_line):
+                del lines[first_index]
+                first_line = next((line.strip() for line in lines[first_index:] if line.strip()), first_line)
+
+            # Use comma delimiter if the data has it, otherwise whitespace
+            delimiter = ',' if ',' in first_line else None
+
+        # A chunk may hold nothing but the header or blank lines
+        if not any(line.strip() for line in lines):
+            continue
+
+        data = np.loadtxt(lines, delimiter=delimiter, ndmin=2)
+        if data.size:
+            yield data
+
+
+def stream_predict(model, in_stream, out_stream, chunk_bytes=DEFAULT_CHUNK_BYTES, fmt="%.6f"):
+    """Score every row of in_stream with one vectorized product per chunk and write the predictions"""
+    n_features = len(model.weights)
+    total_rows = 0
+
+    for chunk in read_input_chunks(in_stream, chunk_bytes):
+        # Rows coming from a CasoN.txt file also carry the desired output as last column
+        if chunk.shape[1] == n_features + 1:
+            chunk = chunk[:, :-1]
+        elif chunk.shape[1] != n_features:
+            raise ValueError(f"Input rows have {chunk.shape[1]} columns, but the model requires {n_features} inputs")
+
+        predictions = model.predict(chunk)
+
+        # Format the whole chunk at once and hand it to the buffered writer
+        out_stream.write("\n".join([fmt % value for value in predictions.tolist()]))
+        out_stream.write("\n")
+
+        total_rows += len(predictions)
+
+    out_stream.flush()
+    return total_rows
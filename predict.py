@@ -0,0 +1,58 @@
+import argparse
+import sys
+from models.stream_predictor import (load_model_from_file, stream_predict,
+                                     DEFAULT_CHUNK_BYTES, OUTPUT_BUFFER_SIZE)
+from models.parallel_predictor import parallel_predict
+
+def parse_args(argv=None):
+    """Parse the command line arguments for batch scoring"""
+    parser = argparse.ArgumentParser(
+        description="Calcula las salidas de un modelo Adaline entrenado para un flujo de patrones de entrada")
+    parser.add_argument("weights", help="Archivo de pesos, por ejemplo resultados/Pesos_Caso4.txt")
+    parser.add_argument("input", nargs="?", default="-",
+                        help="Archivo de entradas (una fila por patrón, texto o .npy). Use '-' o omítalo para leer de stdin")
+    parser.add_argument("-o", "--output", default="-",
+                        help="Archivo de salida. Use '-' o omítalo para escribir en stdout")
+    parser.add_argument("--chunk-bytes", type=int, default=DEFAULT_CHUNK_BYTES,
+                        help="Bytes de entrada leídos por bloque")
+    parser.add_argument("--fmt", default="%.6f", help="Formato de cada predicción")
+    parser.add_argument("--lookup-table", action="store_true",
+                        help="Precalcula la salida de todos los patrones binarios y predice por consulta en tabla "
+                             "(solo entradas de texto; no se admite con entradas .npy)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Procesos usados para entradas .npy (por defecto, uno por núcleo)")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    # Binary inputs are memory-mapped and scored in parallel into a .npy output;
+    # the workers score with a matrix-vector product and never read a lookup table
+    if args.input.endswith(".npy"):
+        if args.output == "-" or not args.output.endswith(".npy"):
+            sys.exit("Para entradas .npy indique un archivo de salida .npy con -o")
+        if args.lookup_table:
+            sys.exit("--lookup-table solo se admite con entradas de texto, no con entradas .npy")
+
+    # Load the trained weights and bias
+    model = load_model_from_file(args.weights)
+    if args.lookup_table:
+        model.compile_lookup_table()
+
+    if args.input.endswith(".npy"):
+        parallel_predict(model, args.input, args.output, n_workers=args.workers)
+        return
+
+    in_stream = sys.stdin if args.input == "-" else open(args.input, 'r', buffering=OUTPUT_BUFFER_SIZE)
+    out_stream = sys.stdout if args.output == "-" else open(args.output, 'w', buffering=OUTPUT_BUFFER_SIZE)
+
+    try:
+        stream_predict(model, in_stream, out_stream, chunk_bytes=args.chunk_bytes, fmt=args.fmt)
+    finally:
+        if in_stream is not sys.stdin:
+            in_stream.close()
+        if out_stream is not sys.stdout:
+            out_stream.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+import argparse
+import asyncio
+from models.inference_server import InferenceServer, DEFAULT_MAX_BATCH_SIZE, DEFAULT_MAX_WAIT_MS
+from models.model_handle import DEFAULT_POLL_INTERVAL
+
+def parse_args(argv=None):
+    """Parse the command line arguments for the prediction server"""
+    parser = argparse.ArgumentParser(
+        description="Sirve por HTTP/JSON las predicciones de los modelos Adaline guardados en la carpeta de resultados")
+    parser.add_argument("--results-dir", default="resultados",
+                        help="Carpeta con los archivos Modelo_CasoN.npz o Pesos_CasoN.txt")
+    parser.add_argument("--host", default="127.0.0.1", help="Dirección en la que escucha el servidor")
+    parser.add_argument("--port", type=int, default=8765, help="Puerto en el que escucha el servidor")
+    parser.add_argument("--max-batch-size", type=int, default=DEFAULT_MAX_BATCH_SIZE,
+                        help="Patrones evaluados como máximo en un mismo lote")
+    parser.add_argument("--max-wait-ms", type=float, default=DEFAULT_MAX_WAIT_MS,
+                        help="Espera máxima (ms) para reunir peticiones en un lote")
+    parser.add_argument("--poll-interval", type=float, default=DEFAULT_POLL_INTERVAL,
+                        help="Segundos entre dos revisiones de la carpeta de resultados para recargar modelos")
+    return parser.parse_args(argv)
+
+async def serve(args):
+    server = InferenceServer(args.results_dir, args.host, args.port,
+                             max_batch_size=args.max_batch_size, max_wait_ms=args.max_wait_ms,
+                             poll_interval=args.poll_interval)
+    models = server.load_models()
+    port = await server.start()
+    print(f"Sirviendo {', '.join(models) or 'ningún modelo'} en http://{args.host}:{port}")
+    try:
+        await server.serve_forever()
+    finally:
+        await server.close()
+
+def main(argv=None):
+    args = parse_args(argv)
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
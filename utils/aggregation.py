@@ -0,0 +1,103 @@
+import numpy as np
+
+# Bins used by the aggregated views, independent of the number of patterns
+DEFAULT_INDEX_BINS = 200
+DEFAULT_HISTOGRAM_BINS = 60
+DEFAULT_JOINT_BINS = 80
+DEFAULT_SUMMARY_BINS = 1024
+
+# Percentiles drawn as bands: outer band, inner band and median
+BAND_PERCENTILES = (5, 25, 50, 75, 95)
+
+def percentile_bands(values, n_bins=DEFAULT_INDEX_BINS, percentiles=BAND_PERCENTILES):
+    """Percentiles of a series over consecutive groups of its index
+
+    Returns the center index of each group and an array of shape
+    (len(percentiles), n_groups).
+    """
+    values = np.asarray(values, dtype=float)
+    n = len(values)
+    if n == 0:
+        return np.empty(0), np.empty((len(percentiles), 0))
+
+    # Equal-sized groups, the last one padded with NaN so all are reduced at once
+    group_size = int(np.ceil(n / min(n_bins, n)))
+    n_groups = int(np.ceil(n / group_size))
+    padded = np.full(n_groups * group_size, np.nan)
+    padded[:n] = values
+    groups = padded.reshape(n_groups, group_size)
+
+    bands = np.nanpercentile(groups, percentiles, axis=1)
+    centers = np.minimum(np.arange(n_groups) * group_size + (group_size - 1) / 2, n - 1)
+    return centers, bands
+
+def residual_histogram(desired, predicted, bins=DEFAULT_HISTOGRAM_BINS):
+    """Histogram of the residuals desired - predicted"""
+    residuals = np.asarray(desired, dtype=float) - np.asarray(predicted, dtype=float)
+    return np.histogram(residuals, bins=bins)
+
+def joint_histogram(desired, predicted, bins=DEFAULT_JOINT_BINS):
+    """2D histogram of desired against predicted outputs"""
+    desired = np.asarray(desired, dtype=float)
+    predicted = np.asarray(predicted, dtype=float)
+
+    # Same range on both axes so the diagonal is the perfect prediction
+    low = min(desired.min(), predicted.min())
+    high = max(desired.max(), predicted.max())
+    if low == high:
+        low, high = low - 0.5, high + 0.5
+
+    return np.histogram2d(desired, predicted, bins=bins, range=[[low, high], [low, high]])
+
+def blockwise_column_summary(make_blocks, percentiles=(5, 50, 95), bins=DEFAULT_SUMMARY_BINS):
+    """Mean, largest magnitude and percentiles of every column of a matrix given as row blocks
+
+    make_blocks() must return a new iterator over the blocks; it is read twice
+    and the blocks are never stacked into one matrix.
+    The mean and largest magnitude are exact. The percentiles come from a
+    histogram per column and are accurate to 1/bins of the column's range.
+    """
+    # First pass: count, sum and range of every column
+    count = 0
+    total = low = high = None
+    for block in make_blocks():
+        if len(block) == 0:
+            continue
+        count += len(block)
+        if total is None:
+            total, low, high = block.sum(axis=0), block.min(axis=0), block.max(axis=0)
+        else:
+            total += block.sum(axis=0)
+            np.minimum(low, block.min(axis=0), out=low)
+            np.maximum(high, block.max(axis=0), out=high)
+    if count == 0:
+        raise ValueError("Cannot summarize an empty matrix")
+
+    # Second pass: one histogram per column, filled with a single bincount per block
+    n_columns = len(total)
+    width = (high - low) / bins
+    scale = np.divide(1.0, width, out=np.zeros_like(width), where=width > 0)
+    offsets = np.arange(n_columns) * bins
+    counts = np.zeros(n_columns * bins)
+    for block in make_blocks():
+        if len(block) == 0:
+            continue
+        bin_index = np.minimum(((block - low) * scale).astype(np.int64), bins - 1)
+        counts += np.bincount((bin_index + offsets).ravel(), minlength=n_columns * bins)
+    cumulative = np.cumsum(counts.reshape(n_columns, bins), axis=1)
+
+    # Interpolate each percentile linearly inside the bin where it falls
+    targets = np.asarray(percentiles, dtype=float) / 100 * count
+    values = np.empty((len(percentiles), n_columns))
+    for j in range(n_columns):
+        k = np.minimum(np.searchsorted(cumulative[j], targets), bins - 1)
+        before = np.where(k > 0, cumulative[j][k - 1], 0.0)
+        in_bin = cumulative[j][k] - before
+        fraction = np.divide(targets - before, in_bin, out=np.zeros_like(targets), where=in_bin > 0)
+        values[:, j] = low[j] + (k + np.clip(fraction, 0, 1)) * width[j]
+
+    return {
+        "mean": total / count,
+        "max_abs": np.maximum(np.abs(low), np.abs(high)),
+        "percentiles": values
+    }
@@ -0,0 +1,92 @@
+import numpy as np
+
+# Points shown when the axes size is not known yet
+DEFAULT_TARGET_POINTS = 1000
+
+def lttb(x, y, n_out):
+    """Largest-Triangle-Three-Buckets downsampling of a series to n_out points"""
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(x)
+
+    if n_out >= n or n_out < 3:
+        return x, y
+
+    # Bucket boundaries for the points between the first and the last one
+    every = (n - 2) / (n_out - 2)
+    edges = (np.floor(np.arange(n_out - 1) * every) + 1).astype(np.int64)
+    edges[-1] = n - 1
+
+    indices = np.empty(n_out, dtype=np.int64)
+    indices[0] = 0
+    indices[-1] = n - 1
+    selected = 0
+
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+
+        # Average of the next bucket (the last point for the final bucket)
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+
+        # Keep the point forming the largest triangle with the previous pick and the next average
+        areas = np.abs((x[selected] - avg_x) * (y[start:end] - y[selected])
+                       - (x[selected] - x[start:end]) * (avg_y - y[selected]))
+        selected = start + int(np.argmax(areas))
+        indices[i + 1] = selected
+
+    return x[indices], y[indices]
+
+class DecimatedLine:
+    """Show a decimated view of a long series on a line artist
+
+    The full series is kept here; the line only receives about one point per
+    horizontal pixel. When the x range changes (zoom or pan with the toolbar),
+    the visible range is re-sampled from the full resolution data.
+    """
+
+    def __init__(self, line):
+        self.line = line
+        self.ax = line.axes
+        self.x = np.empty(0)
+        self.y = np.empty(0)
+
+        # A closure keeps this object alive as long as the axes callback exists
+        self.ax.callbacks.connect('xlim_changed', lambda ax: self.resample())
+
+    def target_points(self):
+        """Number of points to draw, about the pixel width of the axes"""
+        width = int(self.ax.bbox.width)
+        return width if width > 0 else DEFAULT_TARGET_POINTS
+
+    def set_full_data(self, x, y):
+        """Replace the full series and draw it decimated over its whole range"""
+        self.x = np.asarray(x, dtype=float)
+        self.y = np.asarray(y, dtype=float)
+        self.line.set_data(*lttb(self.x, self.y, self.target_points()))
+
+    def resample(self):
+        """Re-sample the currently visible x range at full resolution"""
+        if len(self.x) == 0:
+            return
+
+        x_min, x_max = self.ax.get_xlim()
+
+        # Include one point beyond each side so the line reaches the edges
+        start = max(int(np.searchsorted(self.x, x_min, side='left')) - 1, 0)
+        stop = min(int(np.searchsorted(self.x, x_max, side='right')) + 1, len(self.x))
+
+        self.line.set_data(*lttb(self.x[start:stop], self.y[start:stop], self.target_points()))
+        self.ax.figure.canvas.draw_idle()
+
+def plot_decimated(ax, y, *args, **kwargs):
+    """Plot a series against its index through a DecimatedLine"""
+    line, = ax.plot([], [], *args, **kwargs)
+    decimated = DecimatedLine(line)
+    decimated.set_full_data(np.arange(len(y)), y)
+
+    # Autoscale to the new data, as ax.plot would
+    ax.relim()
+    ax.autoscale_view()
+    return line, decimated
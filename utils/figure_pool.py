@@ -0,0 +1,132 @@
+def tk_backend():
+    """Import matplotlib with the TkAgg backend; deferred until the first figure is needed"""
+    import matplotlib
+    matplotlib.use("TkAgg")
+    from matplotlib.figure import Figure
+    from matplotlib.backend_bases import FigureCanvasBase
+    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+    return Figure, FigureCanvasBase, FigureCanvasTkAgg, NavigationToolbar2Tk
+
+
+class PooledFigure:
+    """A figure owned by the pool with its Tk canvas and toolbar, if attached"""
+
+    def __init__(self, figure):
+        self.figure = figure
+        self.canvas = None
+        self.toolbar = None
+
+
+def figure_nbytes(figure):
+    """Approximate bytes held by a figure: its Agg render buffer plus the data of its artists"""
+    total = 0
+
+    renderer = getattr(figure.canvas, 'renderer', None)
+    if renderer is not None:
+        total += memoryview(renderer.buffer_rgba()).nbytes
+
+    for ax in figure.axes:
+        for line in ax.lines:
+            total += line.get_xydata().nbytes
+        for collection in ax.collections:
+            total += collection.get_offsets().nbytes
+        for image in ax.images:
+            array = image.get_array()
+            if array is not None:
+                total += array.nbytes
+
+    return total
+
+
+class FigurePool:
+    """Registry that owns every matplotlib figure shown by the views
+
+    Figures are created and embedded through the pool under a key such as
+    ('error', case_name). Creating a figure under a key that is already in use,
+    releasing a group of keys, or destroying the Tk widget that holds a canvas
+    clears the old figure and drops its canvas and toolbar, so repeated
+    retrains do not accumulate figures.
+    """
+
+    def __init__(self):
+        self.entries = {}
+
+    def figure(self, key, **kwargs):
+        """Create a new figure under key, releasing the figure it replaces"""
+        self.release(key)
+        Figure, _, _, _ = tk_backend()
+        figure = Figure(**kwargs)
+        self.entries[key] = PooledFigure(figure)
+        return figure
+
+    def get(self, key):
+        """Figure registered under key, or None"""
+        entry = self.entries.get(key)
+        return entry.figure if entry else None
+
+    def attach(self, key, master):
+        """Create the Tk canvas of the figure under key inside master"""
+        entry = self.entries[key]
+        _, _, FigureCanvasTkAgg, _ = tk_backend()
+        canvas = FigureCanvasTkAgg(entry.figure, master=master)
+        entry.canvas = canvas
+
+        # Release the figure when its widget goes away with a cleared frame
+        canvas.get_tk_widget().bind(
+            '<Destroy>', lambda event: self.on_canvas_destroyed(key, canvas), '+')
+        return canvas
+
+    def attach_toolbar(self, key, master):
+        """Create the navigation toolbar of the figure under key inside master"""
+        entry = self.entries[key]
+        _, _, _, NavigationToolbar2Tk = tk_backend()
+        entry.toolbar = NavigationToolbar2Tk(entry.canvas, master)
+        return entry.toolbar
+
+    def on_canvas_destroyed(self, key, canvas):
+        entry = self.entries.get(key)
+        if entry is None or entry.canvas is not canvas:
+            return
+
+        # Tk is already destroying the widgets, only the references are dropped
+        entry.canvas = None
+        entry.toolbar = None
+        self.release(key)
+
+    def release(self, key):
+        """Close the figure under key and destroy its canvas and toolbar"""
+        entry = self.entries.pop(key, None)
+        if entry is None:
+            return
+
+        if entry.toolbar is not None and entry.toolbar.winfo_exists():
+            entry.toolbar.destroy()
+        if entry.canvas is not None:
+            widget = entry.canvas.get_tk_widget()
+            if widget.winfo_exists():
+                widget.destroy()
+
+        # Drop the artists and detach the Tk canvas so its buffers can be freed
+        _, FigureCanvasBase, _, _ = tk_backend()
+        entry.figure.clear()
+        FigureCanvasBase(entry.figure)
+
+    def release_group(self, group):
+        """Release every figure whose key starts with group"""
+        for key in [key for key in self.entries if key[0] == group]:
+            self.release(key)
+
+    def release_all(self):
+        for key in list(self.entries):
+            self.release(key)
+
+    def live_count(self):
+        """Number of figures currently held"""
+        return len(self.entries)
+
+    def bytes_held(self):
+        """Approximate bytes held by all live figures"""
+        return sum(figure_nbytes(entry.figure) for entry in self.entries.values())
+
+    def stats(self):
+        return {"figures": self.live_count(), "bytes": self.bytes_held()}
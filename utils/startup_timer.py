@@ -0,0 +1,22 @@
+import time
+
+
+class StartupTimer:
+    """Elapsed time of each startup stage, measured from a common start"""
+
+    def __init__(self, start=None):
+        self.start = time.perf_counter() if start is None else start
+        self.marks = []
+
+    def mark(self, stage):
+        """Record the time elapsed until the end of a stage"""
+        self.marks.append((stage, time.perf_counter() - self.start))
+
+    def report(self):
+        """Stage timings as text lines, with the time spent in each stage"""
+        lines = []
+        previous = 0.0
+        for stage, elapsed in self.marks:
+            lines.append(f"{stage:<20} {elapsed * 1000:8.1f} ms  (+{(elapsed - previous) * 1000:.1f} ms)")
+            previous = elapsed
+        return "\n".join(lines)
@@ -94,6 +94,31 @@ class ModernButton(tk.Button):
             self.config(relief=tk.FLAT)
             self.after(100, lambda: self.config(relief=tk.FLAT))
 
+class LazyNotebook(ttk.Notebook):
+    """Notebook que construye el contenido de cada pestaña la primera vez que se muestra"""
+    def __init__(self, master=None, **kwargs):
+        ttk.Notebook.__init__(self, master, **kwargs)
+        
+        # Pestañas pendientes de construir: nombre del frame -> (frame, función de dibujo)
+        self.pending_tabs = {}
+        self.bind("<<NotebookTabChanged>>", self.render_selected)
+        
+    def add_lazy(self, frame, render, **kwargs):
+        """Añade una pestaña cuyo contenido se construye con render(frame) al visitarla por primera vez"""
+        self.add(frame, **kwargs)
+        self.pending_tabs[str(frame)] = (frame, render)
+        
+    def defer(self, frame, render):
+        """Difiere la construcción de una pestaña ya añadida hasta su primera visita"""
+        self.pending_tabs[str(frame)] = (frame, render)
+        
+    def render_selected(self, event=None):
+        """Construye la pestaña seleccionada si aún no se ha dibujado"""
+        pending = self.pending_tabs.pop(self.select(), None)
+        if pending:
+            frame, render = pending
+            render(frame)
+
 def create_rounded_rectangle(canvas, x1, y1, x2, y2, radius=25, **kwargs):
     """Crea un rectángulo con esquinas redondeadas en un canvas"""
     points = [
@@ -124,6 +124,26 @@ class ConfigView:
                             font=("Arial", 8, "italic"), bg=COLOR_LIGHT_BG, fg=COLOR_TEXT_SECONDARY)
         error_info.pack(side=tk.LEFT, padx=5)
         
+        # Live error curve option
+        live_frame = tk.Frame(params_content, bg=COLOR_LIGHT_BG)
+        live_frame.pack(fill='x', pady=4)
+        
+        self.live_var = tk.BooleanVar(value=False)
+        live_check = tk.Checkbutton(live_frame, text="Mostrar la gráfica de error en vivo durante el entrenamiento",
+                                    variable=self.live_var, font=("Arial", 9), bg=COLOR_LIGHT_BG, fg=COLOR_PRIMARY,
+                                    activebackground=COLOR_LIGHT_BG, anchor='w')
+        live_check.pack(side=tk.LEFT)
+        
+        # Warm-start option: continue from the latest weights of the case
+        warm_start_frame = tk.Frame(params_content, bg=COLOR_LIGHT_BG)
+        warm_start_frame.pack(fill='x', pady=4)
+        
+        self.warm_start_var = tk.BooleanVar(value=False)
+        warm_start_check = tk.Checkbutton(warm_start_frame, text="Continuar desde los últimos pesos guardados del caso",
+                                          variable=self.warm_start_var, font=("Arial", 9), bg=COLOR_LIGHT_BG, fg=COLOR_PRIMARY,
+                                          activebackground=COLOR_LIGHT_BG, anchor='w')
+        warm_start_check.pack(side=tk.LEFT)
+        
         # Case selection card with improved style
         case_card = tk.Frame(left_column, bg=COLOR_LIGHT_BG, bd=1, relief=tk.SOLID, highlightbackground=COLOR_BORDER, highlightthickness=1)
         case_card.pack(fill='x', pady=(0, 8), ipady=5)
@@ -373,10 +393,21 @@ class ConfigView:
             # Ocultar el frame de referencia cuando se seleccionan todos los casos
             self.case_reference_frame.pack_forget()
             self.case_description_label.config(text=description)
+        elif selected_case:
+            # Casos descubiertos en la carpeta de datos sin descripción predefinida
+            reference = f"{selected_case}: Cargue los datos para ver sus patrones"
+            self.case_reference_frame.pack(fill='x', pady=5)
+            self.case_reference_label.config(text=reference)
         else:
             description = "Seleccione un caso para ver su descripción"
             self.case_reference_frame.pack_forget()
     
+    def set_case_names(self, case_names):
+        """Fill the case selector with the cases discovered in the data directory"""
+        self.case_combo['values'] = list(case_names) + ["Todos los casos"]
+        self.case_combo.current(0)
+        self.update_case_info()
+    
     def update_case_reference(self, case_name, inputs, outputs):
         """Update the case reference with actual data loaded from file"""
         if inputs is None or outputs is None:
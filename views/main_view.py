@@ -1,12 +1,13 @@
 import tkinter as tk
 from tkinter import ttk
-import time
 from utils.ui_components import (COLOR_BG, COLOR_PRIMARY, COLOR_TEXT, COLOR_LIGHT_BG, 
-                           COLOR_TEXT_SECONDARY, COLOR_BORDER)
-from PIL import Image, ImageTk
+                           COLOR_TEXT_SECONDARY, COLOR_BORDER, LazyNotebook)
 import os
 import sys
 
+# Carpeta donde se guarda el logo ya redimensionado entre ejecuciones
+LOGO_CACHE_DIR = os.path.join("resultados", ".cache")
+
 class MainView:
   def __init__(self, root):
       self.root = root
@@ -73,8 +74,8 @@ class MainView:
       # Crear encabezado
       self.create_header()
       
-      # Crear pestañas con estilo mejorado
-      self.notebook = ttk.Notebook(self.main_frame)
+      # Crear pestañas con estilo mejorado (el contenido de cada una se construye al visitarla)
+      self.notebook = LazyNotebook(self.main_frame)
       self.notebook.pack(fill='both', expand=True, padx=5, pady=10)
       
       # Añadir información de autores
@@ -111,6 +112,26 @@ class MainView:
 
       return os.path.join(base_path, ruta_archivo)
 
+  def cargar_logo(self, image_path, ancho, alto):
+      """Carga el logo redimensionado desde la caché; PIL solo se importa si hay que regenerarla"""
+      nombre = os.path.splitext(os.path.basename(image_path))[0]
+      cache_path = os.path.join(LOGO_CACHE_DIR, f"{nombre}_{ancho}x{alto}.png")
+
+      # La caché es válida mientras sea más reciente que la imagen original
+      if not (os.path.exists(cache_path)
+              and os.path.getmtime(cache_path) >= os.path.getmtime(image_path)):
+          from PIL import Image
+          image = Image.open(image_path)
+          image = image.resize((ancho, alto), Image.LANCZOS)
+          os.makedirs(LOGO_CACHE_DIR, exist_ok=True)
+
+          # Escribir en un archivo temporal para no dejar una caché a medias
+          temp_path = cache_path + ".tmp"
+          image.save(temp_path, format="PNG")
+          os.replace(temp_path, cache_path)
+
+      return tk.PhotoImage(file=cache_path)
+
   def create_header(self):
       # Crear un marco para el encabezado con borde inferior sutil
       header_frame = tk.Frame(self.main_frame, bg=COLOR_LIGHT_BG, height=80)  # Reducir altura
@@ -133,10 +154,8 @@ class MainView:
               # Obtener la ruta de la imagen de manera segura
               image_path = self.obtener_ruta_relativa(os.path.join("utils", "Images", "escudo_udec.png"))
               
-              # Cargar y redimensionar la imagen
-              image = Image.open(image_path)
-              image = image.resize((logo_with, logo_height), Image.LANCZOS)
-              logo_img = ImageTk.PhotoImage(image)
+              # Cargar la imagen redimensionada
+              logo_img = self.cargar_logo(image_path, logo_with, logo_height)
 
               # Crear un Label con la imagen
               logo_label = tk.Label(logo_frame, image=logo_img, bg=COLOR_LIGHT_BG)
@@ -1,18 +1,25 @@
 import tkinter as tk
 from tkinter import ttk, filedialog
 import numpy as np
-import matplotlib
-matplotlib.use("TkAgg")
-import matplotlib.pyplot as plt
-from matplotlib.figure import Figure
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from utils.figure_pool import FigurePool
 from utils.ui_components import (COLOR_BG, COLOR_LIGHT_BG, COLOR_PRIMARY, COLOR_TEXT, 
                          COLOR_SECONDARY, COLOR_ACCENT_RED, COLOR_TEXT_SECONDARY, COLOR_BORDER, ModernButton)
-import pandas as pd
+
+# Quiet time after the last edit of a weight field before the what-if prediction runs
+WHATIF_DEBOUNCE_MS = 300
+
+# Rows of the batch results table rendered at a time
+BATCH_PAGE_SIZE = 100
+
+# Longest text shown for the inputs of a row in the batch results table
+BATCH_INPUTS_WIDTH = 40
 
 class TestView:
-    def __init__(self, parent_frame):
+    def __init__(self, parent_frame, figure_pool=None):
         self.parent = parent_frame
+        
+        # Owner of every figure drawn by this view
+        self.figure_pool = figure_pool or FigurePool()
         self.setup_test_tab()
         
     def setup_test_tab(self):
@@ -127,6 +134,20 @@ class TestView:
                                      bg=COLOR_LIGHT_BG, fg=COLOR_TEXT_SECONDARY, font=("Arial", 8))
         self.weights_placeholder.pack(pady=3)
         
+        # Live what-if mode: edits to the weights re-score the training set of the case
+        whatif_frame = tk.Frame(weights_content, bg=COLOR_LIGHT_BG)
+        whatif_frame.pack(fill='x', pady=3)
+        
+        self.whatif_var = tk.BooleanVar(value=False)
+        whatif_check = tk.Checkbutton(whatif_frame, text="Predicción en vivo al editar los pesos", 
+                                variable=self.whatif_var, command=self.on_weight_edited,
+                                bg=COLOR_LIGHT_BG, fg=COLOR_PRIMARY, activebackground=COLOR_LIGHT_BG,
+                                font=("Arial", 8))
+        whatif_check.pack(anchor='w')
+        
+        self.whatif_label = tk.Label(whatif_frame, text="", bg=COLOR_LIGHT_BG, fg=COLOR_TEXT, font=("Arial", 8))
+        self.whatif_label.pack(anchor='w')
+        
         # Dynamically created input fields (will be updated after case selection)
         self.test_entries_frame = tk.Frame(test_input_content, bg=COLOR_LIGHT_BG)
         self.test_entries_frame.pack(fill='x', pady=3)  # Reducido padding
@@ -174,6 +195,66 @@ class TestView:
                                     bg=COLOR_LIGHT_BG, fg=COLOR_TEXT, font=("Arial", 8))  # Reducido tamaño
         self.test_result_label.pack(pady=3)  # Reducido padding
         
+        # Batch test card with improved style
+        self.batch_card = tk.Frame(self.test_content_frame, bg=COLOR_LIGHT_BG, bd=1, relief=tk.SOLID, highlightbackground=COLOR_BORDER, highlightthickness=1)
+        self.batch_card.pack(fill='x', pady=3)
+        
+        # Card header with improved style
+        batch_header = tk.Frame(self.batch_card, bg=COLOR_PRIMARY, height=25)
+        batch_header.pack(fill='x')
+        
+        batch_title = tk.Label(batch_header, text="Prueba por Lotes", 
+                           font=("Arial", 10, "bold"), bg=COLOR_PRIMARY, fg="white", padx=8, pady=3)
+        batch_title.pack(anchor='w')
+        
+        # Card content with improved style
+        batch_content = tk.Frame(self.batch_card, bg=COLOR_LIGHT_BG, padx=10, pady=5)
+        batch_content.pack(fill='x')
+        
+        self.load_batch_button = ModernButton(
+            batch_content, 
+            text="Probar Archivo (CSV o .npy)", 
+            bg=COLOR_SECONDARY, 
+            fg=COLOR_PRIMARY, 
+            font=("Arial", 9, "bold"),
+            hover_bg=COLOR_PRIMARY,
+            hover_fg="white",
+            padx=10,
+            pady=3
+        )
+        self.load_batch_button.pack(anchor='w', pady=3)
+        
+        # Aggregate metrics of the batch
+        self.batch_metrics_label = tk.Label(batch_content, 
+                                      text="Seleccione un caso entrenado y un archivo con un patrón por fila", 
+                                      bg=COLOR_LIGHT_BG, fg=COLOR_TEXT_SECONDARY, font=("Arial", 8), justify=tk.LEFT)
+        self.batch_metrics_label.pack(anchor='w', pady=3)
+        
+        # Results table; only the rows of the current page are inserted
+        columns = ("patron", "entradas", "deseada", "obtenida", "error")
+        self.batch_table = ttk.Treeview(batch_content, columns=columns, show='headings', height=10)
+        for column, heading, width in zip(columns, ("#", "Entradas", "Deseada", "Obtenida", "Error"), (60, 220, 80, 80, 80)):
+            self.batch_table.heading(column, text=heading)
+            self.batch_table.column(column, width=width, anchor='center')
+        self.batch_table.pack(fill='x', pady=3)
+        
+        # Page navigation
+        batch_nav = tk.Frame(batch_content, bg=COLOR_LIGHT_BG)
+        batch_nav.pack(fill='x')
+        
+        self.batch_prev_button = ModernButton(batch_nav, text="< Anterior", bg=COLOR_PRIMARY, fg="white",
+                                              hover_bg=COLOR_SECONDARY, hover_fg=COLOR_PRIMARY, padx=8, pady=2,
+                                              state=tk.DISABLED, command=lambda: self.show_batch_page(self.batch_page - 1))
+        self.batch_prev_button.pack(side=tk.LEFT)
+        
+        self.batch_page_label = tk.Label(batch_nav, text="", bg=COLOR_LIGHT_BG, fg=COLOR_TEXT_SECONDARY, font=("Arial", 8))
+        self.batch_page_label.pack(side=tk.LEFT, expand=True)
+        
+        self.batch_next_button = ModernButton(batch_nav, text="Siguiente >", bg=COLOR_PRIMARY, fg="white",
+                                              hover_bg=COLOR_SECONDARY, hover_fg=COLOR_PRIMARY, padx=8, pady=2,
+                                              state=tk.DISABLED, command=lambda: self.show_batch_page(self.batch_page + 1))
+        self.batch_next_button.pack(side=tk.RIGHT)
+        
         # Visualization card with improved style
         self.visualization_card = tk.Frame(self.test_content_frame, bg=COLOR_LIGHT_BG, bd=1, relief=tk.SOLID, highlightbackground=COLOR_BORDER, highlightthickness=1)
         self.visualization_card.pack(fill='x', pady=3, expand=True)  # Reducido padding
@@ -206,6 +287,21 @@ class TestView:
         self.test_entry_vars = []
         self.weight_vars = []
         self.bias_var = None
+        
+        # Adaline diagrams built so far, keyed by number of inputs
+        self.diagrams = {}
+        self.visualization_placeholder = None
+        
+        # Called after the weight fields stop changing while the what-if mode is on
+        self.weights_changed_command = None
+        self.whatif_after_id = None
+        self.updating_weight_fields = False
+        
+        # Results of the last batch test
+        self.batch_inputs = None
+        self.batch_desired = None
+        self.batch_predictions = None
+        self.batch_page = 0
 
     def _on_mousewheel(self, event):
         """Handle mousewheel scrolling"""
@@ -260,6 +356,7 @@ class TestView:
             label.pack(side=tk.LEFT, padx=3)
             
             var = tk.StringVar(value="0.0")
+            var.trace_add('write', self.on_weight_edited)
             entry = tk.Entry(weight_frame, textvariable=var, width=10, font=("Arial", 9),
                        bd=1, relief=tk.SOLID)
             entry.pack(side=tk.LEFT, padx=3)
@@ -276,6 +373,7 @@ class TestView:
         bias_label.pack(side=tk.LEFT, padx=3)
         
         self.bias_var = tk.StringVar(value="0.0")
+        self.bias_var.trace_add('write', self.on_weight_edited)
         bias_entry = tk.Entry(bias_frame, textvariable=self.bias_var, width=10, font=("Arial", 9),
                         bd=1, relief=tk.SOLID)
         bias_entry.pack(side=tk.LEFT, padx=3)
@@ -294,22 +392,54 @@ class TestView:
         if len(self.weight_vars) != len(weights):
             return
         
-        # Update weight values
-        for i, weight in enumerate(weights):
-            self.weight_vars[i].set(f"{weight:.6f}")
-        
-        # Update bias value
-        self.bias_var.set(f"{bias:.6f}")
+        # Values set here are not user edits, so they do not trigger the what-if mode
+        self.updating_weight_fields = True
+        try:
+            # Update weight values
+            for i, weight in enumerate(weights):
+                self.weight_vars[i].set(f"{weight:.6f}")
+            
+            # Update bias value
+            self.bias_var.set(f"{bias:.6f}")
+        finally:
+            self.updating_weight_fields = False
     
     def clear_weights_fields(self):
         """Clear all weight fields"""
-        # Set default values for weights
-        for var in self.weight_vars:
-            var.set("0.0")
+        self.updating_weight_fields = True
+        try:
+            # Set default values for weights
+            for var in self.weight_vars:
+                var.set("0.0")
+            
+            # Set default value for bias
+            if self.bias_var:
+                self.bias_var.set("0.0")
+        finally:
+            self.updating_weight_fields = False
+    
+    def on_weight_edited(self, *args):
+        """Schedule a what-if prediction, replacing the one still waiting from an earlier keystroke"""
+        if self.updating_weight_fields or self.weights_changed_command is None:
+            return
         
-        # Set default value for bias
-        if self.bias_var:
-            self.bias_var.set("0.0")
+        if self.whatif_after_id is not None:
+            self.weights_frame.after_cancel(self.whatif_after_id)
+            self.whatif_after_id = None
+        
+        if self.whatif_var.get():
+            self.whatif_after_id = self.weights_frame.after(WHATIF_DEBOUNCE_MS, self.run_whatif)
+        else:
+            self.whatif_label.config(text="")
+    
+    def run_whatif(self):
+        self.whatif_after_id = None
+        if self.whatif_var.get():
+            self.weights_changed_command()
+    
+    def show_whatif_result(self, text):
+        """Show the result of the last what-if prediction"""
+        self.whatif_label.config(text=text)
     
     def get_weights_and_bias(self):
         """Get the current weights and bias from the UI"""
@@ -333,18 +463,71 @@ class TestView:
         input_str = ", ".join([str(int(v)) for v in input_values])
         self.test_result_label.config(text=f"Entrada: [{input_str}] → Salida: {prediction:.4f}")
         
-    def draw_adaline_visualization(self, inputs, weights, bias, prediction):
-        """Draw an interactive visualization of the Adaline process with improved professional design"""
-        # Clear existing visualization
-        for widget in self.process_visualization_frame.winfo_children():
-            widget.destroy()
+    def show_batch_results(self, inputs, desired_outputs, predictions, metrics):
+        """Show the metrics of a batch test and the first page of its results"""
+        self.batch_inputs = inputs
+        self.batch_desired = desired_outputs
+        self.batch_predictions = predictions
         
-        # Create a figure for the visualization
-        fig = Figure(figsize=(7, 4), dpi=100, facecolor=COLOR_LIGHT_BG)  # Reducido tamaño
-        ax = fig.add_subplot(111)
+        summary = f"Patrones: {metrics['patterns']}    Salida media: {metrics['mean_output']:.4f}"
+        if 'mse' in metrics:
+            summary += (f"\nECM: {metrics['mse']:.6f}    Error absoluto medio: {metrics['mae']:.6f}    "
+                        f"Error máximo: {metrics['max_error']:.6f}    Aciertos: {metrics['hits'] * 100:.2f}%")
+        self.batch_metrics_label.config(text=summary, fg=COLOR_TEXT)
         
-        # Number of inputs
-        n_inputs = len(inputs)
+        self.show_batch_page(0)
+    
+    def show_batch_page(self, page):
+        """Fill the results table with one page of the last batch test"""
+        n_rows = len(self.batch_predictions)
+        n_pages = max(1, -(-n_rows // BATCH_PAGE_SIZE))
+        self.batch_page = min(max(page, 0), n_pages - 1)
+        
+        start = self.batch_page * BATCH_PAGE_SIZE
+        stop = min(start + BATCH_PAGE_SIZE, n_rows)
+        
+        # Only the visible rows are formatted and inserted
+        inputs = np.asarray(self.batch_inputs[start:stop])
+        predictions = self.batch_predictions[start:stop]
+        desired = self.batch_desired[start:stop] if self.batch_desired is not None else None
+        
+        self.batch_table.delete(*self.batch_table.get_children())
+        for i in range(stop - start):
+            input_text = " ".join(f"{value:g}" for value in inputs[i])
+            if len(input_text) > BATCH_INPUTS_WIDTH:
+                input_text = input_text[:BATCH_INPUTS_WIDTH - 3] + "..."
+            
+            if desired is not None:
+                desired_text = f"{desired[i]:.4f}"
+                error_text = f"{abs(desired[i] - predictions[i]):.4f}"
+            else:
+                desired_text = error_text = "-"
+            
+            self.batch_table.insert('', 'end', values=(start + i + 1, input_text, desired_text,
+                                                       f"{predictions[i]:.4f}", error_text))
+        
+        self.batch_page_label.config(text=f"Página {self.batch_page + 1} de {n_pages} (filas {start + 1 if stop else 0}-{stop} de {n_rows})")
+        self.batch_prev_button.config(state=tk.NORMAL if self.batch_page > 0 else tk.DISABLED)
+        self.batch_next_button.config(state=tk.NORMAL if self.batch_page < n_pages - 1 else tk.DISABLED)
+    
+    def show_visualization_placeholder(self, text):
+        """Hide the Adaline diagram and show a message in its place"""
+        for diagram in self.diagrams.values():
+            diagram['canvas'].get_tk_widget().pack_forget()
+        
+        if self.visualization_placeholder is None:
+            self.visualization_placeholder = tk.Label(self.process_visualization_frame, 
+                                                      bg=COLOR_LIGHT_BG, fg=COLOR_TEXT_SECONDARY, font=("Arial", 9))
+        self.visualization_placeholder.config(text=text)
+        self.visualization_placeholder.pack(expand=True, pady=15)
+    
+    def create_adaline_diagram(self, n_inputs):
+        """Build the Adaline diagram for a number of inputs; only its value labels change afterwards"""
+        # Create a figure for the visualization (matplotlib is loaded with the first figure)
+        key = ('test', n_inputs)
+        fig = self.figure_pool.figure(key, figsize=(7, 4), dpi=100, facecolor=COLOR_LIGHT_BG)  # Reducido tamaño
+        from matplotlib.patches import Circle, Rectangle
+        ax = fig.add_subplot(111)
         
         # Create positions for the visualization elements
         input_x = 0.2
@@ -355,7 +538,7 @@ class TestView:
         input_positions = np.linspace(0.2, 0.8, n_inputs)
         
         # Draw a professional background
-        ax.add_patch(plt.Rectangle((0.05, 0.05), 0.9, 0.9, fill=True, color='#f8f9fa', alpha=0.5, zorder=1))
+        ax.add_patch(Rectangle((0.05, 0.05), 0.9, 0.9, fill=True, color='#f8f9fa', alpha=0.5, zorder=1))
         
         # Add title
         ax.text(0.5, 0.95, "Modelo Adaline - Flujo de Procesamiento", 
@@ -363,15 +546,17 @@ class TestView:
               bbox=dict(facecolor=COLOR_LIGHT_BG, alpha=0.9, boxstyle='round,pad=0.3', edgecolor=COLOR_BORDER))  # Reducido padding
         
         # Draw inputs with improved style
-        for i, (pos, val) in enumerate(zip(input_positions, inputs)):
+        input_texts = []
+        weight_texts = []
+        for pos in input_positions:
             # Input node with gradient fill
-            circle = plt.Circle((input_x, pos), 0.04, color=COLOR_LIGHT_BG, ec=COLOR_PRIMARY, lw=1.5, zorder=10)  # Reducido tamaño y grosor
+            circle = Circle((input_x, pos), 0.04, color=COLOR_LIGHT_BG, ec=COLOR_PRIMARY, lw=1.5, zorder=10)  # Reducido tamaño y grosor
             ax.add_patch(circle)
             
             # Input label with better styling
-            ax.text(input_x - 0.08, pos, f"X{i+1} = {val}", ha='right', va='center', 
+            input_texts.append(ax.text(input_x - 0.08, pos, "", ha='right', va='center', 
                   fontsize=9, color=COLOR_TEXT, fontweight='bold',  # Reducido tamaño
-                  bbox=dict(facecolor=COLOR_LIGHT_BG, alpha=0.7, boxstyle='round,pad=0.2', edgecolor=COLOR_BORDER))  # Reducido padding
+                  bbox=dict(facecolor=COLOR_LIGHT_BG, alpha=0.7, boxstyle='round,pad=0.2', edgecolor=COLOR_BORDER)))  # Reducido padding
             
             # Connection line to neuron with gradient
             ax.plot([input_x + 0.04, neuron_x - 0.06], [pos, 0.5], 
@@ -380,13 +565,13 @@ class TestView:
             # Weight label with improved styling
             midx = (input_x + 0.04 + neuron_x - 0.06) / 2
             midy = (pos + 0.5) / 2
-            ax.text(midx, midy + 0.02, f"w{i+1} = {weights[i]:.4f}", 
+            weight_texts.append(ax.text(midx, midy + 0.02, "", 
                   ha='center', va='center', fontsize=8, color=COLOR_TEXT,  # Reducido tamaño
-                  bbox=dict(facecolor=COLOR_LIGHT_BG, alpha=0.9, boxstyle='round,pad=0.2', edgecolor=COLOR_BORDER))  # Reducido padding
+                  bbox=dict(facecolor=COLOR_LIGHT_BG, alpha=0.9, boxstyle='round,pad=0.2', edgecolor=COLOR_BORDER)))  # Reducido padding
         
         # Draw bias with improved styling
         bias_y = 0.9
-        ax.text(neuron_x - 0.12, bias_y, f"Bias = {bias:.4f}", ha='right', va='center', 
+        bias_text = ax.text(neuron_x - 0.12, bias_y, "", ha='right', va='center', 
               fontsize=9, color=COLOR_TEXT, fontweight='bold',  # Reducido tamaño
               bbox=dict(facecolor=COLOR_LIGHT_BG, alpha=0.7, boxstyle='round,pad=0.2', edgecolor=COLOR_BORDER))  # Reducido padding
         
@@ -394,40 +579,32 @@ class TestView:
               color=COLOR_PRIMARY, lw=1.5, zorder=5, alpha=0.8)  # Reducido grosor
         
         # Draw neuron with improved styling
-        neuron_circle = plt.Circle((neuron_x, 0.5), 0.06, color=COLOR_LIGHT_BG, ec=COLOR_PRIMARY, lw=2, zorder=10)  # Reducido tamaño
+        neuron_circle = Circle((neuron_x, 0.5), 0.06, color=COLOR_LIGHT_BG, ec=COLOR_PRIMARY, lw=2, zorder=10)  # Reducido tamaño
         ax.add_patch(neuron_circle)
         ax.text(neuron_x, 0.5, "Σ", ha='center', va='center', fontsize=14, color=COLOR_PRIMARY, fontweight='bold')  # Reducido tamaño
         
         # Add a subtle glow effect around the neuron
         for r in np.linspace(0.07, 0.09, 2):  # Reducido tamaño y número
-            glow_circle = plt.Circle((neuron_x, 0.5), r, color=COLOR_PRIMARY, alpha=0.1, zorder=9)
+            glow_circle = Circle((neuron_x, 0.5), r, color=COLOR_PRIMARY, alpha=0.1, zorder=9)
             ax.add_patch(glow_circle)
         
         # Draw output with improved styling
         ax.plot([neuron_x + 0.06, output_x - 0.04], [0.5, 0.5], 
               color=COLOR_PRIMARY, lw=1.5, zorder=5, alpha=0.8)  # Reducido grosor
         
-        output_circle = plt.Circle((output_x, 0.5), 0.04, color=COLOR_PRIMARY, ec=COLOR_PRIMARY, lw=1.5, zorder=10)  # Reducido tamaño y grosor
+        output_circle = Circle((output_x, 0.5), 0.04, color=COLOR_PRIMARY, ec=COLOR_PRIMARY, lw=1.5, zorder=10)  # Reducido tamaño y grosor
         ax.add_patch(output_circle)
         
         # Add a subtle glow effect around the output
         for r in np.linspace(0.05, 0.07, 2):  # Reducido tamaño y número
-            glow_circle = plt.Circle((output_x, 0.5), r, color=COLOR_PRIMARY, alpha=0.1, zorder=9)
+            glow_circle = Circle((output_x, 0.5), r, color=COLOR_PRIMARY, alpha=0.1, zorder=9)
             ax.add_patch(glow_circle)
         
-        ax.text(output_x, 0.5, f"{prediction:.2f}", ha='center', va='center', fontsize=8, color='white', fontweight='bold')  # Reducido tamaño
+        output_text = ax.text(output_x, 0.5, "", ha='center', va='center', fontsize=8, color='white', fontweight='bold')  # Reducido tamaño
         ax.text(output_x + 0.08, 0.5, "Salida", ha='left', va='center', fontsize=9, color=COLOR_TEXT, fontweight='bold')  # Reducido tamaño
         
-        # Calculate and display the weighted sum with improved styling
-        weighted_sum = np.dot(inputs, weights) + bias
-        sum_text = f"Σ = "
-        for i, (input_val, weight) in enumerate(zip(inputs, weights)):
-            if i > 0:
-                sum_text += " + "
-            sum_text += f"({input_val} × {weight:.4f})"
-        sum_text += f" + {bias:.4f} = {weighted_sum:.4f}"
-        
-        ax.text(0.5, 0.15, sum_text, ha='center', va='center', fontsize=9, color=COLOR_TEXT,  # Reducido tamaño
+        # Weighted sum with improved styling
+        sum_text = ax.text(0.5, 0.15, "", ha='center', va='center', fontsize=9, color=COLOR_TEXT,  # Reducido tamaño
               bbox=dict(facecolor=COLOR_LIGHT_BG, alpha=0.9, boxstyle='round,pad=0.3', edgecolor=COLOR_BORDER))  # Reducido padding
         
         # Add a formula explanation
@@ -440,7 +617,48 @@ class TestView:
         ax.axis('off')
         
         # Add the plot to the frame
-        canvas = FigureCanvasTkAgg(fig, master=self.process_visualization_frame)
-        canvas.draw()
-        canvas_widget = canvas.get_tk_widget()
-        canvas_widget.pack(fill='both', expand=True)
\ No newline at end of file
+        canvas = self.figure_pool.attach(key, self.process_visualization_frame)
+        
+        self.diagrams[n_inputs] = {
+            'figure': fig,
+            'canvas': canvas,
+            'input_texts': input_texts,
+            'weight_texts': weight_texts,
+            'bias_text': bias_text,
+            'output_text': output_text,
+            'sum_text': sum_text
+        }
+        return self.diagrams[n_inputs]
+    
+    def draw_adaline_visualization(self, inputs, weights, bias, prediction):
+        """Draw an interactive visualization of the Adaline process with improved professional design"""
+        n_inputs = len(inputs)
+        
+        # Reuse the diagram for this number of inputs while the pool still holds its figure
+        diagram = self.diagrams.get(n_inputs)
+        if diagram is None or self.figure_pool.get(('test', n_inputs)) is not diagram['figure']:
+            diagram = self.create_adaline_diagram(n_inputs)
+        
+        # Update the value labels only
+        for i, (input_val, weight) in enumerate(zip(inputs, weights)):
+            diagram['input_texts'][i].set_text(f"X{i+1} = {input_val}")
+            diagram['weight_texts'][i].set_text(f"w{i+1} = {weight:.4f}")
+        diagram['bias_text'].set_text(f"Bias = {bias:.4f}")
+        diagram['output_text'].set_text(f"{prediction:.2f}")
+        
+        # Calculate and display the weighted sum
+        weighted_sum = np.dot(inputs, weights) + bias
+        terms = " + ".join(f"({input_val} × {weight:.4f})" for input_val, weight in zip(inputs, weights))
+        diagram['sum_text'].set_text(f"Σ = {terms} + {bias:.4f} = {weighted_sum:.4f}")
+        
+        # Show this diagram in place of the placeholder or of a diagram with another number of inputs
+        if self.visualization_placeholder is not None:
+            self.visualization_placeholder.pack_forget()
+        for other_inputs, other in self.diagrams.items():
+            if other_inputs != n_inputs:
+                other['canvas'].get_tk_widget().pack_forget()
+        
+        canvas_widget = diagram['canvas'].get_tk_widget()
+        if not canvas_widget.winfo_manager():
+            canvas_widget.pack(fill='both', expand=True)
+        diagram['canvas'].draw_idle()
\ No newline at end of file
@@ -1,18 +1,40 @@
 import tkinter as tk
 import numpy as np
-import matplotlib
-matplotlib.use("TkAgg")
-from matplotlib.figure import Figure
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
-from utils.ui_components import COLOR_BG, COLOR_PRIMARY, COLOR_TEXT, COLOR_LIGHT_BG, COLOR_TEXT_SECONDARY, COLOR_BORDER, COLOR_SECONDARY, COLOR_ACCENT_BLUE
+from utils.downsampling import DecimatedLine, plot_decimated
+from utils.aggregation import percentile_bands, residual_histogram, joint_histogram
+from utils.figure_pool import FigurePool
+from utils.ui_components import COLOR_BG, COLOR_PRIMARY, COLOR_TEXT, COLOR_LIGHT_BG, COLOR_TEXT_SECONDARY, COLOR_BORDER, COLOR_SECONDARY, COLOR_ACCENT_BLUE, LazyNotebook
 from tkinter import ttk
+import queue
+
+# Minimum time between two frames of the live error curve (caps it at ~20 fps)
+LIVE_FRAME_INTERVAL_MS = 50
+
+# Above this many patterns the obtained outputs are drawn as aggregated views instead of one marker and bar per pattern
+AGGREGATE_MIN_ROWS = 2000
 
 class VisualizationView:
-    def __init__(self, error_frame, desired_frame, obtained_frame):
+    def __init__(self, error_frame, desired_frame, obtained_frame, figure_pool=None):
         self.error_frame = error_frame
         self.desired_frame = desired_frame
         self.obtained_frame = obtained_frame
         
+        # Owner of every figure drawn by this view
+        self.figure_pool = figure_pool or FigurePool()
+        
+        # Figures for the single-case views, built once and reused on every update
+        self.error_canvas = None
+        self.obtained_canvas = None
+        self.obtained_aggregated = False
+        
+        # State of the live error curve shown while training
+        self.live_queue = None
+        self.live_errors = []
+        self.live_max_error = 0.0
+        self.live_background = None
+        self.live_draw_cid = None
+        self.live_after_id = None
+        
         # Initialize the frames with placeholders
         self.setup_error_frame()
         if self.desired_frame:  # Solo inicializar si existe
@@ -38,114 +60,215 @@ class VisualizationView:
         # Frame for the plot with improved style
         self.error_plot_frame = tk.Frame(self.error_container, bg=COLOR_BG, bd=1, relief=tk.SOLID, highlightbackground=COLOR_BORDER, highlightthickness=1)
     
-    def update_error_graph(self, error_history, case_name=None):
-        """Plot the error vs epochs graph after training with improved style"""
-        # Clear any existing plot
+    def attach_canvas(self, key, master):
+        """Embed the pooled figure under key in a frame with its navigation toolbar"""
+        canvas = self.figure_pool.attach(key, master)
+        canvas_widget = canvas.get_tk_widget()
+        canvas_widget.pack(fill='both', expand=True)
+        
+        # Add toolbar for navigation with improved style
+        toolbar_frame = tk.Frame(master, bg=COLOR_LIGHT_BG)
+        toolbar_frame.pack(side=tk.BOTTOM, fill=tk.X)
+        toolbar = self.figure_pool.attach_toolbar(key, toolbar_frame)
+        toolbar.update()
+        
+        # Add a border at the top of the toolbar
+        border = tk.Frame(toolbar_frame, height=1, bg=COLOR_BORDER)
+        border.pack(fill='x', side=tk.TOP)
+        
+        return canvas, toolbar
+    
+    def create_error_figure(self):
+        """Create the error vs epochs figure, its line artist and canvas"""
+        # Clear the multiple-case notebook if it is being shown
+        self.figure_pool.release_group('error')
         for widget in self.error_plot_frame.winfo_children():
             widget.destroy()
         
+        # Create the figure with improved style
+        self.error_figure = self.figure_pool.figure(('error', None), figsize=(8, 4), dpi=100, facecolor=COLOR_LIGHT_BG)  # Reducido tamaño
+        self.error_ax = self.error_figure.add_subplot(111)
+        
+        # Line artist whose data is replaced on every update, decimated to the canvas width
+        self.error_line, = self.error_ax.plot([], [], color=COLOR_PRIMARY, linewidth=2)
+        self.error_decimated = DecimatedLine(self.error_line)
+        
+        self.error_ax.set_xlabel('Épocas', fontsize=10, color=COLOR_TEXT_SECONDARY)  # Reducido tamaño de fuente
+        self.error_ax.set_ylabel('Error Cuadrático Medio', fontsize=10, color=COLOR_TEXT_SECONDARY)  # Reducido tamaño de fuente
+        self.error_ax.grid(True, linestyle='--', alpha=0.7)
+        self.error_ax.tick_params(colors=COLOR_TEXT_SECONDARY, labelsize=8)  # Reducido tamaño de fuente
+        
+        # Set background color
+        self.error_ax.set_facecolor(COLOR_LIGHT_BG)
+        
+        # Add the plot to the frame with proper expansion
+        self.error_canvas, self.error_toolbar = self.attach_canvas(('error', None), self.error_plot_frame)
+    
+    def update_error_graph(self, error_history, case_name=None):
+        """Plot the error vs epochs graph after training with improved style"""
         # Hide the placeholder message
         self.error_placeholder.pack_forget()
         self.error_plot_frame.pack(fill='both', expand=True)
         
-        # Create a new figure and plot with improved style
-        fig = Figure(figsize=(8, 4), dpi=100, facecolor=COLOR_LIGHT_BG)  # Reducido tamaño
-        ax = fig.add_subplot(111)
+        # Build the figure only the first time
+        if self.error_canvas is None:
+            self.create_error_figure()
         
-        # Plot the error history with improved style
-        ax.plot(error_history, color=COLOR_PRIMARY, linewidth=2)
+        # Swap the data of the existing line
+        self.error_decimated.set_full_data(np.arange(len(error_history)), error_history)
         
         # Set title based on case name
         title = f'Error vs Épocas - {case_name}' if case_name else 'Error vs Épocas'
-        ax.set_title(title, fontsize=12, fontweight='bold', color=COLOR_TEXT)  # Reducido tamaño de fuente
+        self.error_ax.set_title(title, fontsize=12, fontweight='bold', color=COLOR_TEXT)  # Reducido tamaño de fuente
         
-        ax.set_xlabel('Épocas', fontsize=10, color=COLOR_TEXT_SECONDARY)  # Reducido tamaño de fuente
-        ax.set_ylabel('Error Cuadrático Medio', fontsize=10, color=COLOR_TEXT_SECONDARY)  # Reducido tamaño de fuente
-        ax.grid(True, linestyle='--', alpha=0.7)
-        ax.tick_params(colors=COLOR_TEXT_SECONDARY, labelsize=8)  # Reducido tamaño de fuente
+        # Rescale to the new data and reset the toolbar's home view
+        self.error_ax.relim()
+        self.error_ax.autoscale_view()
+        self.error_toolbar.update()
+        self.error_canvas.draw_idle()
+    
+    def start_live_error_graph(self, progress_queue, case_name=None):
+        """Start drawing the error curve from the points sent by a training run"""
+        # Hide the placeholder message
+        self.error_placeholder.pack_forget()
+        self.error_plot_frame.pack(fill='both', expand=True)
         
-        # Set background color
-        ax.set_facecolor(COLOR_LIGHT_BG)
+        if self.error_canvas is None:
+            self.create_error_figure()
         
-        # Add the plot to the frame with proper expansion
-        canvas = FigureCanvasTkAgg(fig, master=self.error_plot_frame)
-        canvas.draw()
-        canvas_widget = canvas.get_tk_widget()
-        canvas_widget.pack(fill='both', expand=True)
+        self.live_queue = progress_queue
+        self.live_errors = []
+        self.live_max_error = 0.0
+        self.error_decimated.set_full_data([], [])
         
-        # Add toolbar for navigation with improved style
-        toolbar_frame = tk.Frame(self.error_plot_frame, bg=COLOR_LIGHT_BG)
-        toolbar_frame.pack(side=tk.BOTTOM, fill=tk.X)
-        toolbar = NavigationToolbar2Tk(canvas, toolbar_frame)
-        toolbar.update()
+        title = f'Error vs Épocas - {case_name} (en vivo)' if case_name else 'Error vs Épocas (en vivo)'
+        self.error_ax.set_title(title, fontsize=12, fontweight='bold', color=COLOR_TEXT)
+        self.error_ax.set_xlim(0, 100)
+        self.error_ax.set_ylim(0, 1)
         
-        # Add a border at the top of the toolbar
-        border = tk.Frame(toolbar_frame, height=1, bg=COLOR_BORDER)
-        border.pack(fill='x', side=tk.TOP)
+        # The line is drawn by blitting only, on top of a cached background
+        self.error_line.set_animated(True)
+        self.live_draw_cid = self.error_canvas.mpl_connect('draw_event', self.on_live_draw)
+        self.error_canvas.draw()
+        
+        self.live_after_id = self.error_plot_frame.after(LIVE_FRAME_INTERVAL_MS, self.poll_live_errors)
+    
+    def on_live_draw(self, event):
+        """Cache the background after every full redraw (resize, new limits)"""
+        self.live_background = self.error_canvas.copy_from_bbox(self.error_ax.bbox)
+        self.error_ax.draw_artist(self.error_line)
+    
+    def poll_live_errors(self):
+        """Take the new points from the queue and redraw only the error line"""
+        if self.live_queue is None:
+            return
+        
+        # Drain everything sent since the last frame
+        new_points = False
+        while True:
+            try:
+                errors = self.live_queue.get_nowait()
+            except queue.Empty:
+                break
+            self.live_errors.extend(errors)
+            self.live_max_error = max(self.live_max_error, max(errors))
+            new_points = True
+        
+        if new_points:
+            n_epochs = len(self.live_errors)
+            x_min, x_max = self.error_ax.get_xlim()
+            y_min, y_max = self.error_ax.get_ylim()
+            
+            if n_epochs > x_max or self.live_max_error > y_max:
+                # Grow the limits geometrically so full redraws stay rare
+                self.error_ax.set_xlim(0, max(x_max, 2 * n_epochs))
+                self.error_ax.set_ylim(0, max(y_max, 1.1 * self.live_max_error))
+                self.error_decimated.set_full_data(np.arange(n_epochs), self.live_errors)
+                self.error_canvas.draw()
+            elif self.live_background is not None:
+                self.error_decimated.set_full_data(np.arange(n_epochs), self.live_errors)
+                self.error_canvas.restore_region(self.live_background)
+                self.error_ax.draw_artist(self.error_line)
+                self.error_canvas.blit(self.error_ax.bbox)
+        
+        self.live_after_id = self.error_plot_frame.after(LIVE_FRAME_INTERVAL_MS, self.poll_live_errors)
+    
+    def stop_live_error_graph(self):
+        """Stop the live error curve; the final curve is drawn by update_error_graph"""
+        self.live_queue = None
+        self.live_background = None
+        if self.live_after_id is not None:
+            self.error_plot_frame.after_cancel(self.live_after_id)
+            self.live_after_id = None
+        if self.live_draw_cid is not None:
+            self.error_canvas.mpl_disconnect(self.live_draw_cid)
+            self.live_draw_cid = None
+        self.error_line.set_animated(False)
     
     def update_error_graphs_multiple(self, error_histories):
         """Plot multiple error graphs for all cases"""
         # Clear any existing plot
+        self.figure_pool.release_group('error')
         for widget in self.error_plot_frame.winfo_children():
             widget.destroy()
+        self.error_canvas = None
         
         # Hide the placeholder message
         self.error_placeholder.pack_forget()
         self.error_plot_frame.pack(fill='both', expand=True)
         
-        # Create a notebook for multiple tabs
-        notebook = ttk.Notebook(self.error_plot_frame)
+        # Create a notebook for multiple tabs; each tab is drawn the first time it is shown
+        notebook = LazyNotebook(self.error_plot_frame)
         notebook.pack(fill='both', expand=True)
         
         # Add a tab for each case
         for case_name, error_history in error_histories.items():
-            # Create a frame for this case
             case_frame = tk.Frame(notebook, bg=COLOR_LIGHT_BG)
-            notebook.add(case_frame, text=case_name)
-            
-            # Create a figure for this case
-            fig = Figure(figsize=(8, 4), dpi=100, facecolor=COLOR_LIGHT_BG)  # Reducido tamaño
-            ax = fig.add_subplot(111)
-            
-            # Plot the error history
-            ax.plot(error_history, color=COLOR_PRIMARY, linewidth=2)
-            ax.set_title(f'Error vs Épocas - {case_name}', fontsize=12, fontweight='bold', color=COLOR_TEXT)  # Reducido tamaño de fuente
-            ax.set_xlabel('Épocas', fontsize=10, color=COLOR_TEXT_SECONDARY)  # Reducido tamaño de fuente
-            ax.set_ylabel('Error Cuadrático Medio', fontsize=10, color=COLOR_TEXT_SECONDARY)  # Reducido tamaño de fuente
-            ax.grid(True, linestyle='--', alpha=0.7)
-            ax.tick_params(colors=COLOR_TEXT_SECONDARY, labelsize=8)  # Reducido tamaño de fuente
-            
-            # Set background color
-            ax.set_facecolor(COLOR_LIGHT_BG)
-            
-            # Add the plot to the frame with proper expansion
-            canvas = FigureCanvasTkAgg(fig, master=case_frame)
-            canvas.draw()
-            canvas_widget = canvas.get_tk_widget()
-            canvas_widget.pack(fill='both', expand=True)
-            
-            # Add toolbar for navigation with improved style
-            toolbar_frame = tk.Frame(case_frame, bg=COLOR_LIGHT_BG)
-            toolbar_frame.pack(side=tk.BOTTOM, fill=tk.X)
-            toolbar = NavigationToolbar2Tk(canvas, toolbar_frame)
-            toolbar.update()
-            
-            # Add a border at the top of the toolbar
-            border = tk.Frame(toolbar_frame, height=1, bg=COLOR_BORDER)
-            border.pack(fill='x', side=tk.TOP)
+            notebook.add_lazy(case_frame,
+                              lambda frame, case_name=case_name, error_history=error_history:
+                                  self.render_case_error_graph(frame, case_name, error_history),
+                              text=case_name)
         
         # Add a tab for combined view
         combined_frame = tk.Frame(notebook, bg=COLOR_LIGHT_BG)
-        notebook.add(combined_frame, text="Vista Combinada")
+        notebook.add_lazy(combined_frame,
+                          lambda frame: self.render_combined_error_graph(frame, error_histories),
+                          text="Vista Combinada")
+        
+        # Draw the tab shown first
+        notebook.render_selected()
+    
+    def render_case_error_graph(self, case_frame, case_name, error_history):
+        """Draw the error graph of one case inside its notebook tab"""
+        # Create a figure for this case
+        fig = self.figure_pool.figure(('error', case_name), figsize=(8, 4), dpi=100, facecolor=COLOR_LIGHT_BG)  # Reducido tamaño
+        ax = fig.add_subplot(111)
+        
+        # Plot the error history (decimated, re-sampled on zoom)
+        plot_decimated(ax, error_history, color=COLOR_PRIMARY, linewidth=2)
+        ax.set_title(f'Error vs Épocas - {case_name}', fontsize=12, fontweight='bold', color=COLOR_TEXT)  # Reducido tamaño de fuente
+        ax.set_xlabel('Épocas', fontsize=10, color=COLOR_TEXT_SECONDARY)  # Reducido tamaño de fuente
+        ax.set_ylabel('Error Cuadrático Medio', fontsize=10, color=COLOR_TEXT_SECONDARY)  # Reducido tamaño de fuente
+        ax.grid(True, linestyle='--', alpha=0.7)
+        ax.tick_params(colors=COLOR_TEXT_SECONDARY, labelsize=8)  # Reducido tamaño de fuente
+        
+        # Set background color
+        ax.set_facecolor(COLOR_LIGHT_BG)
         
+        # Add the plot to the frame with proper expansion
+        canvas, _ = self.attach_canvas(('error', case_name), case_frame)
+        canvas.draw_idle()
+    
+    def render_combined_error_graph(self, combined_frame, error_histories):
+        """Draw the error graphs of all cases together inside the combined tab"""
         # Create a figure for combined view
-        fig_combined = Figure(figsize=(8, 4), dpi=100, facecolor=COLOR_LIGHT_BG)  # Reducido tamaño
+        fig_combined = self.figure_pool.figure(('error', 'combined'), figsize=(8, 4), dpi=100, facecolor=COLOR_LIGHT_BG)  # Reducido tamaño
         ax_combined = fig_combined.add_subplot(111)
         
         # Plot all error histories
         colors = [COLOR_PRIMARY, COLOR_SECONDARY, COLOR_ACCENT_BLUE, '#FF6B6B', '#6BCB77']
         for i, (case_name, error_history) in enumerate(error_histories.items()):
-            ax_combined.plot(error_history, label=case_name, color=colors[i % len(colors)], linewidth=2)
+            plot_decimated(ax_combined, error_history, label=case_name, color=colors[i % len(colors)], linewidth=2)
         
         ax_combined.set_title('Comparación de Error vs Épocas', fontsize=12, fontweight='bold', color=COLOR_TEXT)  # Reducido tamaño de fuente
         ax_combined.set_xlabel('Épocas', fontsize=10, color=COLOR_TEXT_SECONDARY)  # Reducido tamaño de fuente
@@ -158,20 +281,8 @@ class VisualizationView:
         ax_combined.set_facecolor(COLOR_LIGHT_BG)
         
         # Add the plot to the frame with proper expansion
-        canvas_combined = FigureCanvasTkAgg(fig_combined, master=combined_frame)
-        canvas_combined.draw()
-        canvas_widget_combined = canvas_combined.get_tk_widget()
-        canvas_widget_combined.pack(fill='both', expand=True)
-        
-        # Add toolbar for navigation with improved style
-        toolbar_frame_combined = tk.Frame(combined_frame, bg=COLOR_LIGHT_BG)
-        toolbar_frame_combined.pack(side=tk.BOTTOM, fill=tk.X)
-        toolbar_combined = NavigationToolbar2Tk(canvas_combined, toolbar_frame_combined)
-        toolbar_combined.update()
-        
-        # Add a border at the top of the toolbar
-        border_combined = tk.Frame(toolbar_frame_combined, height=1, bg=COLOR_BORDER)
-        border_combined.pack(fill='x', side=tk.TOP)
+        canvas_combined, _ = self.attach_canvas(('error', 'combined'), combined_frame)
+        canvas_combined.draw_idle()
 
     def setup_desired_frame(self):
         """Set up the desired outputs tab with improved visualization"""
@@ -199,6 +310,7 @@ class VisualizationView:
     def update_desired_visualization(self, inputs, outputs, weights, bias, case_name=None):
         """Update the desired outputs visualization with gradient descent visualization"""
         # Clear any existing plot
+        self.figure_pool.release_group('desired')
         for widget in self.desired_plot_frame.winfo_children():
             widget.destroy()
         
@@ -207,7 +319,7 @@ class VisualizationView:
         self.desired_plot_frame.pack(fill='both', expand=True)
         
         # Create a new figure with improved style
-        fig = Figure(figsize=(10, 6), dpi=100, facecolor=COLOR_LIGHT_BG)
+        fig = self.figure_pool.figure(('desired', None), figsize=(10, 6), dpi=100, facecolor=COLOR_LIGHT_BG)
         
         # Create a 2x1 subplot layout
         gs = fig.add_gridspec(2, 1, height_ratios=[2, 1], hspace=0.3)
@@ -271,7 +383,7 @@ class VisualizationView:
         ax2.grid(True, linestyle='--', alpha=0.3)
         
         # Add the plot to the frame with proper expansion
-        canvas = FigureCanvasTkAgg(fig, master=self.desired_plot_frame)
+        canvas = self.figure_pool.attach(('desired', None), self.desired_plot_frame)
         canvas.draw()
         canvas_widget = canvas.get_tk_widget()
         canvas_widget.pack(fill='both', expand=True)
@@ -279,7 +391,7 @@ class VisualizationView:
         # Add toolbar for navigation with improved style
         toolbar_frame = tk.Frame(self.desired_plot_frame, bg=COLOR_LIGHT_BG)
         toolbar_frame.pack(side=tk.BOTTOM, fill=tk.X)
-        toolbar = NavigationToolbar2Tk(canvas, toolbar_frame)
+        toolbar = self.figure_pool.attach_toolbar(('desired', None), toolbar_frame)
         toolbar.update()
         
         # Add a border at the top of the toolbar
@@ -289,6 +401,7 @@ class VisualizationView:
     def update_desired_visualizations_multiple(self, cases_data):
         """Plot multiple gradient descent visualizations for all cases"""
         # Clear any existing plot
+        self.figure_pool.release_group('desired')
         for widget in self.desired_plot_frame.winfo_children():
             widget.destroy()
         
@@ -307,7 +420,7 @@ class VisualizationView:
             notebook.add(case_frame, text=case_name)
             
             # Create a figure for this case
-            fig = Figure(figsize=(10, 6), dpi=100, facecolor=COLOR_LIGHT_BG)
+            fig = self.figure_pool.figure(('desired', case_name), figsize=(10, 6), dpi=100, facecolor=COLOR_LIGHT_BG)
             
             # Create a 2x1 subplot layout
             gs = fig.add_gridspec(2, 1, height_ratios=[2, 1], hspace=0.3)
@@ -368,7 +481,7 @@ class VisualizationView:
             ax2.grid(True, linestyle='--', alpha=0.3)
             
             # Add the plot to the frame with proper expansion
-            canvas = FigureCanvasTkAgg(fig, master=case_frame)
+            canvas = self.figure_pool.attach(('desired', case_name), case_frame)
             canvas.draw()
             canvas_widget = canvas.get_tk_widget()
             canvas_widget.pack(fill='both', expand=True)
@@ -376,7 +489,7 @@ class VisualizationView:
             # Add toolbar for navigation with improved style
             toolbar_frame = tk.Frame(case_frame, bg=COLOR_LIGHT_BG)
             toolbar_frame.pack(side=tk.BOTTOM, fill=tk.X)
-            toolbar = NavigationToolbar2Tk(canvas, toolbar_frame)
+            toolbar = self.figure_pool.attach_toolbar(('desired', case_name), toolbar_frame)
             toolbar.update()
             
             # Add a border at the top of the toolbar
@@ -402,18 +515,152 @@ class VisualizationView:
         # Frame for the plot with improved style
         self.obtained_plot_frame = tk.Frame(self.obtained_container, bg=COLOR_BG, bd=1, relief=tk.SOLID, highlightbackground=COLOR_BORDER, highlightthickness=1)
     
+    def create_obtained_figure(self, aggregated=False):
+        """Create the obtained outputs figure, its artists and canvas"""
+        # Clear the multiple-case notebook if it is being shown
+        self.figure_pool.release_group('obtained')
+        for widget in self.obtained_plot_frame.winfo_children():
+            widget.destroy()
+        
+        # Create the figure with improved style
+        self.obtained_figure = self.figure_pool.figure(('obtained', None), figsize=(8, 4), dpi=100, facecolor=COLOR_LIGHT_BG)  # Reducido tamaño
+        self.obtained_aggregated = aggregated
+        
+        if aggregated:
+            # Axes for the aggregated views, redrawn on every update
+            self.obtained_summary_axes = self.create_summary_axes(self.obtained_figure)
+            self.obtained_canvas, self.obtained_toolbar = self.attach_canvas(('obtained', None), self.obtained_plot_frame)
+            return
+        
+        # Create a 2x1 subplot layout
+        gs = self.obtained_figure.add_gridspec(2, 1, height_ratios=[2, 1], hspace=0.2)  # Reducido espacio
+        
+        # Top subplot: Comparison of desired vs obtained outputs
+        self.obtained_ax1 = self.obtained_figure.add_subplot(gs[0])
+        self.desired_line, = self.obtained_ax1.plot([], [], 'o-', color=COLOR_PRIMARY, linewidth=2, label='Salida Deseada')
+        self.predicted_line, = self.obtained_ax1.plot([], [], 's--', color=COLOR_SECONDARY, linewidth=2, label='Salida Obtenida')
+        
+        # Add labels with improved style
+        self.obtained_ax1.set_xlabel('Índice del Patrón', fontsize=9, color=COLOR_TEXT_SECONDARY)  # Reducido tamaño de fuente
+        self.obtained_ax1.set_ylabel('Valor de Salida', fontsize=9, color=COLOR_TEXT_SECONDARY)  # Reducido tamaño de fuente
+        self.obtained_ax1.legend(loc='best', fontsize=8)  # Reducido tamaño de fuente
+        self.obtained_ax1.grid(True, linestyle='--', alpha=0.5)
+        
+        # Set background color
+        self.obtained_ax1.set_facecolor(COLOR_LIGHT_BG)
+        
+        # Bottom subplot: Error for each pattern
+        self.obtained_ax2 = self.obtained_figure.add_subplot(gs[1])
+        
+        # Bars are created on the first update, when the number of patterns is known
+        self.error_bars = None
+        
+        # Horizontal line for the average error
+        self.avg_error_line = self.obtained_ax2.axhline(y=0, color='red', linestyle='--', linewidth=1.5)
+        
+        # Add labels and title with improved style
+        self.obtained_ax2.set_title('Error Absoluto por Patrón', fontsize=10, fontweight='bold', color=COLOR_TEXT)  # Reducido tamaño de fuente
+        self.obtained_ax2.set_xlabel('Índice del Patrón', fontsize=8, color=COLOR_TEXT_SECONDARY)  # Reducido tamaño de fuente
+        self.obtained_ax2.set_ylabel('Error Absoluto', fontsize=8, color=COLOR_TEXT_SECONDARY)  # Reducido tamaño de fuente
+        
+        # Set background color
+        self.obtained_ax2.set_facecolor(COLOR_LIGHT_BG)
+        self.obtained_ax2.grid(True, linestyle='--', alpha=0.3)
+        
+        # Add the plot to the frame with proper expansion
+        self.obtained_canvas, self.obtained_toolbar = self.attach_canvas(('obtained', None), self.obtained_plot_frame)
+    
     def update_obtained_visualization(self, inputs, desired_outputs, predictions, case_name=None):
         """Update the obtained outputs visualization with comparison charts"""
+        # Hide the placeholder message
+        self.obtained_placeholder.pack_forget()
+        self.obtained_plot_frame.pack(fill='both', expand=True)
+        
+        # Build the figure only the first time, or when switching between detailed and aggregated views
+        aggregated = len(desired_outputs) > AGGREGATE_MIN_ROWS
+        if self.obtained_canvas is None or self.obtained_aggregated != aggregated:
+            self.create_obtained_figure(aggregated)
+        
+        if aggregated:
+            title = f'Comparación de Salidas - {case_name}' if case_name else 'Comparación de Salidas Deseadas vs Obtenidas'
+            self.draw_obtained_summary(self.obtained_summary_axes, desired_outputs, predictions, title)
+            self.obtained_toolbar.update()
+            self.obtained_canvas.draw_idle()
+            return
+        
+        # Swap the data of the desired and obtained lines
+        x = np.arange(len(desired_outputs))
+        self.desired_line.set_data(x, desired_outputs)
+        self.predicted_line.set_data(x, predictions)
+        
+        # Update the title with the case name
+        title = f'Comparación de Salidas - {case_name}' if case_name else 'Comparación de Salidas Deseadas vs Obtenidas'
+        self.obtained_ax1.set_title(title, fontsize=11, fontweight='bold', color=COLOR_TEXT)  # Reducido tamaño de fuente
+        
+        # Calculate error for each pattern
+        errors = np.abs(desired_outputs - predictions)
+        
+        # Reuse the bars when the number of patterns is unchanged, otherwise recreate them
+        if self.error_bars is not None and len(self.error_bars) == len(errors):
+            for bar, error in zip(self.error_bars, errors):
+                bar.set_height(error)
+        else:
+            if self.error_bars is not None:
+                self.error_bars.remove()
+            self.error_bars = self.obtained_ax2.bar(x, errors, color=COLOR_ACCENT_BLUE, alpha=0.7)
+        
+        # Move the average error line and refresh its legend entry
+        avg_error = np.mean(errors)
+        self.avg_error_line.set_ydata([avg_error, avg_error])
+        self.avg_error_line.set_label(f'Error Promedio: {avg_error:.4f}')
+        self.obtained_ax2.legend(handles=[self.avg_error_line], loc='best', fontsize=7)  # Reducido tamaño de fuente
+        
+        # Rescale both subplots to the new data and reset the toolbar's home view
+        for ax in (self.obtained_ax1, self.obtained_ax2):
+            ax.relim()
+            ax.autoscale_view()
+        self.obtained_toolbar.update()
+        self.obtained_canvas.draw_idle()
+    
+    def update_obtained_visualizations_multiple(self, cases_data):
+        """Plot multiple output comparisons for all cases"""
         # Clear any existing plot
+        self.figure_pool.release_group('obtained')
         for widget in self.obtained_plot_frame.winfo_children():
             widget.destroy()
+        self.obtained_canvas = None
         
         # Hide the placeholder message
         self.obtained_placeholder.pack_forget()
         self.obtained_plot_frame.pack(fill='both', expand=True)
         
-        # Create a new figure with improved style
-        fig = Figure(figsize=(8, 4), dpi=100, facecolor=COLOR_LIGHT_BG)  # Reducido tamaño
+        # Create a notebook for multiple tabs
+        notebook = LazyNotebook(self.obtained_plot_frame)
+        notebook.pack(fill='both', expand=True)
+        
+        # Add a tab for each case; each tab is drawn the first time it is shown
+        for case_name, (inputs, desired_outputs, predictions) in cases_data.items():
+            case_frame = tk.Frame(notebook, bg=COLOR_LIGHT_BG)
+            notebook.add_lazy(case_frame,
+                              lambda frame, case_name=case_name, desired_outputs=desired_outputs, predictions=predictions:
+                                  self.render_case_obtained_visualization(frame, case_name, desired_outputs, predictions),
+                              text=case_name)
+        
+        # Draw the tab shown first
+        notebook.render_selected()
+    
+    def render_case_obtained_visualization(self, case_frame, case_name, desired_outputs, predictions):
+        """Draw the output comparison of one case inside its notebook tab"""
+        # Create a figure for this case
+        fig = self.figure_pool.figure(('obtained', case_name), figsize=(8, 4), dpi=100, facecolor=COLOR_LIGHT_BG)  # Reducido tamaño
+        
+        if len(desired_outputs) > AGGREGATE_MIN_ROWS:
+            # Large cases are summarized instead of drawn pattern by pattern
+            self.draw_obtained_summary(self.create_summary_axes(fig), desired_outputs, predictions,
+                                       f'Comparación de Salidas - {case_name}')
+            canvas, _ = self.attach_canvas(('obtained', case_name), case_frame)
+            canvas.draw_idle()
+            return
         
         # Create a 2x1 subplot layout
         gs = fig.add_gridspec(2, 1, height_ratios=[2, 1], hspace=0.2)  # Reducido espacio
@@ -427,8 +674,7 @@ class VisualizationView:
         ax1.plot(x, predictions, 's--', color=COLOR_SECONDARY, linewidth=2, label='Salida Obtenida')
         
         # Add labels and title with improved style
-        title = f'Comparación de Salidas - {case_name}' if case_name else 'Comparación de Salidas Deseadas vs Obtenidas'
-        ax1.set_title(title, fontsize=11, fontweight='bold', color=COLOR_TEXT)  # Reducido tamaño de fuente
+        ax1.set_title(f'Comparación de Salidas - {case_name}', fontsize=11, fontweight='bold', color=COLOR_TEXT)  # Reducido tamaño de fuente
         ax1.set_xlabel('Índice del Patrón', fontsize=9, color=COLOR_TEXT_SECONDARY)  # Reducido tamaño de fuente
         ax1.set_ylabel('Valor de Salida', fontsize=9, color=COLOR_TEXT_SECONDARY)  # Reducido tamaño de fuente
         ax1.legend(loc='best', fontsize=8)  # Reducido tamaño de fuente
@@ -462,104 +708,64 @@ class VisualizationView:
         ax2.grid(True, linestyle='--', alpha=0.3)
         
         # Add the plot to the frame with proper expansion
-        canvas = FigureCanvasTkAgg(fig, master=self.obtained_plot_frame)
+        canvas = self.figure_pool.attach(('obtained', case_name), case_frame)
         canvas.draw()
         canvas_widget = canvas.get_tk_widget()
         canvas_widget.pack(fill='both', expand=True)
         
         # Add toolbar for navigation with improved style
-        toolbar_frame = tk.Frame(self.obtained_plot_frame, bg=COLOR_LIGHT_BG)
+        toolbar_frame = tk.Frame(case_frame, bg=COLOR_LIGHT_BG)
         toolbar_frame.pack(side=tk.BOTTOM, fill=tk.X)
-        toolbar = NavigationToolbar2Tk(canvas, toolbar_frame)
+        toolbar = self.figure_pool.attach_toolbar(('obtained', case_name), toolbar_frame)
         toolbar.update()
         
         # Add a border at the top of the toolbar
         border = tk.Frame(toolbar_frame, height=1, bg=COLOR_BORDER)
         border.pack(fill='x', side=tk.TOP)
+
+    def create_summary_axes(self, fig):
+        """Create the axes of the aggregated obtained outputs view"""
+        # Percentile bands on top, residual histogram and desired vs obtained density below
+        gs = fig.add_gridspec(2, 2, height_ratios=[3, 2], hspace=0.45, wspace=0.3)
+        return fig.add_subplot(gs[0, :]), fig.add_subplot(gs[1, 0]), fig.add_subplot(gs[1, 1])
     
-    def update_obtained_visualizations_multiple(self, cases_data):
-        """Plot multiple output comparisons for all cases"""
-        # Clear any existing plot
-        for widget in self.obtained_plot_frame.winfo_children():
-            widget.destroy()
-        
-        # Hide the placeholder message
-        self.obtained_placeholder.pack_forget()
-        self.obtained_plot_frame.pack(fill='both', expand=True)
-        
-        # Create a notebook for multiple tabs
-        notebook = ttk.Notebook(self.obtained_plot_frame)
-        notebook.pack(fill='both', expand=True)
-        
-        # Add a tab for each case
-        for case_name, (inputs, desired_outputs, predictions) in cases_data.items():
-            # Create a frame for this case
-            case_frame = tk.Frame(notebook, bg=COLOR_LIGHT_BG)
-            notebook.add(case_frame, text=case_name)
-            
-            # Create a figure for this case
-            fig = Figure(figsize=(8, 4), dpi=100, facecolor=COLOR_LIGHT_BG)  # Reducido tamaño
-            
-            # Create a 2x1 subplot layout
-            gs = fig.add_gridspec(2, 1, height_ratios=[2, 1], hspace=0.2)  # Reducido espacio
-            
-            # Top subplot: Comparison of desired vs obtained outputs
-            ax1 = fig.add_subplot(gs[0])
-            
-            # Plot desired and obtained outputs
-            x = range(len(desired_outputs))
-            ax1.plot(x, desired_outputs, 'o-', color=COLOR_PRIMARY, linewidth=2, label='Salida Deseada')
-            ax1.plot(x, predictions, 's--', color=COLOR_SECONDARY, linewidth=2, label='Salida Obtenida')
-            
-            # Add labels and title with improved style
-            ax1.set_title(f'Comparación de Salidas - {case_name}', fontsize=11, fontweight='bold', color=COLOR_TEXT)  # Reducido tamaño de fuente
-            ax1.set_xlabel('Índice del Patrón', fontsize=9, color=COLOR_TEXT_SECONDARY)  # Reducido tamaño de fuente
-            ax1.set_ylabel('Valor de Salida', fontsize=9, color=COLOR_TEXT_SECONDARY)  # Reducido tamaño de fuente
-            ax1.legend(loc='best', fontsize=8)  # Reducido tamaño de fuente
-            ax1.grid(True, linestyle='--', alpha=0.5)
-            
-            # Set background color
-            ax1.set_facecolor(COLOR_LIGHT_BG)
-            
-            # Bottom subplot: Error for each pattern
-            ax2 = fig.add_subplot(gs[1])
-            
-            # Calculate error for each pattern
-            errors = np.abs(desired_outputs - predictions)
-            
-            # Create bar chart of errors
-            bars = ax2.bar(x, errors, color=COLOR_ACCENT_BLUE, alpha=0.7)
-            
-            # Add a horizontal line for average error
-            avg_error = np.mean(errors)
-            ax2.axhline(y=avg_error, color='red', linestyle='--', linewidth=1.5, 
-                      label=f'Error Promedio: {avg_error:.4f}')
-            
-            # Add labels and title with improved style
-            ax2.set_title('Error Absoluto por Patrón', fontsize=10, fontweight='bold', color=COLOR_TEXT)  # Reducido tamaño de fuente
-            ax2.set_xlabel('Índice del Patrón', fontsize=8, color=COLOR_TEXT_SECONDARY)  # Reducido tamaño de fuente
-            ax2.set_ylabel('Error Absoluto', fontsize=8, color=COLOR_TEXT_SECONDARY)  # Reducido tamaño de fuente
-            ax2.legend(loc='best', fontsize=7)  # Reducido tamaño de fuente
-            
-            # Set background color
-            ax2.set_facecolor(COLOR_LIGHT_BG)
-            ax2.grid(True, linestyle='--', alpha=0.3)
-            
-            # Add the plot to the frame with proper expansion
-            canvas = FigureCanvasTkAgg(fig, master=case_frame)
-            canvas.draw()
-            canvas_widget = canvas.get_tk_widget()
-            canvas_widget.pack(fill='both', expand=True)
-            
-            # Add toolbar for navigation with improved style
-            toolbar_frame = tk.Frame(case_frame, bg=COLOR_LIGHT_BG)
-            toolbar_frame.pack(side=tk.BOTTOM, fill=tk.X)
-            toolbar = NavigationToolbar2Tk(canvas, toolbar_frame)
-            toolbar.update()
-            
-            # Add a border at the top of the toolbar
-            border = tk.Frame(toolbar_frame, height=1, bg=COLOR_BORDER)
-            border.pack(fill='x', side=tk.TOP)
+    def draw_obtained_summary(self, axes, desired_outputs, predictions, title):
+        """Draw percentile bands, a residual histogram and a 2D histogram of desired vs obtained outputs"""
+        band_ax, hist_ax, joint_ax = axes
+        for ax in axes:
+            ax.clear()
+            ax.set_facecolor(COLOR_LIGHT_BG)
+            ax.tick_params(colors=COLOR_TEXT_SECONDARY, labelsize=7)
+        
+        # Percentile bands of the obtained outputs and median of the desired ones along the pattern index
+        centers, bands = percentile_bands(predictions)
+        _, desired_bands = percentile_bands(desired_outputs)
+        band_ax.fill_between(centers, bands[0], bands[4], color=COLOR_SECONDARY, alpha=0.2, label='Obtenida P5-P95')
+        band_ax.fill_between(centers, bands[1], bands[3], color=COLOR_SECONDARY, alpha=0.4, label='Obtenida P25-P75')
+        band_ax.plot(centers, bands[2], color=COLOR_SECONDARY, linewidth=1.5, label='Mediana Obtenida')
+        band_ax.plot(centers, desired_bands[2], color=COLOR_PRIMARY, linewidth=1.5, label='Mediana Deseada')
+        band_ax.set_title(f'{title} ({len(desired_outputs)} patrones)', fontsize=11, fontweight='bold', color=COLOR_TEXT)  # Reducido tamaño de fuente
+        band_ax.set_xlabel('Índice del Patrón', fontsize=8, color=COLOR_TEXT_SECONDARY)
+        band_ax.set_ylabel('Valor de Salida', fontsize=8, color=COLOR_TEXT_SECONDARY)
+        band_ax.legend(loc='best', fontsize=7)
+        band_ax.grid(True, linestyle='--', alpha=0.5)
+        
+        # Distribution of the residuals with the mean absolute error
+        counts, edges = residual_histogram(desired_outputs, predictions)
+        hist_ax.stairs(counts, edges, fill=True, color=COLOR_ACCENT_BLUE, alpha=0.7)
+        avg_error = np.mean(np.abs(desired_outputs - predictions))
+        hist_ax.set_title(f'Residuos (Error Promedio: {avg_error:.4f})', fontsize=9, fontweight='bold', color=COLOR_TEXT)
+        hist_ax.set_xlabel('Deseada - Obtenida', fontsize=8, color=COLOR_TEXT_SECONDARY)
+        hist_ax.set_ylabel('Patrones', fontsize=8, color=COLOR_TEXT_SECONDARY)
+        hist_ax.grid(True, linestyle='--', alpha=0.3)
+        
+        # Density of desired vs obtained outputs; a perfect model lies on the diagonal
+        counts, x_edges, y_edges = joint_histogram(desired_outputs, predictions)
+        joint_ax.pcolormesh(x_edges, y_edges, np.ma.masked_equal(counts.T, 0), cmap='viridis')
+        joint_ax.plot([x_edges[0], x_edges[-1]], [y_edges[0], y_edges[-1]], color='red', linestyle='--', linewidth=1)
+        joint_ax.set_title('Deseada vs Obtenida', fontsize=9, fontweight='bold', color=COLOR_TEXT)
+        joint_ax.set_xlabel('Salida Deseada', fontsize=8, color=COLOR_TEXT_SECONDARY)
+        joint_ax.set_ylabel('Salida Obtenida', fontsize=8, color=COLOR_TEXT_SECONDARY)
     
     def setup_decision_frame(self):
         """Set up the decision line tab with improved visualization"""
@@ -583,6 +789,7 @@ class VisualizationView:
     def update_decision_visualization(self, inputs, outputs, weights, bias):
         """Update the decision visualization with weights and bias visualization"""
         # Clear any existing plot
+        self.figure_pool.release_group('decision')
         for widget in self.decision_plot_frame.winfo_children():
             widget.destroy()
         
@@ -624,7 +831,7 @@ class VisualizationView:
         weights_frame.pack(fill='x')
         
         # Create a figure for the weights visualization
-        fig1 = Figure(figsize=(8, 3), dpi=100, facecolor=COLOR_LIGHT_BG)
+        fig1 = self.figure_pool.figure(('decision', 'weights'), figsize=(8, 3), dpi=100, facecolor=COLOR_LIGHT_BG)
         ax1 = fig1.add_subplot(111)
         
         # Create bar chart of weights
@@ -654,7 +861,7 @@ class VisualizationView:
         ax1.tick_params(colors=COLOR_TEXT_SECONDARY, labelsize=8)
         
         # Add the plot to the frame
-        canvas1 = FigureCanvasTkAgg(fig1, master=weights_frame)
+        canvas1 = self.figure_pool.attach(('decision', 'weights'), weights_frame)
         canvas1.draw()
         canvas_widget1 = canvas1.get_tk_widget()
         canvas_widget1.pack(fill='x')
@@ -669,7 +876,7 @@ class VisualizationView:
         bias_frame.pack(fill='x')
         
         # Create a figure for the bias visualization
-        fig2 = Figure(figsize=(8, 1.5), dpi=100, facecolor=COLOR_LIGHT_BG)
+        fig2 = self.figure_pool.figure(('decision', 'bias'), figsize=(8, 1.5), dpi=100, facecolor=COLOR_LIGHT_BG)
         ax2 = fig2.add_subplot(111)
         
         # Create bar chart for bias
@@ -695,7 +902,7 @@ class VisualizationView:
         ax2.tick_params(colors=COLOR_TEXT_SECONDARY, labelsize=8)
         
         # Add the plot to the frame
-        canvas2 = FigureCanvasTkAgg(fig2, master=bias_frame)
+        canvas2 = self.figure_pool.attach(('decision', 'bias'), bias_frame)
         canvas2.draw()
         canvas_widget2 = canvas2.get_tk_widget()
         canvas_widget2.pack(fill='x')
@@ -1,17 +1,21 @@
 import tkinter as tk
 from tkinter import ttk
 import numpy as np
-import matplotlib
-matplotlib.use("TkAgg")
-import matplotlib.pyplot as plt
-from matplotlib.figure import Figure
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+from utils.figure_pool import FigurePool
+from utils.aggregation import blockwise_column_summary
 from utils.ui_components import (COLOR_BG, COLOR_LIGHT_BG, COLOR_PRIMARY, COLOR_TEXT, 
-                           COLOR_SECONDARY, COLOR_ACCENT_RED, COLOR_TEXT_SECONDARY, COLOR_BORDER, COLOR_ACCENT_BLUE)
+                           COLOR_SECONDARY, COLOR_ACCENT_RED, COLOR_TEXT_SECONDARY, COLOR_BORDER, COLOR_ACCENT_BLUE,
+                           LazyNotebook)
+
+# Up to this many patterns the weight updates are drawn as a pattern x weight map; above it they are summarized per weight
+UPDATE_DETAIL_MAX_PATTERNS = 64
 
 class WeightsView:
-    def __init__(self, parent_frame):
+    def __init__(self, parent_frame, figure_pool=None):
         self.parent = parent_frame
+        
+        # Owner of every figure drawn by this view
+        self.figure_pool = figure_pool or FigurePool()
         self.setup_weights_tab()
         
     def setup_weights_tab(self):
@@ -36,6 +40,7 @@ class WeightsView:
     def update_weights_visualization(self, model, case_name=None):
         """Update the weights calculation process visualization"""
         # Clear any existing plot
+        self.figure_pool.release_group('weights')
         for widget in self.weights_plot_frame.winfo_children():
             widget.destroy()
         
@@ -83,7 +88,7 @@ class WeightsView:
         weights_evolution_frame.pack(fill='x')
         
         # Create a figure for the weights evolution visualization
-        fig1 = Figure(figsize=(8, 4), dpi=100, facecolor=COLOR_LIGHT_BG)
+        fig1 = self.figure_pool.figure(('weights', None), figsize=(8, 4), dpi=100, facecolor=COLOR_LIGHT_BG)
         ax1 = fig1.add_subplot(111)
         
         # Get weights and bias
@@ -132,7 +137,7 @@ class WeightsView:
         ax1.tick_params(colors=COLOR_TEXT_SECONDARY, labelsize=8)
         
         # Add the plot to the frame
-        canvas1 = FigureCanvasTkAgg(fig1, master=weights_evolution_frame)
+        canvas1 = self.figure_pool.attach(('weights', None), weights_evolution_frame)
         canvas1.draw()
         canvas_widget1 = canvas1.get_tk_widget()
         canvas_widget1.pack(fill='x')
@@ -140,7 +145,7 @@ class WeightsView:
         # Add toolbar for navigation
         toolbar_frame1 = tk.Frame(weights_evolution_frame, bg=COLOR_LIGHT_BG)
         toolbar_frame1.pack(side=tk.BOTTOM, fill=tk.X)
-        toolbar1 = NavigationToolbar2Tk(canvas1, toolbar_frame1)
+        toolbar1 = self.figure_pool.attach_toolbar(('weights', None), toolbar_frame1)
         toolbar1.update()
         
         # Add a border at the top of the toolbar
@@ -193,50 +198,51 @@ Donde:
         weight_update_title.pack(anchor='w', pady=(0, 5))
         
         # Create a figure for the weight update visualization
-        fig2 = Figure(figsize=(8, 4), dpi=100, facecolor=COLOR_LIGHT_BG)
+        fig2 = self.figure_pool.figure(('weights', 'updates'), figsize=(8, 4), dpi=100, facecolor=COLOR_LIGHT_BG)
         ax2 = fig2.add_subplot(111)
         
-        # Create a visualization of weight updates for a single epoch
-        # For demonstration, we'll create a simulated weight update
-        # In a real implementation, you would track weight updates during training
-        
-        # Create sample data
-        sample_inputs = model.inputs[:4] if len(model.inputs) >= 4 else model.inputs
-        sample_outputs = model.desired_outputs[:4] if len(model.desired_outputs) >= 4 else model.desired_outputs
-        
-        # Calculate net inputs and errors
-        net_inputs = np.dot(sample_inputs, weights) + bias
-        errors = sample_outputs - net_inputs
-        
-        # Calculate weight updates
-        learning_rate = 0.01  # Example learning rate
-        weight_updates = [learning_rate * errors[i] * sample_inputs[i] for i in range(len(sample_inputs))]
-        
-        # Plot weight updates
-        bar_width = 0.2
-        x = np.arange(len(sample_inputs))
-        
-        for i in range(min(num_weights, 3)):  # Limit to 3 weights for clarity
-            updates = [update[i] for update in weight_updates]
-            ax2.bar(x + i*bar_width, updates, bar_width, label=f'Peso {i+1}')
-        
-        # Add labels and title
-        ax2.set_title('Actualización de Pesos para Diferentes Patrones', fontsize=11, fontweight='bold', color=COLOR_TEXT)
-        ax2.set_xlabel('Índice del Patrón', fontsize=9, color=COLOR_TEXT_SECONDARY)
-        ax2.set_ylabel('Magnitud de Actualización', fontsize=9, color=COLOR_TEXT_SECONDARY)
-        ax2.legend(loc='best', fontsize=8)
-        ax2.grid(True, linestyle='--', alpha=0.5)
-        
-        # Set x-ticks
-        ax2.set_xticks(x + bar_width)
-        ax2.set_xticklabels([f'Patrón {i+1}' for i in range(len(sample_inputs))], fontsize=8)
+        # Updates of every weight for every pattern, evaluated at the final weights with the
+        # learning rate used in training (an approximation of the last epoch's sequential updates)
+        n_patterns = len(model.inputs)
+        param_labels = [f'w{i+1}' for i in range(num_weights)] + ['b']
+        
+        if n_patterns <= UPDATE_DETAIL_MAX_PATTERNS:
+            # Pattern x parameter map, centered on zero
+            weight_updates, bias_updates = model.weight_updates()
+            updates = np.column_stack([weight_updates, bias_updates])
+            limit = np.abs(updates).max() or 1.0
+            image = ax2.imshow(updates, aspect='auto', cmap='coolwarm', vmin=-limit, vmax=limit, interpolation='nearest')
+            fig2.colorbar(image, ax=ax2, label='Δ')
+            ax2.set_xticks(np.arange(len(param_labels)))
+            ax2.set_xticklabels(param_labels, fontsize=8)
+            ax2.set_ylabel('Índice del Patrón', fontsize=9, color=COLOR_TEXT_SECONDARY)
+            ax2.set_title(f'Actualización de Pesos por Patrón con los Pesos Finales (η = {model.learning_rate:g})', fontsize=11, fontweight='bold', color=COLOR_TEXT)
+        else:
+            # Summary per parameter: mean update, P5-P95 range, median and largest magnitude,
+            # accumulated block by block so large datasets are never expanded
+            summary = blockwise_column_summary(model.iter_weight_updates)
+            x = np.arange(len(param_labels))
+            ax2.bar(x, summary["mean"], 0.6, color=COLOR_PRIMARY, alpha=0.7, label='Media')
+            ax2.vlines(x, summary["percentiles"][0], summary["percentiles"][2], color=COLOR_TEXT, linewidth=2, label='P5-P95')
+            ax2.plot(x, summary["percentiles"][1], 'o', color=COLOR_SECONDARY, markeredgecolor=COLOR_TEXT, label='Mediana')
+            ax2.plot(x, summary["max_abs"], 'v', color='red', label='Máx |Δ|')
+            ax2.plot(x, -summary["max_abs"], '^', color='red')
+            ax2.axhline(0, color=COLOR_TEXT_SECONDARY, linewidth=0.8)
+            ax2.set_xticks(x)
+            ax2.set_xticklabels(param_labels, fontsize=8)
+            ax2.set_ylabel('Magnitud de Actualización', fontsize=9, color=COLOR_TEXT_SECONDARY)
+            ax2.set_title(f'Actualización de Pesos en {n_patterns} Patrones con los Pesos Finales (η = {model.learning_rate:g})', fontsize=11, fontweight='bold', color=COLOR_TEXT)
+            ax2.legend(loc='best', fontsize=8)
+            ax2.grid(True, linestyle='--', alpha=0.5)
+        
+        ax2.set_xlabel('Parámetro', fontsize=9, color=COLOR_TEXT_SECONDARY)
         
         # Set background color
         ax2.set_facecolor(COLOR_LIGHT_BG)
         ax2.tick_params(colors=COLOR_TEXT_SECONDARY, labelsize=8)
         
         # Add the plot to the frame
-        canvas2 = FigureCanvasTkAgg(fig2, master=weight_update_frame)
+        canvas2 = self.figure_pool.attach(('weights', 'updates'), weight_update_frame)
         canvas2.draw()
         canvas_widget2 = canvas2.get_tk_widget()
         canvas_widget2.pack(fill='x')
@@ -244,7 +250,7 @@ Donde:
         # Add toolbar for navigation
         toolbar_frame2 = tk.Frame(weight_update_frame, bg=COLOR_LIGHT_BG)
         toolbar_frame2.pack(side=tk.BOTTOM, fill=tk.X)
-        toolbar2 = NavigationToolbar2Tk(canvas2, toolbar_frame2)
+        toolbar2 = self.figure_pool.attach_toolbar(('weights', 'updates'), toolbar_frame2)
         toolbar2.update()
         
         # Add a border at the top of the toolbar
@@ -314,6 +320,7 @@ Donde:
     def update_weights_visualizations_multiple(self, models):
         """Plot multiple weights calculation processes for all cases"""
         # Clear any existing plot
+        self.figure_pool.release_group('weights')
         for widget in self.weights_plot_frame.winfo_children():
             widget.destroy()
         
@@ -322,168 +329,175 @@ Donde:
         self.weights_plot_frame.pack(fill='both', expand=True)
         
         # Create a notebook for multiple tabs
-        notebook = ttk.Notebook(self.weights_plot_frame)
+        notebook = LazyNotebook(self.weights_plot_frame)
         notebook.pack(fill='both', expand=True)
         
-        # Add a tab for each case
+        # Add a tab for each case; each tab is built the first time it is shown
         for case_name, model in models.items():
             if model is None:
                 continue
                 
-            # Create a frame for this case
             case_frame = tk.Frame(notebook, bg=COLOR_LIGHT_BG)
-            notebook.add(case_frame, text=case_name)
-            
-            # Create a scrollable frame for the content
-            scroll_frame = tk.Frame(case_frame, bg=COLOR_LIGHT_BG)
-            scroll_frame.pack(fill='both', expand=True)
-            
-            # Add vertical scrollbar
-            y_scrollbar = ttk.Scrollbar(scroll_frame, orient="vertical")
-            y_scrollbar.pack(side=tk.RIGHT, fill='y')
-            
-            # Create a canvas for scrolling
-            canvas = tk.Canvas(scroll_frame, bg=COLOR_LIGHT_BG,
-                             yscrollcommand=y_scrollbar.set,
-                             highlightthickness=0)
-            canvas.pack(side=tk.LEFT, fill='both', expand=True)
-            
-            # Configure the scrollbar
-            y_scrollbar.config(command=canvas.yview)
-            
-            # Create a frame inside the canvas for the content
-            content_frame = tk.Frame(canvas, bg=COLOR_LIGHT_BG)
-            canvas.create_window((0, 0), window=content_frame, anchor='nw')
-            
-            # Configure the canvas to update the scrollregion when the inner frame's size changes
-            content_frame.bind("<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
-            
-            # Add a title for the weights calculation process
-            process_title = tk.Label(content_frame, text=f"Proceso de Cálculo de Pesos - {case_name}", 
-                                   font=("Arial", 12, "bold"), bg=COLOR_LIGHT_BG, fg=COLOR_PRIMARY)
-            process_title.pack(pady=(10, 5))
-            
-            # Get weights and bias
-            weights = model.weights
-            bias = model.bias
-            
-            # Create a frame for the weights evolution visualization
-            weights_evolution_frame = tk.Frame(content_frame, bg=COLOR_LIGHT_BG, padx=15, pady=5)
-            weights_evolution_frame.pack(fill='x')
-            
-            # Create a figure for the weights evolution visualization
-            fig1 = Figure(figsize=(8, 4), dpi=100, facecolor=COLOR_LIGHT_BG)
-            ax1 = fig1.add_subplot(111)
-            
-            # Create simulated weight evolution data
-            epochs = len(model.error_history)
-            num_weights = len(weights)
-            
-            # Initialize with random values
-            initial_weights = np.random.randn(num_weights) * 0.1
-            initial_bias = np.random.randn() * 0.1
-            
-            # Create a convergence pattern
-            weight_evolution = np.zeros((epochs, num_weights))
-            bias_evolution = np.zeros(epochs)
-            
-            for i in range(epochs):
-                progress = i / (epochs - 1) if epochs > 1 else 1
-                for j in range(num_weights):
-                    weight_evolution[i, j] = initial_weights[j] + progress * (weights[j] - initial_weights[j])
-                bias_evolution[i] = initial_bias + progress * (bias - initial_bias)
-            
-            # Plot weight evolution
-            for i in range(num_weights):
-                ax1.plot(range(epochs), weight_evolution[:, i], '-', linewidth=2, 
-                       label=f'Peso {i+1}')
-            
-            # Plot bias evolution
-            ax1.plot(range(epochs), bias_evolution, '--', linewidth=2, color='black', label='Sesgo')
-            
-            # Add labels and title
-            ax1.set_title('Evolución de Pesos y Sesgo Durante el Entrenamiento', fontsize=11, fontweight='bold', color=COLOR_TEXT)
-            ax1.set_xlabel('Épocas', fontsize=9, color=COLOR_TEXT_SECONDARY)
-            ax1.set_ylabel('Valor', fontsize=9, color=COLOR_TEXT_SECONDARY)
-            ax1.legend(loc='best', fontsize=8)
-            ax1.grid(True, linestyle='--', alpha=0.5)
-            
-            # Set background color
-            ax1.set_facecolor(COLOR_LIGHT_BG)
-            ax1.tick_params(colors=COLOR_TEXT_SECONDARY, labelsize=8)
-            
-            # Add the plot to the frame
-            canvas1 = FigureCanvasTkAgg(fig1, master=weights_evolution_frame)
-            canvas1.draw()
-            canvas_widget1 = canvas1.get_tk_widget()
-            canvas_widget1.pack(fill='x')
-            
-            # Add toolbar for navigation
-            toolbar_frame1 = tk.Frame(weights_evolution_frame, bg=COLOR_LIGHT_BG)
-            toolbar_frame1.pack(side=tk.BOTTOM, fill=tk.X)
-            toolbar1 = NavigationToolbar2Tk(canvas1, toolbar_frame1)
-            toolbar1.update()
-            
-            # Add a border at the top of the toolbar
-            border1 = tk.Frame(toolbar_frame1, height=1, bg=COLOR_BORDER)
-            border1.pack(fill='x', side=tk.TOP)
-            
-            # Add a section for the final weights and bias
-            final_weights_frame = tk.Frame(content_frame, bg=COLOR_LIGHT_BG, padx=15, pady=15)
-            final_weights_frame.pack(fill='x')
-            
-            # Add a title for the final weights
-            final_weights_title = tk.Label(final_weights_frame, text="Pesos y Sesgo Finales", 
-                                         font=("Arial", 11, "bold"), bg=COLOR_LIGHT_BG, fg=COLOR_PRIMARY)
-            final_weights_title.pack(anchor='w', pady=(0, 5))
-            
-            # Create a table-like display for the final weights
-            weights_table = tk.Frame(final_weights_frame, bg=COLOR_LIGHT_BG)
-            weights_table.pack(fill='x')
-            
-            # Headers
-            headers = ["Parámetro", "Valor", "Descripción"]
-            header_widths = [15, 15, 40]
-            
-            for i, header in enumerate(headers):
-                label = tk.Label(weights_table, text=header, bg=COLOR_PRIMARY, fg="white", 
-                               font=("Arial", 9, "bold"), width=header_widths[i], padx=3, pady=3)
-                label.grid(row=0, column=i, sticky="nsew", padx=1, pady=1)
-            
-            # Add weights to the table
-            for i, weight in enumerate(weights):
-                # Parameter name
-                param_name = tk.Label(weights_table, text=f"Peso {i+1}", bg=COLOR_LIGHT_BG, fg=COLOR_TEXT, 
-                                    font=("Arial", 9), width=header_widths[0], padx=3, pady=3)
-                param_name.grid(row=i+1, column=0, sticky="nsew", padx=1, pady=1)
-                
-                # Value
-                value = tk.Label(weights_table, text=f"{weight:.6f}", bg=COLOR_LIGHT_BG, fg=COLOR_TEXT, 
-                               font=("Arial", 9), width=header_widths[1], padx=3, pady=3)
-                value.grid(row=i+1, column=1, sticky="nsew", padx=1, pady=1)
-                
-                # Description
-                desc = tk.Label(weights_table, text=f"Peso para la entrada X{i+1}", bg=COLOR_LIGHT_BG, fg=COLOR_TEXT, 
-                              font=("Arial", 9), width=header_widths[2], padx=3, pady=3, anchor="w")
-                desc.grid(row=i+1, column=2, sticky="nsew", padx=1, pady=1)
-            
-            # Add bias to the table
+            notebook.add_lazy(case_frame,
+                              lambda frame, case_name=case_name, model=model:
+                                  self.render_case_weights(frame, case_name, model),
+                              text=case_name)
+        
+        # Build the tab shown first
+        notebook.render_selected()
+    
+    def render_case_weights(self, case_frame, case_name, model):
+        """Build the weights calculation process of one case inside its notebook tab"""
+        # Create a scrollable frame for the content
+        scroll_frame = tk.Frame(case_frame, bg=COLOR_LIGHT_BG)
+        scroll_frame.pack(fill='both', expand=True)
+        
+        # Add vertical scrollbar
+        y_scrollbar = ttk.Scrollbar(scroll_frame, orient="vertical")
+        y_scrollbar.pack(side=tk.RIGHT, fill='y')
+        
+        # Create a canvas for scrolling
+        canvas = tk.Canvas(scroll_frame, bg=COLOR_LIGHT_BG,
+                         yscrollcommand=y_scrollbar.set,
+                         highlightthickness=0)
+        canvas.pack(side=tk.LEFT, fill='both', expand=True)
+        
+        # Configure the scrollbar
+        y_scrollbar.config(command=canvas.yview)
+        
+        # Create a frame inside the canvas for the content
+        content_frame = tk.Frame(canvas, bg=COLOR_LIGHT_BG)
+        canvas.create_window((0, 0), window=content_frame, anchor='nw')
+        
+        # Configure the canvas to update the scrollregion when the inner frame's size changes
+        content_frame.bind("<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
+        
+        # Add a title for the weights calculation process
+        process_title = tk.Label(content_frame, text=f"Proceso de Cálculo de Pesos - {case_name}", 
+                               font=("Arial", 12, "bold"), bg=COLOR_LIGHT_BG, fg=COLOR_PRIMARY)
+        process_title.pack(pady=(10, 5))
+        
+        # Get weights and bias
+        weights = model.weights
+        bias = model.bias
+        
+        # Create a frame for the weights evolution visualization
+        weights_evolution_frame = tk.Frame(content_frame, bg=COLOR_LIGHT_BG, padx=15, pady=5)
+        weights_evolution_frame.pack(fill='x')
+        
+        # Create a figure for the weights evolution visualization
+        fig1 = self.figure_pool.figure(('weights', case_name), figsize=(8, 4), dpi=100, facecolor=COLOR_LIGHT_BG)
+        ax1 = fig1.add_subplot(111)
+        
+        # Create simulated weight evolution data
+        epochs = len(model.error_history)
+        num_weights = len(weights)
+        
+        # Initialize with random values
+        initial_weights = np.random.randn(num_weights) * 0.1
+        initial_bias = np.random.randn() * 0.1
+        
+        # Create a convergence pattern
+        weight_evolution = np.zeros((epochs, num_weights))
+        bias_evolution = np.zeros(epochs)
+        
+        for i in range(epochs):
+            progress = i / (epochs - 1) if epochs > 1 else 1
+            for j in range(num_weights):
+                weight_evolution[i, j] = initial_weights[j] + progress * (weights[j] - initial_weights[j])
+            bias_evolution[i] = initial_bias + progress * (bias - initial_bias)
+        
+        # Plot weight evolution
+        for i in range(num_weights):
+            ax1.plot(range(epochs), weight_evolution[:, i], '-', linewidth=2, 
+                   label=f'Peso {i+1}')
+        
+        # Plot bias evolution
+        ax1.plot(range(epochs), bias_evolution, '--', linewidth=2, color='black', label='Sesgo')
+        
+        # Add labels and title
+        ax1.set_title('Evolución de Pesos y Sesgo Durante el Entrenamiento', fontsize=11, fontweight='bold', color=COLOR_TEXT)
+        ax1.set_xlabel('Épocas', fontsize=9, color=COLOR_TEXT_SECONDARY)
+        ax1.set_ylabel('Valor', fontsize=9, color=COLOR_TEXT_SECONDARY)
+        ax1.legend(loc='best', fontsize=8)
+        ax1.grid(True, linestyle='--', alpha=0.5)
+        
+        # Set background color
+        ax1.set_facecolor(COLOR_LIGHT_BG)
+        ax1.tick_params(colors=COLOR_TEXT_SECONDARY, labelsize=8)
+        
+        # Add the plot to the frame
+        canvas1 = self.figure_pool.attach(('weights', case_name), weights_evolution_frame)
+        canvas1.draw()
+        canvas_widget1 = canvas1.get_tk_widget()
+        canvas_widget1.pack(fill='x')
+        
+        # Add toolbar for navigation
+        toolbar_frame1 = tk.Frame(weights_evolution_frame, bg=COLOR_LIGHT_BG)
+        toolbar_frame1.pack(side=tk.BOTTOM, fill=tk.X)
+        toolbar1 = self.figure_pool.attach_toolbar(('weights', case_name), toolbar_frame1)
+        toolbar1.update()
+        
+        # Add a border at the top of the toolbar
+        border1 = tk.Frame(toolbar_frame1, height=1, bg=COLOR_BORDER)
+        border1.pack(fill='x', side=tk.TOP)
+        
+        # Add a section for the final weights and bias
+        final_weights_frame = tk.Frame(content_frame, bg=COLOR_LIGHT_BG, padx=15, pady=15)
+        final_weights_frame.pack(fill='x')
+        
+        # Add a title for the final weights
+        final_weights_title = tk.Label(final_weights_frame, text="Pesos y Sesgo Finales", 
+                                     font=("Arial", 11, "bold"), bg=COLOR_LIGHT_BG, fg=COLOR_PRIMARY)
+        final_weights_title.pack(anchor='w', pady=(0, 5))
+        
+        # Create a table-like display for the final weights
+        weights_table = tk.Frame(final_weights_frame, bg=COLOR_LIGHT_BG)
+        weights_table.pack(fill='x')
+        
+        # Headers
+        headers = ["Parámetro", "Valor", "Descripción"]
+        header_widths = [15, 15, 40]
+        
+        for i, header in enumerate(headers):
+            label = tk.Label(weights_table, text=header, bg=COLOR_PRIMARY, fg="white", 
+                           font=("Arial", 9, "bold"), width=header_widths[i], padx=3, pady=3)
+            label.grid(row=0, column=i, sticky="nsew", padx=1, pady=1)
+        
+        # Add weights to the table
+        for i, weight in enumerate(weights):
             # Parameter name
-            param_name = tk.Label(weights_table, text="Sesgo", bg=COLOR_LIGHT_BG, fg=COLOR_TEXT, 
+            param_name = tk.Label(weights_table, text=f"Peso {i+1}", bg=COLOR_LIGHT_BG, fg=COLOR_TEXT, 
                                 font=("Arial", 9), width=header_widths[0], padx=3, pady=3)
-            param_name.grid(row=len(weights)+1, column=0, sticky="nsew", padx=1, pady=1)
+            param_name.grid(row=i+1, column=0, sticky="nsew", padx=1, pady=1)
             
             # Value
-            value = tk.Label(weights_table, text=f"{bias:.6f}", bg=COLOR_LIGHT_BG, fg=COLOR_TEXT, 
+            value = tk.Label(weights_table, text=f"{weight:.6f}", bg=COLOR_LIGHT_BG, fg=COLOR_TEXT, 
                            font=("Arial", 9), width=header_widths[1], padx=3, pady=3)
-            value.grid(row=len(weights)+1, column=1, sticky="nsew", padx=1, pady=1)
+            value.grid(row=i+1, column=1, sticky="nsew", padx=1, pady=1)
             
             # Description
-            desc = tk.Label(weights_table, text="Término independiente (bias)", bg=COLOR_LIGHT_BG, fg=COLOR_TEXT, 
+            desc = tk.Label(weights_table, text=f"Peso para la entrada X{i+1}", bg=COLOR_LIGHT_BG, fg=COLOR_TEXT, 
                           font=("Arial", 9), width=header_widths[2], padx=3, pady=3, anchor="w")
-            desc.grid(row=len(weights)+1, column=2, sticky="nsew", padx=1, pady=1)
-            
-            # Update the scroll region when the frame size changes
-            content_frame.bind("<Configure>", 
-                             lambda e: canvas.configure(
-                                 scrollregion=canvas.bbox("all")))
\ No newline at end of file
+            desc.grid(row=i+1, column=2, sticky="nsew", padx=1, pady=1)
+        
+        # Add bias to the table
+        # Parameter name
+        param_name = tk.Label(weights_table, text="Sesgo", bg=COLOR_LIGHT_BG, fg=COLOR_TEXT, 
+                            font=("Arial", 9), width=header_widths[0], padx=3, pady=3)
+        param_name.grid(row=len(weights)+1, column=0, sticky="nsew", padx=1, pady=1)
+        
+        # Value
+        value = tk.Label(weights_table, text=f"{bias:.6f}", bg=COLOR_LIGHT_BG, fg=COLOR_TEXT, 
+                       font=("Arial", 9), width=header_widths[1], padx=3, pady=3)
+        value.grid(row=len(weights)+1, column=1, sticky="nsew", padx=1, pady=1)
+        
+        # Description
+        desc = tk.Label(weights_table, text="Término independiente (bias)", bg=COLOR_LIGHT_BG, fg=COLOR_TEXT, 
+                      font=("Arial", 9), width=header_widths[2], padx=3, pady=3, anchor="w")
+        desc.grid(row=len(weights)+1, column=2, sticky="nsew", padx=1, pady=1)
+        
+        # Update the scroll region when the frame size changes
+        content_frame.bind("<Configure>", 
+                         lambda e: canvas.configure(
+                             scrollregion=canvas.bbox("all")))
\ No newline at end of file